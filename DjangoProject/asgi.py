@@ -5,6 +5,12 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+Para servir con ASGI (vistas asíncronas del catálogo y de las subidas):
+
+    VISTAS_ASYNC=true gunicorn DjangoProject.asgi:application -k uvicorn.workers.UvicornWorker -w 2
+
+Comparación con los workers sincrónicos: benchmarks/bench_asgi.py
 """
 
 import os
@@ -14,6 +14,7 @@ from datetime import timedelta
 from pathlib import Path
 
 import cloudinary
+from corsheaders.defaults import default_headers
 from decouple import config
 
 
@@ -28,7 +29,8 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = config("SECRET_KEY")
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# Con DEBUG cada consulta SQL queda guardada en connection.queries: en desarrollo usar DEBUG=true en .env
+DEBUG = config("DEBUG", default=False, cast=bool)
 
 ALLOWED_HOSTS = config("DJANGO_ALLOWED_HOSTS", default="*").split(",")
 
@@ -51,6 +53,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'universidad.middleware.CompresionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     "corsheaders.middleware.CorsMiddleware",
     'django.middleware.common.CommonMiddleware',
@@ -87,11 +90,50 @@ WSGI_APPLICATION = 'DjangoProject.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': config("DB_NAME", default=str(BASE_DIR / 'db.sqlite3')),
+        # Segundos que un worker conserva la conexión entre peticiones (gunicorn.conf.py lo ajusta)
+        'CONN_MAX_AGE': config("DB_CONN_MAX_AGE", default=0, cast=int),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 
+# Vistas asíncronas del catálogo y de las subidas (universidad/apis/asincrono.py).
+# Activarlas al servir con ASGI (ver DjangoProject/asgi.py)
+VISTAS_ASYNC = config("VISTAS_ASYNC", default=False, cast=bool)
+
+# Cache compartida: Redis si se define REDIS_URL, si no memoria local del proceso.
+# La memoria local solo sirve con un proceso: las versiones del árbol de cursos
+# y de los permisos y las claves de idempotencia no se verían entre workers
+# (gunicorn.conf.py exige REDIS_URL con más de un worker)
+REDIS_URL = config("REDIS_URL", default="")
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Árbol completo de cursos (universidad.cache.arbol_curso)
+ARBOL_CURSO_CACHE = {
+    'LRU_SIZE': 256,      # cursos por proceso
+    'TIMEOUT': 60 * 60,   # segundos en la cache compartida
+}
+
+# Latidos de progreso de lecciones (universidad.progreso.buffer)
+PROGRESO_BUFFER = {
+    'INTERVALO': 10,         # segundos entre escrituras por lotes
+    'MAX_PENDIENTES': 500,   # escribir antes si se juntan tantas posiciones
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -134,41 +176,176 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'universidad.Alumno'
 
+# ModelBackend con los permisos por grupo en cache (universidad.cache.permisos)
+AUTHENTICATION_BACKENDS = ['universidad.cache.permisos.PermisosCacheadosBackend']
+PERMISOS_CACHE = {
+    'LRU_SIZE': 64,       # conjuntos de grupos por proceso
+    'TIMEOUT': 60 * 60,   # segundos en la cache compartida
+}
+
 # ============================
 #   CLOUDINARY CONFIG
 # ============================
 
-cloudinary.config(
-    cloud_name=config("CLOUDINARY_CLOUD_NAME"),
-    api_key=config("CLOUDINARY_API_KEY"),
-    api_secret=config("CLOUDINARY_API_SECRET")
-)
+# 'cloudinary' (servicio real) o 'local' (disco, para pruebas y benchmarks sin red)
+MEDIA_BACKEND = config("MEDIA_BACKEND", default="cloudinary")
+
+if MEDIA_BACKEND == "local":
+    MEDIA_LOCAL = {
+        'RAIZ': config("MEDIA_LOCAL_RAIZ", default=str(BASE_DIR / 'media_local')),
+        # Latencia artificial para simular el servicio real (segundos)
+        'LATENCIA': config("MEDIA_LOCAL_LATENCIA", default=0.0, cast=float),
+        'LATENCIA_POR_MB': config("MEDIA_LOCAL_LATENCIA_POR_MB", default=0.0, cast=float),
+    }
+    # Las URLs de CloudinaryResource apuntan a /media/local/ de este mismo servidor
+    cloudinary.config(
+        cloud_name="local",
+        api_key="local",
+        api_secret="local",
+        secure=False,
+        private_cdn=True,
+        cname=config("MEDIA_LOCAL_HOST", default="localhost:8000") + "/media/local",
+    )
+    CLOUDINARY_STORAGE = {'CLOUD_NAME': "local", 'API_KEY': "local", 'API_SECRET': "local"}
+else:
+    cloudinary.config(
+        cloud_name=config("CLOUDINARY_CLOUD_NAME"),
+        api_key=config("CLOUDINARY_API_KEY"),
+        api_secret=config("CLOUDINARY_API_SECRET")
+    )
+    CLOUDINARY_STORAGE = {
+        'CLOUD_NAME': config("CLOUDINARY_CLOUD_NAME"),
+        'API_KEY': config("CLOUDINARY_API_KEY"),
+        'API_SECRET': config("CLOUDINARY_API_SECRET"),
+    }
 
 DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
 STATICFILES_STORAGE = 'cloudinary_storage.storage.StaticHashedCloudinaryStorage'
 
-CLOUDINARY_STORAGE = {
-    'CLOUD_NAME': config("CLOUDINARY_CLOUD_NAME"),
-    'API_KEY': config("CLOUDINARY_API_KEY"),
-    'API_SECRET': config("CLOUDINARY_API_SECRET"),
-}
-
 MEDIA_URL = '/media/'
+# Subidas simultáneas a Cloudinary en los endpoints por lotes
+MEDIA_SUBIDAS_CONCURRENTES = config("MEDIA_SUBIDAS_CONCURRENTES", default=4, cast=int)
+# Pool HTTP compartido para las llamadas a Cloudinary (universidad.media.http)
+MEDIA_HTTP = {
+    'MAX_POR_HOST': config("MEDIA_HTTP_MAX_POR_HOST", default=8, cast=int),  # >= subidas concurrentes
+    'TIMEOUT_CONEXION': 5,
+    'TIMEOUT_LECTURA': 120,   # subidas de video grandes
+    'REINTENTOS': 3,
+    'BACKOFF': 0.5,
+}
 #MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
-    "https://acadnur.vercel.app/"
+    "https://acadnur.vercel.app"
 ]
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
+
+# ============================
+#   EVENTOS Y CORREO
+# ============================
+
+# Bandeja de salida (universidad.eventos), procesada con `manage.py procesar_eventos`
+EVENTOS = {
+    'LOTE': 50,
+    'CONCURRENCIA': 4,
+    'LIMITES': {'correo': 2},   # conexiones SMTP simultáneas
+    'MAX_INTENTOS': 5,
+    'BACKOFF': 30,              # segundos; se duplica en cada intento
+    'LEASE': 5 * 60,
+}
+ANALITICA_ARCHIVO = config("ANALITICA_ARCHIVO", default=str(BASE_DIR / 'var' / 'analitica.jsonl'))
+
+# Sin EMAIL_HOST los correos se escriben como archivos en var/correos/
+EMAIL_HOST = config("EMAIL_HOST", default="")
+if EMAIL_HOST:
+    EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+    EMAIL_PORT = config("EMAIL_PORT", default=587, cast=int)
+    EMAIL_HOST_USER = config("EMAIL_HOST_USER", default="")
+    EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD", default="")
+    EMAIL_USE_TLS = config("EMAIL_USE_TLS", default=True, cast=bool)
+    EMAIL_TIMEOUT = 10
+else:
+    EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
+    EMAIL_FILE_PATH = config("EMAIL_FILE_PATH", default=str(BASE_DIR / 'var' / 'correos'))
+DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", default="AcadNur <no-reply@acadnur.local>")
+
+# Cursos relacionados (universidad.recomendaciones), con `manage.py calcular_relacionados`
+RECOMENDACIONES = {
+    'K': 10,
+    'MIN_COMUNES': 2,
+    'INCLUIR_TRIAL': False,
+}
+
+# Ranking del catálogo (?orden=popular|tendencia), ver universidad.ranking
+RANKING = {
+    'VIDA_MEDIA_POPULAR': 90,    # días
+    'VIDA_MEDIA_TENDENCIA': 7,   # días
+    'PESO_TRIAL': 0.5,
+}
+
+# Límite de peticiones (universidad.limites). 'local': una cubeta por worker,
+# sin consultas; 'cache': compartida entre workers en la cache (Redis)
+LIMITES = {
+    'BACKEND': config("LIMITES_BACKEND", default="local"),
+    # alcance → rol → "peticiones/periodo" (None = sin límite); un rol que
+    # falta en un alcance usa la tasa de 'general'
+    'TASAS': {
+        'general': {'anonimo': '120/min', 'Alumno': '600/min', 'Docente': '600/min', 'Administrador': None},
+        'catalogo': {'anonimo': '60/min', 'Alumno': '300/min'},
+        'login': {'anonimo': '10/min'},
+        'registro': {'anonimo': '5/hour'},
+    },
+}
+
+# Idempotency-Key en comprar-varios y auth/register (universidad.apis.idempotencia)
+IDEMPOTENCIA = {
+    'TTL': 24 * 60 * 60,   # segundos que se recuerda una respuesta
+    'ESPERA': 10,          # segundos que espera un reintento concurrente
+    'BLOQUEO': 60,         # vida máxima de la reserva de una clave
+}
+
+# POST /universidad/batch/: varios GET en una petición (universidad.apis.batch_viewset)
+BATCH = {
+    'MAX_PETICIONES': 10,
+    'HILOS': 4,            # hilos con "paralelo": true; cada uno usa su conexión a la BD
+}
 
 
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-    ]
+        'universidad.token.autenticacion.JWTRevocableAuthentication',
+    ],
+    # Cubetas de tokens por rol y endpoint (universidad.limites), con Retry-After
+    'DEFAULT_THROTTLE_CLASSES': ['universidad.limites.CubetaThrottle'],
+    # Proxies de confianza delante de la app: con 0 la IP de un anónimo es
+    # REMOTE_ADDR y un X-Forwarded-For inventado no cambia su cubeta
+    'NUM_PROXIES': config("NUM_PROXIES", default=0, cast=int),
+    'DEFAULT_RENDERER_CLASSES': [
+        'universidad.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    # Compresión de respuestas (universidad.middleware.CompresionMiddleware)
+    'COMPRESSION': {
+        'MIN_SIZE': 1024,
+        'ALGORITHMS': ['br', 'gzip'],
+        'GZIP_LEVEL': 6,
+        'BROTLI_QUALITY': 5,
+    },
 }
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=120),
-    "REFRESH_TOKEN_LIFETIME": timedelta(days=1)
+    "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
+    # Cada refresh se usa una vez; el usado queda revocado (universidad.token.revocacion)
+    "ROTATE_REFRESH_TOKENS": True,
+    "TOKEN_REFRESH_SERIALIZER": "universidad.token.serializers.RotarRefreshSerializer",
+}
+
+# Revocación de JWT en memoria de cada proceso (universidad.token.revocacion)
+REVOCACION_TOKENS = {
+    'INTERVALO': 10,          # segundos entre sincronizaciones con la BD
+    'RECONSTRUIR': 60 * 60,   # segundos entre recargas completas
+    'CAPACIDAD': 10000,       # jti revocados vigentes previstos
+    'ERROR': 0.001,           # falsos positivos del filtro de Bloom (se confirman en la BD)
 }
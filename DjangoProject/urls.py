@@ -17,17 +17,25 @@ Including another URLconf
 from django.conf import settings
 from django.conf.urls.static import static
 # from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from rest_framework_simplejwt.views import TokenRefreshView
 
-from universidad.token.views import EmailTokenObtainPairView
+from universidad.token.views import EmailTokenObtainPairView, RevocarTokenView
 
 urlpatterns = [
     #    path('admin/', admin.site.urls),
 path('api/token/', EmailTokenObtainPairView.as_view(), name='token_obtain_pair'),
  path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('api/token/revocar/', RevocarTokenView.as_view(), name='token_revocar'),
     path('universidad/', include("universidad.urls"))
 
 ]
+if settings.MEDIA_BACKEND == 'local':
+    from universidad.media.views import servir_local
+
+    urlpatterns += [
+        re_path(r'^media/local/(?P<resource_type>image|video|raw)/(?P<tipo>\w+)/(?:v\d+/)?(?P<ruta>.+)$',
+                servir_local),
+    ]
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""Inicialización común de Django para los scripts de benchmarks."""
+import os
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+
+def preparar():
+    if str(RAIZ) not in sys.path:
+        sys.path.insert(0, str(RAIZ))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'DjangoProject.settings')
+    import django
+    django.setup()
+
+
+def cronometrar(funcion, repeticiones):
+    """Ejecuta la función `repeticiones` veces y devuelve el tiempo medio en milisegundos."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) * 1000 / repeticiones
@@ -0,0 +1,112 @@
+"""Utilidades para benchmarks que levantan el proyecto con gunicorn (Linux)."""
+import http.client
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+from _entorno import RAIZ
+
+
+def puerto_libre():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def pedir(puerto, metodo, ruta, cuerpo=None, headers=None):
+    """Hace una petición en una conexión nueva y devuelve el status."""
+    conexion = http.client.HTTPConnection('127.0.0.1', puerto, timeout=60)
+    try:
+        conexion.request(metodo, ruta, body=cuerpo, headers=headers or {})
+        respuesta = conexion.getresponse()
+        respuesta.read()
+        return respuesta.status
+    finally:
+        conexion.close()
+
+
+def hijos(pid):
+    """PIDs de los procesos hijos directos (los workers de un master de gunicorn)."""
+    resultado = []
+    try:
+        for tarea in os.listdir(f'/proc/{pid}/task'):
+            with open(f'/proc/{pid}/task/{tarea}/children') as archivo:
+                resultado.extend(int(h) for h in archivo.read().split())
+    except FileNotFoundError:
+        pass
+    return resultado
+
+
+def memoria_kb(pid):
+    """{'rss', 'pss'} en KB. PSS reparte las páginas compartidas entre los procesos que las usan."""
+    memoria = {'rss': 0, 'pss': 0}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as archivo:
+            for linea in archivo:
+                if linea.startswith('Rss:'):
+                    memoria['rss'] = int(linea.split()[1])
+                elif linea.startswith('Pss:'):
+                    memoria['pss'] = int(linea.split()[1])
+    except FileNotFoundError:
+        pass
+    return memoria
+
+
+def memoria_total_kb(pid):
+    """Memoria del master más la de todos sus descendientes."""
+    total = {'rss': 0, 'pss': 0}
+    pendientes = [pid]
+    while pendientes:
+        actual = pendientes.pop()
+        for clave, valor in memoria_kb(actual).items():
+            total[clave] += valor
+        pendientes.extend(hijos(actual))
+    return total
+
+
+class Servidor:
+    """``gunicorn`` en un puerto libre, con la salida en ``log``. Usar como context manager."""
+
+    def __init__(self, argumentos, env, log, ruta_prueba='/universidad/areas/'):
+        self.puerto = puerto_libre()
+        self.argumentos = [*argumentos, '-b', f'127.0.0.1:{self.puerto}']
+        self.env = env
+        self.log = log
+        self.ruta_prueba = ruta_prueba
+        self.proceso = None
+        self.segundos_arranque = None
+
+    def __enter__(self):
+        self._log = open(self.log, 'wb')
+        inicio = time.perf_counter()
+        self.proceso = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', *self.argumentos],
+            cwd=RAIZ, env=self.env, stdout=self._log, stderr=subprocess.STDOUT,
+        )
+        fin = time.monotonic() + 60
+        while time.monotonic() < fin:
+            if self.proceso.poll() is not None:
+                sys.exit(f"El servidor terminó al arrancar; ver {self.log}")
+            try:
+                self.pedir('GET', self.ruta_prueba)
+                self.segundos_arranque = time.perf_counter() - inicio
+                return self
+            except OSError:
+                time.sleep(0.02)
+        self.__exit__(None, None, None)
+        sys.exit(f"El servidor no respondió a tiempo; ver {self.log}")
+
+    def __exit__(self, *exc):
+        if self.proceso.poll() is None:
+            self.proceso.send_signal(signal.SIGTERM)
+            self.proceso.wait(timeout=30)
+        self._log.close()
+
+    def pedir(self, metodo, ruta, cuerpo=None, headers=None):
+        return pedir(self.puerto, metodo, ruta, cuerpo, headers)
+
+    def workers(self):
+        return hijos(self.proceso.pid)
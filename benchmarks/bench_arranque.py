@@ -0,0 +1,118 @@
+"""
+Tiempo de arranque: comandos de manage.py y primera respuesta de la app WSGI.
+
+    python benchmarks/bench_arranque.py [--repeticiones 5] [--top 12]
+
+Cada escenario corre en un proceso nuevo (como un worker recién escalado o un
+cron): se informa la mediana del tiempo total y, de una corrida con
+``python -X importtime``, el tiempo de importación por paquete y los módulos
+del proyecto que más tardan (tiempo acumulado, incluye lo que importan).
+También se indica cuáles de los módulos de ``VIGILADOS`` se llegaron a
+importar. Los comandos corren sobre una copia de la BD.
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+from _entorno import RAIZ
+
+# Primera respuesta de la app WSGI sin servidor de por medio
+PRIMERA_RESPUESTA = """
+import time
+inicio = time.perf_counter()
+from wsgiref.util import setup_testing_defaults
+from DjangoProject.wsgi import application
+environ = {'PATH_INFO': '/universidad/areas/', 'REQUEST_METHOD': 'GET'}
+setup_testing_defaults(environ)
+estado = []
+b''.join(application(environ, lambda s, h, e=None: estado.append(s)))
+assert estado[0].startswith('200'), estado
+print(f'primera respuesta {(time.perf_counter() - inicio) * 1000:.1f} ms')
+"""
+
+# Módulos que solo hacen falta en algunos caminos (servir la API, subir imágenes)
+VIGILADOS = ('universidad.apis', 'rest_framework_simplejwt', 'cloudinary.uploader', 'PIL')
+
+ESCENARIOS = {
+    'manage.py help': ['manage.py', 'help'],
+    'procesar_eventos': ['manage.py', 'procesar_eventos', '--una-vez'],
+    'recolectar_medios': ['manage.py', 'recolectar_medios', '--dry-run'],
+    'wsgi 1ª respuesta': ['-c', PRIMERA_RESPUESTA],
+}
+
+
+def _correr(argumentos, env, importtime=False):
+    comando = [sys.executable, *(['-X', 'importtime'] if importtime else []), *argumentos]
+    inicio = time.perf_counter()
+    proceso = subprocess.run(comando, cwd=RAIZ, env=env, capture_output=True, text=True)
+    segundos = time.perf_counter() - inicio
+    if proceso.returncode != 0:
+        sys.exit(f"Falló {' '.join(argumentos[:2])}:\n{proceso.stderr[-2000:]}")
+    return segundos, proceso.stderr
+
+
+def _importtime(salida):
+    """(total µs, µs propios por paquete, µs acumulados por módulo del proyecto, módulos)."""
+    por_paquete = defaultdict(int)
+    proyecto = {}
+    modulos = set()
+    total = 0
+    for linea in salida.splitlines():
+        if not linea.startswith('import time:') or 'self [us]' in linea:
+            continue
+        partes = linea[len('import time:'):].split('|')
+        propio, acumulado, nombre = int(partes[0]), int(partes[1]), partes[2]
+        modulo = nombre.strip()
+        modulos.add(modulo)
+        por_paquete[modulo.split('.')[0]] += propio
+        total += propio
+        if modulo.startswith(('universidad', 'DjangoProject')):
+            proyecto[modulo] = acumulado
+    return total, por_paquete, proyecto, modulos
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--top', type=int, default=12)
+    args = parser.parse_args()
+
+    directorio = tempfile.mkdtemp(prefix='bench-arranque-')
+    shutil.copy(RAIZ / 'db.sqlite3', os.path.join(directorio, 'db.sqlite3'))
+    env = {
+        **os.environ,
+        'DB_NAME': os.path.join(directorio, 'db.sqlite3'),
+        'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'DjangoProject.settings'),
+        'MEDIA_BACKEND': 'local',
+        'MEDIA_LOCAL_RAIZ': os.path.join(directorio, 'media'),
+    }
+    _correr(['manage.py', 'migrate', '-v0'], env)
+
+    print(f"Mediana de {args.repeticiones} procesos ({directorio})")
+    for nombre, argumentos in ESCENARIOS.items():
+        tiempos = [_correr(argumentos, env)[0] for _ in range(args.repeticiones)]
+        _, salida = _correr(argumentos, env, importtime=True)
+        total, por_paquete, proyecto, modulos = _importtime(salida)
+
+        print(f"\n== {nombre}: {statistics.median(tiempos) * 1000:.0f} ms "
+              f"(importaciones {total / 1000:.0f} ms con -X importtime)")
+        print("   importados: " + ", ".join(
+            f"{modulo} {'sí' if modulo in modulos else 'no'}" for modulo in VIGILADOS
+        ))
+        print("   paquetes (tiempo propio):")
+        for paquete, us in sorted(por_paquete.items(), key=lambda x: -x[1])[:args.top]:
+            print(f"     {paquete:32} {us / 1000:7.1f} ms")
+        if proyecto:
+            print("   módulos del proyecto (acumulado):")
+            for modulo, us in sorted(proyecto.items(), key=lambda x: -x[1])[:args.top]:
+                print(f"     {modulo:32} {us / 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
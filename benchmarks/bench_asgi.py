@@ -0,0 +1,162 @@
+"""
+Workers sincrónicos de gunicorn contra la configuración ASGI, con los mismos procesos.
+
+    python benchmarks/bench_asgi.py [--workers 2] [--clientes 16] [--subidas 4] [--segundos 10] [--latencia 0.2]
+
+Levanta dos veces el proyecto sobre una copia de la BD y el backend de medios
+local con latencia artificial (como las llamadas a Cloudinary):
+
+- ``sync``: ``GUNICORN_WORKER_CLASS=sync gunicorn -w N`` (una petición por proceso);
+- ``asgi``: ``GUNICORN_WORKER_CLASS=uvicorn gunicorn -w N`` (``VISTAS_ASYNC=true``).
+
+Ambos usan el perfil de ``gunicorn.conf.py``.
+
+Durante ``--segundos`` hay ``--clientes`` hilos leyendo el catálogo y
+``--subidas`` hilos subiendo lotes de lecciones. Se informa la memoria total
+(RSS del master y los workers), lecturas por segundo con su latencia y lotes
+subidos por segundo. Con SQLite algunos lotes pueden fallar por escrituras
+concurrentes ("database is locked"); se cuentan en ``errores`` (ver los logs
+en el directorio temporal).
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+from _entorno import RAIZ, preparar
+from _servidor import Servidor, memoria_total_kb
+
+
+def _multipart(campos, archivos):
+    limite = uuid.uuid4().hex
+    partes = []
+    for nombre, valor in campos.items():
+        partes.append(
+            f'--{limite}\r\nContent-Disposition: form-data; name="{nombre}"\r\n\r\n{valor}\r\n'.encode()
+        )
+    for nombre, (archivo, contenido) in archivos.items():
+        partes.append(
+            f'--{limite}\r\nContent-Disposition: form-data; name="{nombre}"; filename="{archivo}"\r\n'
+            f'Content-Type: application/pdf\r\n\r\n'.encode() + contenido + b'\r\n'
+        )
+    partes.append(f'--{limite}--\r\n'.encode())
+    return b''.join(partes), f'multipart/form-data; boundary={limite}'
+
+
+def correr(nombre, clase, env, args, lecturas, lote, directorio):
+    env = {**env, 'GUNICORN_WORKER_CLASS': clase, 'VISTAS_ASYNC': str(clase == 'uvicorn').lower()}
+    log = os.path.join(directorio, f'{nombre}.log')
+    with Servidor(['-w', str(args.workers), '--timeout', '120'], env, log) as servidor:
+        for ruta in lecturas:  # calentar cada worker
+            for _ in range(args.workers * 2):
+                servidor.pedir('GET', ruta)
+
+        latencias, lotes, errores = [], [0], [0]
+        lock = threading.Lock()
+        fin = time.monotonic() + args.segundos
+
+        def lector(i):
+            n = i
+            while time.monotonic() < fin:
+                inicio = time.perf_counter()
+                estado = servidor.pedir('GET', lecturas[n % len(lecturas)])
+                with lock:
+                    latencias.append(time.perf_counter() - inicio)
+                    errores[0] += estado >= 400
+                n += 1
+
+        def subidor():
+            cuerpo, headers = lote
+            while time.monotonic() < fin:
+                estado = servidor.pedir('POST', '/universidad/lecciones/lote/', cuerpo, headers)
+                with lock:
+                    lotes[0] += estado == 201
+                    errores[0] += estado != 201
+
+        hilos = [threading.Thread(target=lector, args=(i,)) for i in range(args.clientes)]
+        hilos += [threading.Thread(target=subidor) for _ in range(args.subidas)]
+        for hilo in hilos:
+            hilo.start()
+        time.sleep(args.segundos / 2)
+        memoria = memoria_total_kb(servidor.proceso.pid)['rss']
+        for hilo in hilos:
+            hilo.join()
+
+    ms = sorted(x * 1000 for x in latencias)
+    return {
+        'nombre': nombre,
+        'memoria_mb': memoria / 1024,
+        'lecturas_s': len(ms) / args.segundos,
+        'p50': statistics.median(ms) if ms else 0.0,
+        'p95': ms[int(len(ms) * 0.95)] if ms else 0.0,
+        'lotes_s': lotes[0] / args.segundos,
+        'errores': errores[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--clientes', type=int, default=16, help="hilos leyendo el catálogo")
+    parser.add_argument('--subidas', type=int, default=4, help="hilos subiendo lotes de lecciones")
+    parser.add_argument('--archivos', type=int, default=2, help="archivos por lote")
+    parser.add_argument('--segundos', type=float, default=10)
+    parser.add_argument('--latencia', type=float, default=0.2, help="segundos por subida al servicio de medios")
+    args = parser.parse_args()
+
+    directorio = tempfile.mkdtemp(prefix='bench-asgi-')
+    shutil.copy(RAIZ / 'db.sqlite3', os.path.join(directorio, 'db.sqlite3'))
+    os.environ.update({
+        'DB_NAME': os.path.join(directorio, 'db.sqlite3'),
+        'MEDIA_BACKEND': 'local',
+        'MEDIA_LOCAL_RAIZ': os.path.join(directorio, 'media'),
+        'MEDIA_LOCAL_LATENCIA': str(args.latencia),
+    })
+    preparar()
+
+    from django.core.management import call_command
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from universidad.models import Area, Curso, Seccion
+
+    call_command('migrate', verbosity=0)
+    seccion = Seccion.objects.select_related('curso__docente__user').filter(curso__docente__isnull=False).first()
+    if seccion is None:
+        sys.exit("La BD no tiene secciones de cursos con docente.")
+    token = str(RefreshToken.for_user(seccion.curso.docente.user).access_token)
+    curso = Curso.objects.order_by('id').first()
+    lecturas = [
+        '/universidad/cursos/',
+        f'/universidad/cursos/{curso.id}/detalle/',
+        f'/universidad/cursos/por_area/{Area.objects.first().id}/',
+        f'/universidad/cursos/docente/{seccion.curso.docente.numero_registro}/',
+        '/universidad/areas/',
+    ]
+    cuerpo, tipo = _multipart(
+        {'seccion': seccion.id,
+         'lecciones': json.dumps([{'nombre': f'Bench {i}', 'archivo': f'f{i}'} for i in range(args.archivos)])},
+        {f'f{i}': (f'material{i}.pdf', b'%PDF-1.4\n' + os.urandom(64 * 1024)) for i in range(args.archivos)},
+    )
+    lote = (cuerpo, {'Content-Type': tipo, 'Authorization': f'Bearer {token}'})
+
+    env = dict(os.environ)
+    resultados = [
+        correr('sync', 'sync', env, args, lecturas, lote, directorio),
+        correr('asgi', 'uvicorn', env, args, lecturas, lote, directorio),
+    ]
+
+    print(f"{args.workers} workers, {args.clientes} lectores, {args.subidas} subidores "
+          f"({args.archivos} archivos, {args.latencia * 1000:.0f} ms c/u), {args.segundos:.0f} s ({directorio})")
+    print(f"{'':6} {'memoria':>9} {'lecturas/s':>11} {'p50 ms':>8} {'p95 ms':>8} {'lotes/s':>8} {'errores':>8}")
+    for r in resultados:
+        print(f"{r['nombre']:6} {r['memoria_mb']:7.1f}MB {r['lecturas_s']:11.1f} {r['p50']:8.1f} "
+              f"{r['p95']:8.1f} {r['lotes_s']:8.2f} {r['errores']:8d}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+POST /universidad/batch/ vs. las mismas lecturas por separado.
+
+    python benchmarks/bench_batch.py [--repeticiones 20] [--rtt 150]
+
+Pide con el cliente de pruebas de Django (middleware y autenticación JWT
+incluidos, sin red) las lecturas del inicio de la app móvil: ``users/me``,
+``compras/``, ``cursos/`` y ``areas/``. Reporta tiempo en el servidor,
+consultas (las de los hilos de ``paralelo`` no se ven desde este hilo) y,
+con ``--rtt`` ms de ida y vuelta, una estimación del arranque en frío: las
+peticiones separadas se cuentan en secuencia, como las hace un cliente que
+abre una conexión nueva.
+"""
+import argparse
+
+from _entorno import preparar, cronometrar
+
+preparar()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+from rest_framework_simplejwt.tokens import RefreshToken  # noqa: E402
+
+from universidad.cache.permisos import rol_usuario  # noqa: E402
+from universidad.limites import throttle  # noqa: E402
+from universidad.models import Compra  # noqa: E402
+
+RUTAS = ['users/me/', 'compras/', 'cursos/', 'areas/']
+SIN_LIMITE = (10 ** 9, 1.0)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeticiones', type=int, default=20)
+    parser.add_argument('--rtt', type=float, default=150, help='ms de ida y vuelta de la red móvil')
+    args = parser.parse_args()
+
+    # Tasas que no rechazan: se mide el costo, no las respuestas 429
+    for alcance in ('general', 'catalogo'):
+        for rol in ('Alumno', 'Docente', 'Administrador'):
+            throttle._tasas[(alcance, rol)] = SIN_LIMITE
+
+    usuario = Compra.objects.select_related('alumno').first().alumno
+    token = RefreshToken.for_user(usuario)
+    token['rol'] = rol_usuario(usuario)
+    cliente = APIClient()
+    cliente.credentials(HTTP_AUTHORIZATION=f'Bearer {token.access_token}')
+
+    def separadas():
+        for ruta in RUTAS:
+            assert cliente.get(f'/universidad/{ruta}').status_code == 200
+
+    def lote(paralelo):
+        response = cliente.post('/universidad/batch/', {'peticiones': RUTAS, 'paralelo': paralelo}, format='json')
+        assert all(r['status'] == 200 for r in response.json()['respuestas'])
+
+    casos = [
+        ('separadas', len(RUTAS), separadas),
+        ('batch', 1, lambda: lote(False)),
+        ('batch paralelo', 1, lambda: lote(True)),
+    ]
+    print(f"{'':16}{'peticiones':>11}{'consultas':>11}{'ms servidor':>13}{f'ms con rtt {args.rtt:g}':>18}")
+    for nombre, peticiones, funcion in casos:
+        funcion()
+        with CaptureQueriesContext(connection) as capturadas:
+            funcion()
+        consultas = len(capturadas)  # antes de la próxima petición, que vacía el registro
+        ms = cronometrar(funcion, args.repeticiones)
+        print(f"{nombre:16}{peticiones:>11}{consultas:>11}{ms:>13.2f}{ms + peticiones * args.rtt:>18.0f}")
+
+
+if __name__ == '__main__':
+    main()
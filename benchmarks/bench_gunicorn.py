@@ -0,0 +1,126 @@
+"""
+Arranque en frío y memoria por worker con y sin el perfil de gunicorn.conf.py.
+
+    python benchmarks/bench_gunicorn.py [--clase sync|gthread|uvicorn] [--workers 4] [--peticiones 2000]
+
+Sobre una copia de la BD se levanta dos veces gunicorn:
+
+- ``sin perfil``: sin preload_app, sin calentamiento, sin reciclado y con
+  ``DEBUG=true`` (como estaba ``settings.py``);
+- ``perfil``: los valores por defecto de gunicorn.conf.py con ``DEBUG=false``.
+
+Para cada uno se mide el tiempo hasta la primera respuesta, la latencia de la
+primera petición de cada worker (todas a la vez), la memoria de los workers
+(RSS y PSS; la PSS baja cuando comparten páginas con el master) y cuánto
+crece después de ``--peticiones`` peticiones al catálogo.
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+
+from _entorno import RAIZ, preparar
+from _servidor import Servidor, memoria_kb
+
+CONFIGURACIONES = {
+    'sin perfil': {
+        'GUNICORN_PRELOAD': 'false', 'GUNICORN_CALENTAR': 'false',
+        'GUNICORN_MAX_REQUESTS': '0', 'DEBUG': 'true',
+    },
+    'perfil': {'DEBUG': 'false'},
+}
+
+
+def _memoria_workers(servidor):
+    """Promedio por worker en MB."""
+    medidas = [memoria_kb(pid) for pid in servidor.workers()]
+    if not medidas:
+        return 0.0, 0.0
+    return (statistics.mean(m['rss'] for m in medidas) / 1024,
+            statistics.mean(m['pss'] for m in medidas) / 1024)
+
+
+def _en_paralelo(servidor, rutas, hilos):
+    """Reparte ``rutas`` entre ``hilos`` clientes; devuelve las latencias en ms."""
+    latencias = []
+    lock = threading.Lock()
+
+    def cliente(propias):
+        for ruta in propias:
+            inicio = time.perf_counter()
+            servidor.pedir('GET', ruta)
+            with lock:
+                latencias.append((time.perf_counter() - inicio) * 1000)
+
+    trabajadores = [threading.Thread(target=cliente, args=(rutas[i::hilos],)) for i in range(hilos)]
+    for trabajador in trabajadores:
+        trabajador.start()
+    for trabajador in trabajadores:
+        trabajador.join()
+    return latencias
+
+
+def medir(nombre, env, args, rutas, directorio):
+    argumentos = ['-w', str(args.workers)]
+    with Servidor(argumentos, env, os.path.join(directorio, f"{nombre.replace(' ', '_')}.log")) as servidor:
+        arranque = servidor.segundos_arranque
+        # Dar tiempo a que terminen de arrancar (y calentarse) todos los workers
+        fin = time.monotonic() + 30
+        while len(servidor.workers()) < args.workers and time.monotonic() < fin:
+            time.sleep(0.1)
+        time.sleep(1)
+        primeras = _en_paralelo(servidor, [rutas[1]] * args.workers, args.workers)
+        rss_inicio, pss_inicio = _memoria_workers(servidor)
+        _en_paralelo(servidor, [rutas[i % len(rutas)] for i in range(args.peticiones)], args.workers * 2)
+        rss_fin, pss_fin = _memoria_workers(servidor)
+    return {
+        'nombre': nombre, 'arranque': arranque,
+        'primera_max': max(primeras), 'primera_media': statistics.mean(primeras),
+        'rss': rss_inicio, 'pss': pss_inicio, 'crecimiento': rss_fin - rss_inicio, 'pss_fin': pss_fin,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clase', default='sync', choices=('sync', 'gthread', 'uvicorn'))
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--peticiones', type=int, default=2000)
+    args = parser.parse_args()
+
+    directorio = tempfile.mkdtemp(prefix='bench-gunicorn-')
+    shutil.copy(RAIZ / 'db.sqlite3', os.path.join(directorio, 'db.sqlite3'))
+    os.environ['DB_NAME'] = os.path.join(directorio, 'db.sqlite3')
+    preparar()
+
+    from django.core.management import call_command
+    from universidad.models import Area, Curso
+
+    call_command('migrate', verbosity=0)
+    curso = Curso.objects.order_by('id').first()
+    rutas = [
+        '/universidad/cursos/',
+        f'/universidad/cursos/{curso.id}/detalle/',
+        f'/universidad/cursos/por_area/{Area.objects.first().id}/',
+        '/universidad/areas/',
+    ]
+
+    # Sin Redis: se mide arranque y memoria, no la coherencia de la cache entre workers
+    base = {**os.environ, 'GUNICORN_WORKER_CLASS': args.clase, 'GUNICORN_CACHE_LOCAL': 'true'}
+    resultados = [
+        medir(nombre, {**base, **extra}, args, rutas, directorio)
+        for nombre, extra in CONFIGURACIONES.items()
+    ]
+
+    print(f"{args.clase}, {args.workers} workers, {args.peticiones} peticiones ({directorio})")
+    print(f"{'':11} {'arranque':>9} {'1ª máx':>8} {'1ª media':>9} {'RSS/w':>8} {'PSS/w':>8} "
+          f"{'PSS/w fin':>10} {'crece RSS':>10}")
+    for r in resultados:
+        print(f"{r['nombre']:11} {r['arranque']:8.2f}s {r['primera_max']:6.1f}ms {r['primera_media']:7.1f}ms "
+              f"{r['rss']:6.1f}MB {r['pss']:6.1f}MB {r['pss_fin']:8.1f}MB {r['crecimiento']:8.1f}MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Pool HTTP compartido vs. los pools por defecto del SDK de Cloudinary.
+
+    python benchmarks/bench_http_media.py [--subidas 200] [--hilos 8] [--latencia 0.01]
+
+Levanta un servidor HTTP local que imita el endpoint de subida de Cloudinary
+(responde el JSON de un recurso tras ``--latencia`` segundos) y apunta el SDK a
+él con ``upload_prefix``. Sube con ``subir_en_paralelo`` usando primero el
+pool que trae el SDK y después ``ClienteHTTP``, y compara el tiempo total y
+las conexiones TCP que tuvo que aceptar el servidor (en producción, cada una
+es un handshake TLS).
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from _entorno import preparar, cronometrar
+
+
+class Stub(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True
+    latencia = 0.0
+    conexiones = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with Stub.lock:
+            Stub.conexiones += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        time.sleep(self.latencia)
+        cuerpo = json.dumps({
+            'public_id': f'bench/{time.monotonic_ns()}', 'version': 1, 'format': 'jpg',
+            'resource_type': 'image', 'type': 'upload',
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--subidas', type=int, default=200)
+    parser.add_argument('--hilos', type=int, default=8)
+    parser.add_argument('--latencia', type=float, default=0.01, help="segundos por subida en el servidor")
+    args = parser.parse_args()
+
+    os.environ['MEDIA_BACKEND'] = 'cloudinary'
+    preparar()
+
+    import cloudinary
+    from cloudinary import uploader
+    from cloudinary.utils import get_http_connector
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from universidad.media import ClienteHTTP, instalar_en_sdk, subir_en_paralelo
+    from universidad.media.backends import obtener_backend
+    from universidad.models import Curso
+
+    # El pool del SDK avisa cada conexión que descarta; se cuentan en la tabla
+    logging.getLogger('urllib3.connectionpool').setLevel(logging.ERROR)
+    Stub.latencia = args.latencia
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), Stub)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    cloudinary.config(
+        upload_prefix=f'http://127.0.0.1:{servidor.server_port}',
+        cloud_name='bench', api_key='bench', api_secret='bench',
+    )
+
+    campo = Curso._meta.get_field('photo_profile')
+    contenido = os.urandom(32 * 1024)
+
+    def subir():
+        trabajos = [(campo, SimpleUploadedFile(f'f{i}.jpg', contenido), {}) for i in range(args.subidas)]
+        resultados = subir_en_paralelo(trabajos, max_workers=args.hilos)
+        errores = [r for r in resultados if isinstance(r, Exception)]
+        if errores:
+            raise SystemExit(f"Falló una subida: {errores[0]!r}")
+
+    print(f"{args.subidas} subidas, {args.hilos} hilos, latencia del servidor {args.latencia * 1000:.0f} ms")
+    print(f"{'pool':<18}{'ms':>10}{'conexiones':>12}")
+    obtener_backend()  # crea el backend antes (instala su propio pool) para que no pise los casos
+    cliente = ClienteHTTP(MAX_POR_HOST=args.hilos)
+    casos = [
+        ('SDK por defecto', lambda: setattr(uploader, '_http', get_http_connector(cloudinary.config(), {}))),
+        ('ClienteHTTP', lambda: instalar_en_sdk(cliente)),
+    ]
+    for nombre, instalar in casos:
+        instalar()
+        Stub.conexiones = 0
+        ms = cronometrar(subir, 1)
+        print(f"{nombre:<18}{ms:>10.0f}{Stub.conexiones:>12}")
+    print("métricas del pool:", json.dumps(cliente.metricas_pool(), indent=2))
+    servidor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
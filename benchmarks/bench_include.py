@@ -0,0 +1,131 @@
+"""
+Consultas y tiempo de ``?include=`` en ``CursoViewSet`` (universidad.apis.inclusion).
+
+    python benchmarks/bench_include.py [--cursos 200] [--secciones 8] [--lecciones 10]
+
+Crea un área con ``--cursos`` cursos dentro de una transacción que se
+revierte al final y, para cada combinación de ``include``, cuenta las
+consultas de ``list`` con 1 curso y con todos, y de ``retrieve``. Que no
+dependan de cuántos objetos hay y que cada relación incluida sea idéntica a
+la de su endpoint lo verifica ``universidad/tests.py`` (``IncludeTests``).
+
+Al final compara el editor de cursos con una sola petición
+``retrieve?include=...`` contra la secuencia actual (``detalle_docente``,
+``secciones/por_curso``, ``lecciones/<id>`` por lección y
+``docentes/mi_perfil``), sin contar red ni autenticación.
+"""
+import argparse
+
+from _entorno import preparar, cronometrar
+
+preparar()
+
+from django.db import connection, transaction  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from rest_framework.test import APIRequestFactory, force_authenticate  # noqa: E402
+
+from universidad.apis.curso_viewset import CursoViewSet  # noqa: E402
+from universidad.apis.docente_viewset import DocenteViewSet  # noqa: E402
+from universidad.apis.leccion_viewset import LeccionViewSet  # noqa: E402
+from universidad.apis.seccion_viewset import SeccionViewSet  # noqa: E402
+from universidad.models import Area, Curso, Docente, Leccion, Seccion  # noqa: E402
+
+COMBINACIONES = [
+    '',
+    'area',
+    'docente',
+    'area,docente',
+    'secciones',
+    'secciones.lecciones',
+    'area,docente,secciones',
+    'area,docente,secciones.lecciones',
+]
+
+factory = APIRequestFactory()
+
+
+def vista(viewset, accion, metodo='get'):
+    # Sin throttle: se mide la vista, no las respuestas 429
+    return viewset.as_view({metodo: accion}, throttle_classes=[])
+
+
+def pedir(view, url, usuario, **kwargs):
+    request = factory.get(url)
+    force_authenticate(request, user=usuario)
+    response = view(request, **kwargs)
+    response.render()
+    assert response.status_code == 200, (url, response.status_code, response.data)
+    return response
+
+
+def consultas(view, url, usuario, **kwargs):
+    with CaptureQueriesContext(connection) as capturadas:
+        response = pedir(view, url, usuario, **kwargs)
+    return len(capturadas), response
+
+
+def crear_datos(cursos, secciones, lecciones):
+    area = Area.objects.create(nombre='bench-include')
+    docente = Docente.objects.select_related('user').first()
+    nuevos = Curso.objects.bulk_create([
+        Curso(nombre=f'Curso {i}', descripcion='Descripción', area=area, docente=docente, precio=i % 300)
+        for i in range(cursos)
+    ])
+    nuevas = Seccion.objects.bulk_create([
+        Seccion(nombre=f'Sección {j}', curso=curso, orden=j) for curso in nuevos for j in range(secciones)
+    ])
+    Leccion.objects.bulk_create([
+        Leccion(nombre=f'Lección {k}', seccion=seccion, orden=k,
+                material=f'image/upload/v1/lecciones/demo{k}.jpg' if k % 2 else None)
+        for seccion in nuevas for k in range(lecciones)
+    ])
+    return area, docente, nuevos[0]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--cursos', type=int, default=200)
+    parser.add_argument('--secciones', type=int, default=8)
+    parser.add_argument('--lecciones', type=int, default=10)
+    parser.add_argument('--repeticiones', type=int, default=20)
+    args = parser.parse_args()
+
+    with transaction.atomic():
+        area, docente, curso = crear_datos(args.cursos, args.secciones, args.lecciones)
+        usuario = docente.user
+        listar, detalle = vista(CursoViewSet, 'list'), vista(CursoViewSet, 'retrieve')
+
+        print(f"{'include':<36}{'list 1 curso':>14}{f'list {args.cursos}':>12}{'retrieve':>10}")
+        for include in COMBINACIONES:
+            parametros = f'&include={include}' if include else ''
+            uno, _ = consultas(listar, f'/?area={area.pk}&precio_max=0{parametros}', usuario)
+            todos, _ = consultas(listar, f'/?area={area.pk}{parametros}', usuario)
+            individual, _ = consultas(detalle, f'/?include={include}', usuario, pk=curso.pk)
+            print(f"{include or '(ninguno)':<36}{uno:>14}{todos:>12}{individual:>10}")
+
+        # Editor de cursos: una petición compuesta vs. la secuencia de peticiones
+        compuesta = f'/?include={COMBINACIONES[-1]}'
+        lecciones = list(Leccion.objects.filter(seccion__curso=curso).values_list('pk', flat=True))
+
+        def secuencia():
+            pedir(vista(CursoViewSet, 'detalle_docente'), '/', usuario, pk=curso.pk)
+            pedir(vista(SeccionViewSet, 'por_curso'), '/', usuario, curso_id=curso.pk)
+            for pk in lecciones:
+                pedir(vista(LeccionViewSet, 'retrieve'), '/', usuario, pk=pk)
+            pedir(vista(DocenteViewSet, 'mi_perfil'), '/', usuario)
+
+        with CaptureQueriesContext(connection) as capturadas:
+            secuencia()
+        n_secuencia = len(capturadas)
+        n_compuesta, _ = consultas(detalle, compuesta, usuario, pk=curso.pk)
+        ms_secuencia = cronometrar(secuencia, args.repeticiones)
+        ms_compuesta = cronometrar(lambda: pedir(detalle, compuesta, usuario, pk=curso.pk), args.repeticiones)
+        print(f"\neditor ({args.secciones} secciones, {len(lecciones)} lecciones)")
+        print(f"  secuencia: {len(lecciones) + 3:4} peticiones {n_secuencia:5} consultas {ms_secuencia:8.2f} ms")
+        print(f"  include:   {1:4} petición   {n_compuesta:5} consultas {ms_compuesta:8.2f} ms")
+
+        transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Ruta rápida de lectura (PlanLectura) vs. ModelSerializer en listados grandes.
+
+    python benchmarks/bench_lectura_rapida.py [--filas 10000]
+
+Crea datos sintéticos dentro de una transacción que se revierte al final y
+reporta el tiempo por fila de ambos caminos. Que la salida de cada plan sea
+idéntica a la del serializer lo verifica ``universidad/tests.py``
+(``LecturaRapidaTests``).
+"""
+import argparse
+
+from _entorno import preparar, cronometrar
+
+preparar()
+
+from django.contrib.auth.models import Group  # noqa: E402
+from django.db import transaction  # noqa: E402
+from rest_framework.request import Request  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from universidad.apis.compra_viewset import CompraViewSet  # noqa: E402
+from universidad.apis.curso_viewset import CursoViewSet  # noqa: E402
+from universidad.apis.user_viewset import UserViewSet  # noqa: E402
+from universidad.models import Alumno, Area, Compra, Curso, Docente  # noqa: E402
+
+
+def crear_datos(filas):
+    area = Area.objects.create(nombre='bench-area')
+    docente = Docente.objects.first()
+    alumno = Alumno.objects.create_user(
+        email='bench@bench.local', password='x', nombre_completo='Bench', email_secundario='bench2@bench.local'
+    )
+    cursos = Curso.objects.bulk_create([
+        Curso(
+            nombre=f'Curso {i}', descripcion='Descripción de prueba', area=area,
+            docente=docente if i % 2 else None, precio=i % 300, certificable=bool(i % 3),
+            photo_profile=f'image/upload/v1/cursos/demo{i}.jpg' if i % 4 else None,
+        )
+        for i in range(filas)
+    ])
+    Compra.objects.bulk_create([Compra(alumno=alumno, curso=c, es_trial=bool(c.pk % 2)) for c in cursos])
+    usuarios = Alumno.objects.bulk_create([
+        Alumno(email=f'u{i}@bench.local', email_secundario=f'u{i}b@bench.local',
+               nombre_completo=f'Usuario {i}', numero_registro=f'B{i:05d}', password='!')
+        for i in range(filas)
+    ])
+    grupo = Group.objects.get_or_create(name='Alumno')[0]
+    Alumno.groups.through.objects.bulk_create(
+        [Alumno.groups.through(alumno_id=u.pk, group_id=grupo.pk) for u in usuarios]
+    )
+    return area, alumno
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--filas', type=int, default=10000)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args()
+
+    with transaction.atomic():
+        area, alumno = crear_datos(args.filas)
+        request = Request(APIRequestFactory().get('/'))
+        contexto = {'request': request}
+
+        casos = [
+            ('CursoSerializer', CursoViewSet.plan_lectura, Curso.objects.filter(area=area).order_by('id')),
+            ('CompraSerializer', CompraViewSet.plan_lectura, Compra.objects.filter(alumno=alumno).order_by('id')),
+            ('UserSerializer', UserViewSet.plan_lectura,
+             Alumno.objects.filter(email__endswith='@bench.local', groups__name='Alumno').order_by('id')),
+        ]
+
+        print(f"{'serializer':<20}{'filas':>8}{'µs/fila DRF':>14}{'µs/fila rápida':>16}{'speedup':>10}")
+        for nombre, plan, queryset in casos:
+            filas = len(plan.serializar(queryset, contexto))
+            drf = cronometrar(
+                lambda: plan.serializer_class(queryset, many=True, context=contexto).data, args.repeticiones
+            )
+            rapida = cronometrar(lambda: plan.serializar(queryset, contexto), args.repeticiones)
+            print(f"{nombre:<20}{filas:>8}{drf * 1000 / filas:>14.2f}{rapida * 1000 / filas:>16.2f}"
+                  f"{drf / rapida:>9.1f}x")
+
+        transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    main()
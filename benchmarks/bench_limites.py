@@ -0,0 +1,84 @@
+"""
+Costo del límite de peticiones (universidad.limites).
+
+    python benchmarks/bench_limites.py [--peticiones 20000]
+
+Mide:
+
+- ``permitir()`` solo, con cubetas locales y con la cache de Django
+  configurada (LocMem sin Redis: mide el costo de la capa de cache, no la red);
+- ``CubetaThrottle.allow_request()`` en una petición anónima y en una
+  autenticada (JWT con el claim ``rol``), y las consultas a la BD de una
+  petición completa a ``/areas/`` con y sin el throttle.
+"""
+import argparse
+
+from _entorno import preparar, cronometrar
+
+preparar()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+from rest_framework_simplejwt.tokens import RefreshToken  # noqa: E402
+
+from universidad.apis.area_viewset import AreaViewSet  # noqa: E402
+from universidad.cache.permisos import rol_usuario  # noqa: E402
+from universidad.limites import CubetaThrottle, CubetasCache, CubetasLocales  # noqa: E402
+from universidad.limites import throttle  # noqa: E402
+from universidad.models import Alumno  # noqa: E402
+
+SIN_LIMITE = (10 ** 9, 1.0)  # nunca rechaza: se mide solo el costo
+
+
+def medir_cubetas(peticiones):
+    for nombre, cubetas in (('locales', CubetasLocales()), ('cache', CubetasCache())):
+        claves = [f'bench:{i % 1000}' for i in range(peticiones)]
+        iterador = iter(claves)
+        ms = cronometrar(lambda: cubetas.consumir(next(iterador), *SIN_LIMITE), peticiones)
+        print(f"consumir() {nombre:8} {ms * 1000:8.2f} µs")
+
+
+def medir_vista(peticiones, autorizacion, etiqueta):
+    factory = APIRequestFactory()
+    encabezados = {'HTTP_AUTHORIZATION': autorizacion} if autorizacion else {}
+
+    # Consultas de una petición completa, con y sin el throttle
+    consultas = {}
+    for nombre, clases in (('sin', []), ('con', [CubetaThrottle])):
+        vista = AreaViewSet.as_view({'get': 'list'}, throttle_classes=clases)
+        vista(factory.get('/universidad/areas/', **encabezados)).render()
+        with CaptureQueriesContext(connection) as capturadas:
+            vista(factory.get('/universidad/areas/', **encabezados)).render()
+        consultas[nombre] = len(capturadas)
+
+    # Tiempo de allow_request() sobre una petición ya autenticada
+    vista = AreaViewSet(action_map={'get': 'list'}, action='list')
+    request = vista.initialize_request(factory.get('/universidad/areas/', **encabezados))
+    request.user  # autentica una vez
+    throttle_ = CubetaThrottle()
+    us = cronometrar(lambda: throttle_.allow_request(request, vista), peticiones) * 1000
+    print(f"{etiqueta:12} allow_request() {us:6.2f} µs  consultas por petición: "
+          f"sin límite {consultas['sin']}, con límite {consultas['con']}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--peticiones', type=int, default=20000)
+    args = parser.parse_args()
+
+    # Tasas que no rechazan, para medir el costo y no las respuestas 429
+    throttle._tasas.update({('general', 'anonimo'): SIN_LIMITE, ('general', 'Alumno'): SIN_LIMITE})
+
+    medir_cubetas(args.peticiones)
+
+    usuario = next(u for u in Alumno.objects.filter(is_active=True, is_superuser=False)
+                   if rol_usuario(u) == 'Alumno')
+    refresh = RefreshToken.for_user(usuario)
+    refresh['rol'] = 'Alumno'
+    medir_vista(args.peticiones, None, 'anónima')
+    medir_vista(args.peticiones, f'Bearer {refresh.access_token}', 'autenticada')
+
+
+if __name__ == '__main__':
+    main()
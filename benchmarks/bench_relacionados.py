@@ -0,0 +1,97 @@
+"""
+Cálculo de cursos relacionados sobre compras sintéticas.
+
+    python benchmarks/bench_relacionados.py [--compras 1000000] [--alumnos 100000] [--cursos 2000] [--nuevas 1000]
+
+Genera compras con popularidad desigual (unos pocos cursos concentran la
+mayoría) y mide, sin tocar la BD:
+
+- cálculo completo con NumPy/SciPy (matriz dispersa) y con el respaldo en
+  Python puro, y que ambos den los mismos vecinos;
+- cálculo incremental tras ``--nuevas`` compras: solo los cursos de los
+  alumnos que compraron.
+
+La lectura desde la BD (``values_list`` de las compras) se suma a esto en
+``manage.py calcular_relacionados``.
+"""
+import argparse
+import random
+import time
+
+from _entorno import preparar
+
+
+def generar(compras, alumnos, cursos, semilla=1):
+    azar = random.Random(semilla)
+    pesos = [1 / (i + 1) ** 0.8 for i in range(cursos)]
+    pares = set()
+    while len(pares) < compras:
+        faltan = compras - len(pares)
+        elegidos = azar.choices(range(1, cursos + 1), weights=pesos, k=faltan)
+        pares.update(zip((azar.randint(1, alumnos) for _ in range(faltan)), elegidos))
+    pares = list(pares)
+    azar.shuffle(pares)
+    return [a for a, _ in pares], [c for _, c in pares]
+
+
+def medir(nombre, funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    print(f"{nombre:34} {time.perf_counter() - inicio:7.2f} s  ({len(resultado)} cursos)")
+    return resultado
+
+
+def iguales(a, b):
+    """Mismos vecinos en el mismo orden y puntajes iguales salvo redondeo."""
+    if a.keys() != b.keys():
+        return False
+    return all(
+        [v[0] for v in a[c]] == [v[0] for v in b[c]]
+        and all(abs(x[1] - y[1]) < 1e-9 for x, y in zip(a[c], b[c]))
+        for c in a
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--compras', type=int, default=1_000_000)
+    parser.add_argument('--alumnos', type=int, default=100_000)
+    parser.add_argument('--cursos', type=int, default=2000)
+    parser.add_argument('--nuevas', type=int, default=1000)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--min-comunes', type=int, default=2)
+    parser.add_argument('--sin-python', action='store_true', help="No medir el respaldo en Python puro.")
+    args = parser.parse_args()
+
+    preparar()
+    from universidad.recomendaciones import relacionados
+
+    inicio = time.perf_counter()
+    alumnos, cursos = generar(args.compras, args.alumnos, args.cursos)
+    print(f"{len(cursos)} compras de {args.alumnos} alumnos en {args.cursos} cursos "
+          f"(generadas en {time.perf_counter() - inicio:.1f} s)\n")
+    parametros = {'k': args.k, 'min_comunes': args.min_comunes}
+
+    numpy = None
+    if relacionados.np is not None:
+        numpy = medir("completo, NumPy/SciPy", lambda: relacionados._similitudes_numpy(
+            alumnos, cursos, None, lote=relacionados.DEFAULTS['LOTE_CURSOS'], **parametros))
+    else:
+        print("NumPy/SciPy no instalados: solo se mide el respaldo en Python")
+    if not args.sin_python:
+        python = medir("completo, Python puro", lambda: relacionados._similitudes_python(
+            alumnos, cursos, None, **parametros))
+        if numpy is not None:
+            print(f"{'mismos vecinos':34} {'sí' if iguales(numpy, python) else 'NO'}")
+
+    # Las últimas compras hacen de "nuevas" desde el cálculo anterior
+    alumnos_nuevos = set(alumnos[-args.nuevas:])
+    objetivos = set(cursos[-args.nuevas:])
+    objetivos.update(c for a, c in zip(alumnos, cursos) if a in alumnos_nuevos)
+    print(f"\nincremental: {args.nuevas} compras nuevas → {len(objetivos)} cursos a recalcular")
+    medir("incremental", lambda: relacionados.similitudes(
+        alumnos, cursos, objetivos, lote=relacionados.DEFAULTS['LOTE_CURSOS'], **parametros))
+
+
+if __name__ == '__main__':
+    main()
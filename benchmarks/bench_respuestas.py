@@ -0,0 +1,62 @@
+"""
+Tiempo de serialización y bytes enviados para el curso más grande.
+
+    python benchmarks/bench_respuestas.py [--repeticiones 200]
+
+Compara el JSONRenderer estándar de DRF con FastJSONRenderer y reporta el
+tamaño de la respuesta sin comprimir, con gzip y con brotli (si está instalado).
+"""
+import argparse
+import gzip
+
+from _entorno import preparar, cronometrar
+
+preparar()
+
+from django.conf import settings  # noqa: E402
+from django.db.models import Count  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from universidad.apis.curso_viewset import CursoDetailFullSerializer  # noqa: E402
+from universidad.middleware import brotli  # noqa: E402
+from universidad.models import Curso  # noqa: E402
+from universidad.renderers import FastJSONRenderer, orjson  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeticiones', type=int, default=200)
+    args = parser.parse_args()
+
+    curso = Curso.objects.annotate(total=Count('secciones__lecciones')).order_by('-total').first()
+    if curso is None:
+        print("No hay cursos en la base de datos.")
+        return
+
+    data = CursoDetailFullSerializer(curso).data
+    config = settings.REST_FRAMEWORK.get('COMPRESSION', {})
+
+    print(f"Curso {curso.id} '{curso.nombre}' ({curso.total} lecciones)")
+    print(f"{'renderer':<22}{'ms/render':>12}")
+    for nombre, renderer in (('JSONRenderer', JSONRenderer()), ('FastJSONRenderer', FastJSONRenderer())):
+        ms = cronometrar(lambda: renderer.render(data), args.repeticiones)
+        print(f"{nombre:<22}{ms:>12.4f}")
+    if orjson is None:
+        print("(orjson no está instalado: FastJSONRenderer usa json de la stdlib)")
+
+    cuerpo = FastJSONRenderer().render(data)
+    print(f"\n{'codificación':<22}{'bytes':>12}{'ms':>10}")
+    print(f"{'identity':<22}{len(cuerpo):>12}{0:>10.4f}")
+    nivel = config.get('GZIP_LEVEL', 6)
+    ms = cronometrar(lambda: gzip.compress(cuerpo, compresslevel=nivel), args.repeticiones)
+    print(f"{'gzip':<22}{len(gzip.compress(cuerpo, compresslevel=nivel)):>12}{ms:>10.4f}")
+    if brotli is not None:
+        calidad = config.get('BROTLI_QUALITY', 5)
+        ms = cronometrar(lambda: brotli.compress(cuerpo, quality=calidad), args.repeticiones)
+        print(f"{'br':<22}{len(brotli.compress(cuerpo, quality=calidad)):>12}{ms:>10.4f}")
+    else:
+        print("(brotli no está instalado)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Subidas de material de lecciones con el backend de medios local.
+
+    python benchmarks/bench_subidas.py [--archivos 20] [--latencia 0.2] [--tamano-kb 256]
+
+Usa ``MEDIA_BACKEND=local`` en un directorio temporal, con latencia artificial
+por llamada para simular a Cloudinary, y compara las subidas en serie (como
+``CampoMedia.pre_save`` fila por fila) con ``subir_en_paralelo``.
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+from _entorno import preparar, cronometrar
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--archivos', type=int, default=20)
+    parser.add_argument('--latencia', type=float, default=0.2, help="segundos por llamada")
+    parser.add_argument('--tamano-kb', type=int, default=256)
+    parser.add_argument('--hilos', type=int, default=4)
+    args = parser.parse_args()
+
+    raiz = tempfile.mkdtemp(prefix='bench-media-')
+    os.environ['MEDIA_BACKEND'] = 'local'
+    os.environ['MEDIA_LOCAL_RAIZ'] = raiz
+    os.environ['MEDIA_LOCAL_LATENCIA'] = str(args.latencia)
+    preparar()
+
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    from universidad.media import es_pdf, subir_archivo, subir_en_paralelo
+    from universidad.models import Leccion
+
+    campo = Leccion._meta.get_field('material')
+    contenido = os.urandom(args.tamano_kb * 1024)
+
+    def archivos():
+        return [
+            SimpleUploadedFile(f'material{i}.{"pdf" if i % 2 else "mp4"}', contenido)
+            for i in range(args.archivos)
+        ]
+
+    def extra(archivo):
+        return {'resource_type': 'raw'} if es_pdf(archivo.name) else {}
+
+    def en_serie():
+        for archivo in archivos():
+            subir_archivo(campo, archivo, **extra(archivo))
+
+    def en_paralelo():
+        resultados = subir_en_paralelo([(campo, a, extra(a)) for a in archivos()], max_workers=args.hilos)
+        errores = [r for r in resultados if isinstance(r, Exception)]
+        if errores:
+            sys.exit(f"Falló una subida: {errores[0]!r}")
+
+    serie = cronometrar(en_serie, 1)
+    paralelo = cronometrar(en_paralelo, 1)
+    print(f"{args.archivos} archivos de {args.tamano_kb} KB, latencia {args.latencia * 1000:.0f} ms ({raiz})")
+    print(f"{'en serie':<22}{serie:>10.0f} ms")
+    print(f"{f'paralelo ({args.hilos} hilos)':<22}{paralelo:>10.0f} ms{serie / paralelo:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Perfil de gunicorn para producción, configurable por variables de entorno.
+
+    gunicorn                                   # toma este archivo desde la raíz del proyecto
+    GUNICORN_WORKER_CLASS=uvicorn gunicorn     # ASGI con las vistas asíncronas
+
+Variables:
+
+- ``GUNICORN_WORKER_CLASS``: ``sync`` (por defecto), ``gthread`` o ``uvicorn``.
+- ``WEB_CONCURRENCY``: workers (por defecto 2 × CPU + 1). Con más de uno
+  hace falta ``REDIS_URL``: la cache de memoria local no se comparte.
+- ``GUNICORN_CACHE_LOCAL``: permite varios workers sin ``REDIS_URL``, solo
+  para mediciones que no dependen de la cache (false).
+- ``GUNICORN_THREADS``: hilos por worker con ``gthread`` (4).
+- ``GUNICORN_PRELOAD``: carga la app en el master antes del fork, así los
+  workers comparten por copy-on-write los módulos importados (true).
+- ``GUNICORN_MAX_REQUESTS`` / ``GUNICORN_MAX_REQUESTS_JITTER``: recicla cada
+  worker tras ese número de peticiones, con un margen al azar para que no se
+  reinicien todos juntos (1000 / 100; 0 desactiva el reciclado).
+- ``GUNICORN_TIMEOUT`` (30), ``GUNICORN_KEEPALIVE`` (5), ``PORT`` (8000).
+- ``GUNICORN_CALENTAR``: calienta cada worker antes de aceptar tráfico (true).
+
+Memoria por worker y tiempo de arranque: benchmarks/bench_gunicorn.py
+"""
+import gc
+import multiprocessing
+import os
+
+from decouple import config
+
+
+def _entero(nombre, defecto):
+    return int(os.environ.get(nombre, defecto))
+
+
+def _booleano(nombre, defecto):
+    return os.environ.get(nombre, str(defecto)).lower() in ('1', 'true', 'yes', 'on')
+
+
+CLASES = {
+    'sync': 'sync',
+    'gthread': 'gthread',
+    'uvicorn': 'uvicorn.workers.UvicornWorker',
+}
+clase = os.environ.get('GUNICORN_WORKER_CLASS', 'sync').lower()
+if clase not in CLASES:
+    raise RuntimeError(f"GUNICORN_WORKER_CLASS debe ser uno de: {', '.join(CLASES)}")
+
+worker_class = CLASES[clase]
+if clase == 'uvicorn':
+    wsgi_app = 'DjangoProject.asgi:application'
+    os.environ.setdefault('VISTAS_ASYNC', 'true')
+    # Bajo ASGI las conexiones persistentes no se reutilizan entre peticiones
+    os.environ.setdefault('DB_CONN_MAX_AGE', '0')
+else:
+    wsgi_app = 'DjangoProject.wsgi:application'
+    os.environ.setdefault('DB_CONN_MAX_AGE', '60')
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = _entero('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1)
+if workers > 1 and not config('REDIS_URL', default='') and not _booleano('GUNICORN_CACHE_LOCAL', False):
+    # Las invalidaciones (árbol de cursos, permisos) y la idempotencia viven en
+    # la cache: en memoria de cada worker, los demás no las verían
+    raise RuntimeError("Con más de un worker se necesita REDIS_URL; o WEB_CONCURRENCY=1")
+if clase == 'gthread':
+    threads = _entero('GUNICORN_THREADS', 4)
+preload_app = _booleano('GUNICORN_PRELOAD', True)
+max_requests = _entero('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _entero('GUNICORN_MAX_REQUESTS_JITTER', 100)
+timeout = _entero('GUNICORN_TIMEOUT', 30)
+keepalive = _entero('GUNICORN_KEEPALIVE', 5)
+accesslog = os.environ.get('GUNICORN_ACCESSLOG') or None
+errorlog = '-'
+
+CALENTAR = _booleano('GUNICORN_CALENTAR', True)
+
+
+def when_ready(server):
+    # Con preload_app, lo que no depende de conexiones se calienta una vez en el master
+    if preload_app and CALENTAR:
+        from universidad.calentamiento import calentar
+        server.log.info("Master calentado: %s", calentar(conexiones=False))
+
+
+def pre_fork(server, worker):
+    # Lo importado con preload_app pasa a la generación permanente: el GC de los
+    # workers no lo recorre y las páginas siguen compartidas con el master
+    if preload_app:
+        gc.freeze()
+
+
+def _calentar(worker):
+    if CALENTAR:
+        from universidad.calentamiento import calentar
+        worker.log.info("Worker %s calentado: %s", worker.pid, calentar())
+
+
+def post_fork(server, worker):
+    # Con preload_app la app ya está cargada: calentar antes de aceptar tráfico
+    if preload_app:
+        _calentar(worker)
+
+
+def post_worker_init(worker):
+    # Sin preload_app la app se carga en el worker después del fork
+    if not preload_app:
+        _calentar(worker)
@@ -80,6 +80,7 @@ class AlumnoViewSet(viewsets.ModelViewSet):
     lookup_value_regex = r'\d+'
 
     permission_classes = [IsAuthenticated, IsAdminOnly]
+    throttle_scopes = {'create': 'registro'}
 
     def get_permissions(self):
         """
@@ -0,0 +1,226 @@
+"""
+Vistas asíncronas para servir con ASGI.
+
+Bajo ASGI, Django corre las vistas sincrónicas de DRF en un único hilo
+compartido (``sync_to_async(thread_sensitive=True)``): una petición que espera
+a la BD o al servicio de medios frena a las demás del mismo proceso. Estas
+vistas atienden las lecturas públicas del catálogo con el ORM asíncrono y
+suben el material de ``lecciones/lote/`` sin ocupar ese hilo.
+
+Con ``VISTAS_ASYNC = True`` se registran en ``universidad/urls.py`` antes
+que las rutas del router, con la misma URL y la misma respuesta. La vista
+DRF sigue siendo el respaldo para los demás métodos (POST /cursos/, ...),
+para ``?format=``, para ``?include=`` y para el navegador (API navegable).
+
+Las lecturas del catálogo son públicas (``AllowAny``) y no dependen del
+usuario, así que no se autentica: un token inválido no da 401 como en DRF.
+Sí se aplica el límite de peticiones (``universidad.limites``), con el rol
+del JWT validado sin buscar al usuario.
+"""
+import functools
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.urls import re_path
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import Throttled, ValidationError
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from universidad.apis.area_viewset import AreaSerializer, AreaViewSet
+from universidad.apis.condicional import Validadores, es_condicional
+from universidad.apis.curso_viewset import (
+    CursoDetailSerializer, CursoViewSet, DocentePublicSerializer, consulta_detalle,
+)
+from universidad.apis.leccion_viewset import LeccionViewSet
+from universidad.catalogo import leer_filtros, aplicar_filtros, contar_facetas
+from universidad.limites import alcance_de, apermitir, identificar
+from universidad.media import asubir_en_paralelo
+from universidad.models import Area, Curso, Docente
+from universidad.ranking import leer_orden, ordenar
+from universidad.renderers import FastJSONRenderer
+
+_renderer = FastJSONRenderer()
+
+
+def responder(data, status=200):
+    """Respuesta JSON con los mismos bytes que ``Response`` + ``FastJSONRenderer``."""
+    response = HttpResponse(_renderer.render(data), status=status, content_type='application/json')
+    patch_vary_headers(response, ('Accept',))
+    return response
+
+
+def _quiere_drf(request):
+    return (
+        api_settings.URL_FORMAT_OVERRIDE in request.GET
+        or 'include' in request.GET
+        or 'text/html' in request.META.get('HTTP_ACCEPT', '')
+    )
+
+
+def con_respaldo(vista, respaldo, metodos=('GET', 'HEAD'), alcance=None):
+    """
+    Atiende ``metodos`` con la vista asíncrona y el resto con la vista DRF ``respaldo``.
+    Con ``alcance`` aplica el mismo límite de peticiones que ``CubetaThrottle``.
+    """
+    @csrf_exempt
+    @functools.wraps(vista)
+    async def envoltura(request, *args, **kwargs):
+        if request.method not in metodos or _quiere_drf(request):
+            return await sync_to_async(respaldo)(request, *args, **kwargs)
+        if alcance is not None:
+            espera = await apermitir(alcance, *identificar(request))
+            if espera:
+                exc = Throttled(espera)
+                response = responder({'detail': exc.detail}, status=exc.status_code)
+                response['Retry-After'] = '%d' % exc.wait
+                return response
+        return await vista(request, *args, **kwargs)
+    return envoltura
+
+
+def iniciar_drf(viewset, accion, request, **kwargs):
+    """
+    La parte de ``APIView.dispatch`` previa al handler: negociación,
+    autenticación, permisos y throttling. Devuelve (vista, Response de error o None).
+    """
+    vista = viewset(action_map={request.method.lower(): accion}, detail=False)
+    vista.args, vista.kwargs = (), kwargs
+    vista.request = vista.initialize_request(request, **kwargs)
+    vista.headers = vista.default_response_headers
+    try:
+        vista.initial(vista.request, **kwargs)
+    except Exception as exc:
+        return vista, vista.handle_exception(exc)
+    return vista, None
+
+
+def finalizar_drf(vista, response):
+    return vista.finalize_response(vista.request, response).render()
+
+
+def _contexto(request):
+    return {'request': request, 'format': None, 'view': None}
+
+
+# --- CATÁLOGO ---
+async def cursos(request):
+    """GET /cursos/ con los mismos filtros y facetas que ``CursoViewSet.list``."""
+    try:
+        filtros = leer_filtros(request.GET)
+        orden = leer_orden(request.GET)
+    except ValidationError as exc:
+        return responder(exc.detail, status=400)
+    base = Curso.objects.all()
+    consulta = aplicar_filtros(base, filtros).select_related('area', 'docente__user')
+    consulta = ordenar(consulta, orden) if orden else consulta.order_by('id')
+    plan = CursoViewSet.plan_lectura
+
+    if request.GET.get('facetas', '').lower() not in ('true', '1'):
+        return responder(await plan.aserializar(consulta, _contexto(request)))
+
+    try:
+        pagina = max(int(request.GET.get('pagina', 1)), 1)
+        tamano = min(max(int(request.GET.get('tamano', 20)), 1), 100)
+    except ValueError:
+        return responder({"error": "'pagina' y 'tamano' deben ser números."}, status=400)
+
+    inicio = (pagina - 1) * tamano
+    return responder({
+        "total": await consulta.acount(),
+        "pagina": pagina,
+        "tamano": tamano,
+        "resultados": await plan.aserializar(consulta[inicio:inicio + tamano], _contexto(request)),
+        "facetas": await sync_to_async(contar_facetas)(base, filtros),
+    })
+
+
+async def detalle(request, pk):
+    # Mismo ETag que la vista DRF con FastJSONRenderer (formato 'json')
+    try:
+        if es_condicional(request):
+            modificado = await Curso.objects.filter(pk=pk).values_list('fecha_actualizacion', flat=True).afirst()
+            if modificado is None:
+                raise Curso.DoesNotExist
+            no_modificado = Validadores(modificado, 'detalle', pk, 'json').no_modificado(request)
+            if no_modificado is not None:
+                return no_modificado
+        curso = await consulta_detalle().aget(pk=pk)
+    except (Curso.DoesNotExist, ValueError):
+        return responder({"error": "Curso no existe."}, status=404)
+    # Todo viene precargado: serializar no toca la BD
+    validadores = Validadores(curso.fecha_actualizacion, 'detalle', pk, 'json')
+    return validadores.aplicar(responder(CursoDetailSerializer(curso).data))
+
+
+async def por_area(request, area_id):
+    try:
+        orden = leer_orden(request.GET)
+    except ValidationError as exc:
+        return responder(exc.detail, status=400)
+    consulta = Curso.objects.filter(area_id=area_id)
+    if orden:
+        consulta = ordenar(consulta, orden)
+    return responder(await CursoViewSet.plan_lectura.aserializar(consulta, _contexto(request)))
+
+
+async def cursos_docente(request, numero_registro):
+    try:
+        docente = await Docente.objects.select_related('user').aget(numero_registro=numero_registro)
+    except Docente.DoesNotExist:
+        return responder({"error": "No existe un docente con ese número de registro."}, status=404)
+    cursos_data = await CursoViewSet.plan_lectura.aserializar(
+        Curso.objects.filter(docente=docente), _contexto(request)
+    )
+    return responder({
+        "docente": DocentePublicSerializer(docente).data,
+        "cursos": cursos_data,
+    })
+
+
+async def areas(request):
+    lista = [area async for area in Area.objects.all()]
+    return responder(AreaSerializer(lista, many=True, context=_contexto(request)).data)
+
+
+# --- SUBIDAS ---
+async def lecciones_lote(request):
+    """
+    POST /lecciones/lote/: autenticación, validación e inserción corren en el
+    hilo de DRF; las subidas se esperan con ``asubir_en_paralelo``.
+    """
+    vista, response = await sync_to_async(iniciar_drf)(LeccionViewSet, 'lote', request)
+    if response is None:
+        try:
+            preparado = await sync_to_async(vista.preparar_lote)(vista.request)
+            if isinstance(preparado, Response):
+                response = preparado
+            else:
+                subidas = preparado[-1]
+                subidos = await asubir_en_paralelo([trabajo for _, trabajo in subidas])
+                response = await sync_to_async(vista.guardar_lote)(*preparado, subidos)
+        except Exception as exc:
+            response = await sync_to_async(vista.handle_exception)(exc)
+    return await sync_to_async(finalizar_drf)(vista, response)
+
+
+def rutas(respaldos):
+    """
+    Rutas asíncronas con las mismas expresiones que genera el router.
+    ``respaldos`` mapea el nombre de la ruta del router a su vista DRF.
+    """
+    def catalogo(vista, nombre, viewset, accion):
+        return con_respaldo(vista, respaldos[nombre], alcance=alcance_de(viewset, accion))
+
+    return [
+        re_path(r'^cursos/$', catalogo(cursos, 'curso-list', CursoViewSet, 'list')),
+        re_path(r'^cursos/(?P<pk>[^/.]+)/detalle/$', catalogo(detalle, 'curso-detalle', CursoViewSet, 'detalle')),
+        re_path(r'^cursos/por_area/(?P<area_id>[^/.]+)/$',
+                catalogo(por_area, 'curso-por-area', CursoViewSet, 'por_area')),
+        re_path(r'^cursos/docente/(?P<numero_registro>[^/.]+)/$',
+                catalogo(cursos_docente, 'curso-cursos-docente', CursoViewSet, 'cursos_docente')),
+        re_path(r'^areas/$', catalogo(areas, 'area-list', AreaViewSet, 'list')),
+        re_path(r'^lecciones/lote/$',
+                con_respaldo(lecciones_lote, respaldos['leccion-lote'], metodos=('POST',))),
+    ]
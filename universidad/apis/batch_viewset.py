@@ -0,0 +1,126 @@
+"""
+Varias lecturas de la API en una sola petición HTTP.
+
+    POST /batch/  {"peticiones": ["users/me/", "compras/", "cursos/?area=1", "areas/"], "paralelo": true}
+
+Cada ruta (relativa a ``/universidad/`` o absoluta) se resuelve contra las
+rutas del router y su vista DRF corre dentro del mismo proceso, como un GET
+con el usuario y el token de esta petición: el JWT se valida una sola vez y
+todas comparten el mismo objeto usuario, con la cache de permisos que
+``PermisosCacheadosBackend`` guarda en él y sus grupos (el rol) precargados.
+Cada una pasa igual por permisos y límite de peticiones, y su error queda
+en su propia respuesta. Con ``paralelo`` corren en un pool de ``HILOS``.
+
+La respuesta trae una entrada por ruta, en el mismo orden:
+``{"url", "status", "body"}``.
+"""
+import copy
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import prefetch_related_objects
+from django.http import QueryDict
+from django.urls import Resolver404, reverse
+from django.urls.resolvers import RegexPattern, URLResolver
+from rest_framework import viewsets
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'MAX_PETICIONES': 10,
+    'HILOS': 4,
+}
+
+# Lo que describe el cuerpo o las condiciones del POST original, no de cada GET
+META_EXCLUIDOS = ('CONTENT_LENGTH', 'CONTENT_TYPE', 'HTTP_IDEMPOTENCY_KEY')
+
+_resolver = None
+
+
+def configuracion():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'BATCH', {}))
+    return config
+
+
+def resolver():
+    """Rutas del router (sin las vistas asíncronas de ``VISTAS_ASYNC``)."""
+    global _resolver
+    if _resolver is None:
+        from universidad.urls import router
+
+        _resolver = URLResolver(RegexPattern(r'^'), [ruta for ruta in router.urls if ruta.name != 'batch-list'])
+    return _resolver
+
+
+def _subpeticion(request, ruta, consulta):
+    """Copia del request de Django como GET a ``ruta``, autenticado como el original."""
+    sub = copy.copy(request._request)
+    sub.method = 'GET'
+    sub.path = sub.path_info = ruta
+    sub.GET = QueryDict(consulta)
+    sub.META = {
+        clave: valor for clave, valor in request.META.items()
+        if clave not in META_EXCLUIDOS and not clave.startswith('HTTP_IF_')
+    }
+    sub.META.update(REQUEST_METHOD='GET', PATH_INFO=ruta, QUERY_STRING=consulta)
+    if request.user.is_authenticated:
+        # DRF usa ForcedAuthentication con estos atributos: no se vuelve a validar el JWT
+        sub._force_auth_user = request.user
+        sub._force_auth_token = request.auth
+    return sub
+
+
+class BatchViewSet(viewsets.ViewSet):
+
+    def create(self, request):
+        config = configuracion()
+        urls = request.data.get('peticiones') if isinstance(request.data, dict) else None
+        if not isinstance(urls, list) or not urls or not all(isinstance(url, str) for url in urls):
+            return Response({"error": "'peticiones' debe ser una lista de rutas."}, status=400)
+        if len(urls) > config['MAX_PETICIONES']:
+            return Response({"error": f"Máximo {config['MAX_PETICIONES']} peticiones por lote."}, status=400)
+
+        if request.user.is_authenticated:
+            # UserSerializer.get_role y otras lecturas del rol usan los grupos ya cargados
+            prefetch_related_objects([request.user], 'groups')
+
+        raiz = reverse('batch-list')[:-len('batch/')]
+        trabajos = [(request, raiz, url) for url in urls]
+        paralelo = request.data.get('paralelo') in (True, 'true', '1') and len(urls) > 1
+        if paralelo:
+            with ThreadPoolExecutor(max_workers=min(config['HILOS'], len(urls))) as pool:
+                respuestas = list(pool.map(self._ejecutar_en_hilo, trabajos))
+        else:
+            respuestas = [self._ejecutar(*trabajo) for trabajo in trabajos]
+        return Response({"respuestas": respuestas})
+
+    def _ejecutar_en_hilo(self, trabajo):
+        try:
+            return self._ejecutar(*trabajo)
+        finally:
+            # Cada hilo del pool abre su propia conexión: cerrarla al terminar
+            connections.close_all()
+
+    def _ejecutar(self, request, raiz, url):
+        partes = urlsplit(url)
+        ruta = partes.path if partes.path.startswith('/') else raiz + partes.path
+        if not ruta.startswith(raiz):
+            return {"url": url, "status": 404, "body": {"error": "Ruta no encontrada."}}
+        try:
+            coincidencia = resolver().resolve(ruta[len(raiz):])
+        except Resolver404:
+            return {"url": url, "status": 404, "body": {"error": "Ruta no encontrada."}}
+
+        try:
+            response = coincidencia.func(_subpeticion(request, ruta, partes.query), *coincidencia.args,
+                                         **coincidencia.kwargs)
+        except Exception:
+            logger.exception("Falló la petición %s del lote", url)
+            return {"url": url, "status": 500, "body": {"error": "Error interno."}}
+        body = response.data if hasattr(response, 'data') else response.content.decode()
+        return {"url": url, "status": response.status_code, "body": body}
@@ -1,9 +1,17 @@
+from operator import attrgetter
+
+from django.db import IntegrityError, transaction
 from rest_framework import serializers, viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, DjangoModelPermissions, BasePermission
 from rest_framework.response import Response
 
 from universidad.apis.curso_viewset import CursoDetailFullSerializer
+from universidad.apis.condicional import Validadores, es_condicional
+from universidad.apis.idempotencia import idempotente
+from universidad.apis.lectura_rapida import LecturaRapidaMixin, PlanLectura
+from universidad.cache import arbol_curso
+from universidad.eventos import publicar
 from universidad.models import Compra, Curso
 
 # Importamos el serializer completo del curso
@@ -34,7 +42,12 @@ class CompraSerializer(serializers.ModelSerializer):
     curso_detalle = CursoResumenSerializer(source='curso', read_only=True)
     class Meta:
         model = Compra
-        fields = '__all__'
+        exclude = ['en_ranking']  # contabilidad interna del ranking (universidad.ranking)
+
+
+# Lo que cambia el detalle de una compra además de la fecha del curso
+COLUMNAS_VERSION = ('es_trial', 'curso_id', 'alumno_id', 'alumno__nombre_completo', 'fecha_compra')
+_valores_version = attrgetter(*(columna.replace('__', '.') for columna in COLUMNAS_VERSION))
 
 
 # ------------------- PERMISO CUSTOM -------------------
@@ -47,9 +60,11 @@ class PuedeComprar(BasePermission):
 
 
 # ------------------- VIEWSET -------------------
-class CompraViewSet(viewsets.ModelViewSet):
+class CompraViewSet(LecturaRapidaMixin, viewsets.ModelViewSet):
     queryset = Compra.objects.all()
     serializer_class = CompraSerializer
+    plan_lectura = PlanLectura(CompraSerializer)
+    acciones_lectura_rapida = ('list',)
 
     # ------------------- PERMISOS -------------------
     def get_permissions(self):
@@ -70,12 +85,18 @@ class CompraViewSet(viewsets.ModelViewSet):
         Admin ve todas las compras, otros solo las suyas
         """
         user = self.request.user
+        compras = Compra.objects.select_related('alumno', 'curso__area', 'curso__docente')
         if user.is_staff:
-            return Compra.objects.all()
-        return Compra.objects.filter(alumno=user)
+            return compras
+        return compras.filter(alumno=user)
+
+    # ------------------- LIST -------------------
+    def list(self, request, *args, **kwargs):
+        return Response(self.serializar_lista(self.get_queryset().order_by('id')))
 
     # ------------------- COMPRAR VARIOS -------------------
     @action(detail=False, methods=['post'], url_path='comprar-varios')
+    @idempotente('comprar-varios')
     def comprar_varios(self, request):
         alumno = request.user
         curso_ids = request.data.get('curso_ids', [])
@@ -98,7 +119,17 @@ class CompraViewSet(viewsets.ModelViewSet):
                 errores.append(f"Curso {curso.nombre} ya comprado")
                 continue
 
-            compra = Compra.objects.create(alumno=alumno, curso=curso, es_trial=es_trial)
+            try:
+                with transaction.atomic():
+                    compra = Compra.objects.create(alumno=alumno, curso=curso, es_trial=es_trial)
+                    # Recibo, aviso al docente y analítica: los procesa `procesar_eventos`
+                    publicar('compra.creada', {
+                        'compra': compra.pk, 'alumno': alumno.pk, 'curso': curso.pk, 'es_trial': bool(es_trial),
+                    })
+            except IntegrityError:
+                # Otra petición lo compró entre el exists() y el create()
+                errores.append(f"Curso {curso.nombre} ya comprado")
+                continue
             compras_creadas.append(compra)
 
         serializer = self.get_serializer(compras_creadas, many=True)
@@ -113,16 +144,30 @@ class CompraViewSet(viewsets.ModelViewSet):
         GET /compras/<id>/
         - es_trial=True → info limitada de la compra
         - es_trial=False → detalle completo del curso (todas las secciones y lecciones)
+        Con If-None-Match / If-Modified-Since responde 304 con una sola consulta.
         """
+        pk, formato = kwargs['pk'], request.accepted_renderer.format
+        if es_condicional(request):
+            fila = self.get_queryset().filter(pk=pk).values_list('curso__fecha_actualizacion', *COLUMNAS_VERSION).first()
+            if fila is not None:
+                no_modificado = Validadores(fila[0], 'compra', pk, formato, *fila[1:], privado=True).no_modificado(request)
+                if no_modificado is not None:
+                    return no_modificado
+
         compra = self.get_object()
+        validadores = Validadores(
+            compra.curso.fecha_actualizacion, 'compra', pk, formato, *_valores_version(compra), privado=True
+        )
 
         if compra.es_trial:
             # Solo info básica de la compra
             serializer = CompraSerializer(compra)
-            return Response(serializer.data)
+            return validadores.aplicar(Response(serializer.data))
         else:
-            # Info completa del curso
-            curso_serializer = CursoDetailFullSerializer(compra.curso, context={'request': request})
+            # Info completa del curso (igual para todos los compradores → cache por curso y versión)
             data = CompraSerializer(compra).data
-            data['curso_detalle_completo'] = curso_serializer.data
-            return Response(data)
+            data['curso_detalle_completo'] = arbol_curso(
+                compra.curso_id,
+                lambda: CursoDetailFullSerializer(compra.curso, context={'request': request}).data
+            )
+            return validadores.aplicar(Response(data))
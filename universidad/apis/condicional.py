@@ -0,0 +1,46 @@
+"""
+GET condicionales (``If-None-Match`` / ``If-Modified-Since``) en los detalles.
+
+Las respuestas de detalle de un curso cambian solo cuando cambia su
+``fecha_actualizacion``, que sube desde secciones y lecciones
+(``universidad.catalogo.actualizacion``). El ETag se arma con esa fecha y lo
+que distinga a la representación (endpoint, id, formato), así que para
+responder 304 alcanza con leer esa columna por clave primaria: no se carga
+el árbol ni se serializa nada.
+
+Los ETag son débiles: la compresión cambia los bytes, no el contenido. Se
+envía ``Cache-Control: no-cache`` para que el cliente guarde la respuesta
+pero la revalide en cada visita.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def es_condicional(request):
+    """True si el cliente trae una versión guardada que se puede validar."""
+    return 'HTTP_IF_NONE_MATCH' in request.META or 'HTTP_IF_MODIFIED_SINCE' in request.META
+
+
+class Validadores:
+    """ETag y Last-Modified de una representación que cambia con ``modificado``."""
+
+    def __init__(self, modificado, *partes, privado=False):
+        self.modificado = modificado
+        clave = '|'.join(str(parte) for parte in (modificado.isoformat(), *partes))
+        self.etag = 'W/"%s"' % hashlib.blake2b(clave.encode(), digest_size=12).hexdigest()
+        self.privado = privado
+
+    def no_modificado(self, request):
+        """La respuesta 304 (o 412) si la versión del cliente sigue vigente; si no, None."""
+        response = get_conditional_response(
+            request, etag=self.etag, last_modified=int(self.modificado.timestamp())
+        )
+        return self.aplicar(response) if response is not None else None
+
+    def aplicar(self, response):
+        response['ETag'] = self.etag
+        response['Last-Modified'] = http_date(self.modificado.timestamp())
+        response['Cache-Control'] = 'private, no-cache' if self.privado else 'no-cache'
+        return response
@@ -3,7 +3,18 @@ from rest_framework.permissions import IsAuthenticated, DjangoModelPermissions,
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
-from universidad.models import Curso, Docente, Seccion, Leccion
+from universidad.busqueda import buscar_cursos
+from universidad.catalogo import leer_filtros, aplicar_filtros, contar_facetas, clonar_curso
+from universidad.apis.area_viewset import AreaSerializer
+from universidad.apis.condicional import Validadores, es_condicional
+from universidad.apis.inclusion import Inclusiones, Relacion
+from universidad.apis.leccion_viewset import LeccionSerializer as LeccionEdicionSerializer
+from universidad.apis.lectura_rapida import LecturaRapidaMixin, PlanLectura
+from universidad.apis.seccion_viewset import SeccionSerializer as SeccionEdicionSerializer
+from universidad.cache import arbol_curso
+from universidad.cache.permisos import rol_usuario
+from universidad.ranking import leer_orden, ordenar
+from universidad.models import Curso, CursoRelacionado, Docente, Seccion, Leccion
 
 
 # --- SERIALIZERS ---
@@ -21,7 +32,7 @@ class SeccionSerializer(serializers.ModelSerializer):
         fields = ['id', 'nombre', 'descripcion', 'lecciones']
 
     def get_lecciones(self, obj):
-        first_section = obj.curso.secciones.order_by('id').first()
+        first_section = obj.curso.secciones.first()
         if obj == first_section:
             return LeccionSerializer(obj.lecciones.all(), many=True).data
         else:
@@ -109,14 +120,41 @@ class DocentePublicSerializer(serializers.ModelSerializer):
         fields = ['nombre_completo', 'descripcion', 'numero_registro', 'photo_profile', 'email']
 
 
+class ClonarCursoSerializer(serializers.Serializer):
+    nombre = serializers.CharField(
+        max_length=Curso._meta.get_field('nombre').max_length, required=False, allow_null=True, allow_blank=True
+    )
+
+
+def consulta_detalle():
+    """Cursos con todo lo que lee ``CursoDetailSerializer``: serializarlos no hace más consultas."""
+    return Curso.objects.select_related('area', 'docente__user').prefetch_related('secciones__lecciones')
+
+
 # --- VIEWSET ---
-class CursoViewSet(viewsets.ModelViewSet):
+class CursoViewSet(LecturaRapidaMixin, viewsets.ModelViewSet):
     queryset = Curso.objects.all()
     serializer_class = CursoSerializer
     permission_classes = [IsAuthenticated, DjangoModelPermissions]
+    plan_lectura = PlanLectura(CursoSerializer)
+    acciones_lectura_rapida = ('list', 'mis_cursos', 'por_area', 'cursos_docente', 'relacionados')
+    # Los relacionados se leen desde CursoRelacionado con las columnas del curso vecino
+    plan_relacionados = PlanLectura(CursoSerializer, prefijo='relacionado__')
+    # Lecturas públicas del catálogo: límite propio para frenar scraping (universidad.limites)
+    throttle_scopes = {
+        accion: 'catalogo'
+        for accion in ('list', 'detalle', 'por_area', 'cursos_docente', 'buscar', 'relacionados')
+    }
+    # ?include= en list y retrieve, con lo mismo que devuelven los endpoints de cada relación
+    inclusiones = Inclusiones({
+        'area': Relacion(AreaSerializer),
+        'docente': Relacion(DocentePublicSerializer, cargar=('user',)),
+        'secciones': Relacion(SeccionEdicionSerializer, muchos=True),
+        'secciones.lecciones': Relacion(LeccionEdicionSerializer, muchos=True),
+    })
 
     def get_permissions(self):
-        if self.action in ['list', 'detalle', 'por_area', 'cursos_docente']:
+        if self.action in ['list', 'detalle', 'por_area', 'cursos_docente', 'buscar', 'relacionados']:
             return [AllowAny()]
         elif self.action in ['mis_cursos', 'detalle_docente']:
             return [IsAuthenticated()]
@@ -129,6 +167,78 @@ class CursoViewSet(viewsets.ModelViewSet):
             raise PermissionDenied("El usuario autenticado no es un docente.")
         serializer.save(docente=docente)
 
+    def list(self, request, *args, **kwargs):
+        """
+        GET /cursos/?area=1,2&docente=<numero_registro>&certificable=true&modo_prueba=false&precio_min=0&precio_max=100
+        Con ?facetas=true la respuesta incluye el total, la página pedida
+        (pagina, tamano) y los conteos por faceta.
+        Con ?orden=popular|tendencia los cursos salen del ranking, del primero al último.
+        Con ?include=secciones,secciones.lecciones,docente,area cada curso trae esas relaciones.
+        """
+        filtros = leer_filtros(request.query_params)
+        orden = leer_orden(request.query_params)
+        pedidas = self.inclusiones.leer(request.query_params)
+        base = Curso.objects.all()
+        cursos = aplicar_filtros(base, filtros).select_related('area', 'docente__user')
+        cursos = ordenar(cursos, orden) if orden else cursos.order_by('id')
+
+        if request.query_params.get('facetas', '').lower() not in ('true', '1'):
+            return Response(self.serializar_incluyendo(cursos, pedidas))
+
+        try:
+            pagina = max(int(request.query_params.get('pagina', 1)), 1)
+            tamano = min(max(int(request.query_params.get('tamano', 20)), 1), 100)
+        except ValueError:
+            return Response({"error": "'pagina' y 'tamano' deben ser números."}, status=400)
+
+        inicio = (pagina - 1) * tamano
+        return Response({
+            "total": cursos.count(),
+            "pagina": pagina,
+            "tamano": tamano,
+            "resultados": self.serializar_incluyendo(cursos[inicio:inicio + tamano], pedidas),
+            "facetas": contar_facetas(base, filtros),
+        })
+
+    def retrieve(self, request, *args, **kwargs):
+        """GET /cursos/<id>/?include=secciones,secciones.lecciones,docente,area"""
+        pedidas = self.inclusiones.leer(request.query_params)
+        if not pedidas:
+            return super().retrieve(request, *args, **kwargs)
+        try:
+            cursos = Curso.objects.filter(pk=int(kwargs['pk']))
+        except ValueError:
+            return Response({"error": "Curso no existe."}, status=404)
+        datos = self.serializar_incluyendo(cursos, pedidas)
+        if not datos:
+            return Response({"error": "Curso no existe."}, status=404)
+        return Response(datos[0])
+
+    def serializar_incluyendo(self, cursos, pedidas):
+        """Cursos con las relaciones de ``?include=``; sin ninguna, la ruta de lectura habitual."""
+        if not pedidas:
+            return self.serializar_lista(cursos)
+        cursos = list(self.inclusiones.cargar(cursos.select_related('area', 'docente__user'), pedidas))
+        contexto = self.get_serializer_context()
+        datos = CursoSerializer(cursos, many=True, context=contexto).data
+        self.inclusiones.agregar(cursos, datos, pedidas, contexto)
+        if 'secciones.lecciones' in pedidas:
+            self.ocultar_material(cursos, datos)
+        return datos
+
+    def ocultar_material(self, cursos, datos):
+        # Como en `detalle`: salvo para su docente (y los administradores), solo la primera
+        # sección trae material. No alcanza con is_staff: todos los docentes lo tienen
+        usuario = self.request.user
+        if usuario.is_authenticated and rol_usuario(usuario) == 'Administrador':
+            return
+        for curso, fila in zip(cursos, datos):
+            if curso.docente is not None and curso.docente.user_id == usuario.pk:
+                continue
+            for seccion in fila['secciones'][1:]:
+                for leccion in seccion['lecciones']:
+                    leccion['material'] = None
+
     def perform_update(self, serializer):
         curso = self.get_object()
         try:
@@ -155,20 +265,53 @@ class CursoViewSet(viewsets.ModelViewSet):
         except Docente.DoesNotExist:
             raise PermissionDenied("El usuario autenticado no es un docente.")
         cursos = Curso.objects.filter(docente=docente)
-        serializer = self.get_serializer(cursos, many=True)
-        return Response(serializer.data)
+        return Response(self.serializar_lista(cursos))
 
     @action(detail=True, methods=['get'], permission_classes=[AllowAny])
     def detalle(self, request, pk=None):
+        """Con If-None-Match / If-Modified-Since responde 304 leyendo solo la fecha del curso."""
+        formato = request.accepted_renderer.format
+        if es_condicional(request):
+            modificado = Curso.objects.filter(pk=pk).values_list('fecha_actualizacion', flat=True).first()
+            if modificado is None:
+                return Response({"error": "Curso no existe."}, status=404)
+            no_modificado = Validadores(modificado, 'detalle', pk, formato).no_modificado(request)
+            if no_modificado is not None:
+                return no_modificado
         try:
-            curso = Curso.objects.get(pk=pk)
+            curso = consulta_detalle().get(pk=pk)
         except Curso.DoesNotExist:
             return Response({"error": "Curso no existe."}, status=404)
         serializer = CursoDetailSerializer(curso)
-        return Response(serializer.data)
+        return Validadores(curso.fecha_actualizacion, 'detalle', pk, formato).aplicar(Response(serializer.data))
 
     @action(detail=True, methods=['get'], permission_classes=[IsAuthenticated])
     def detalle_docente(self, request, pk=None):
+        # Fecha y dueño en una consulta; el árbol se arma (o sale de la cache) solo si hace falta
+        fila = Curso.objects.filter(pk=pk).values_list('fecha_actualizacion', 'docente__user_id').first()
+        if fila is None:
+            return Response({"error": "Curso no existe."}, status=404)
+        modificado, dueno = fila
+        if dueno != request.user.pk:
+            try:
+                request.user.docente_profile
+            except Docente.DoesNotExist:
+                raise PermissionDenied("El usuario autenticado no es un docente.")
+            raise PermissionDenied("No puedes acceder a cursos de otros docentes.")
+
+        validadores = Validadores(modificado, 'detalle_docente', pk, request.accepted_renderer.format, privado=True)
+        no_modificado = validadores.no_modificado(request)
+        if no_modificado is not None:
+            return no_modificado
+        datos = arbol_curso(int(pk), lambda: CursoDetailFullSerializer(Curso.objects.get(pk=pk)).data)
+        return validadores.aplicar(Response(datos))
+
+    @action(detail=True, methods=['post'])
+    def clonar(self, request, pk=None):
+        """
+        POST /cursos/<id>/clonar/  {"nombre": "<opcional>"}
+        Crea una nueva edición del curso con todas sus secciones y lecciones.
+        """
         try:
             curso = Curso.objects.get(pk=pk)
         except Curso.DoesNotExist:
@@ -178,16 +321,57 @@ class CursoViewSet(viewsets.ModelViewSet):
         except Docente.DoesNotExist:
             raise PermissionDenied("El usuario autenticado no es un docente.")
         if curso.docente != docente:
-            raise PermissionDenied("No puedes acceder a cursos de otros docentes.")
-        serializer = CursoDetailFullSerializer(curso)
-        return Response(serializer.data)
+            raise PermissionDenied("No puedes clonar cursos de otros docentes.")
+
+        serializer = ClonarCursoSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        clon = clonar_curso(curso, docente, nombre=serializer.validated_data.get('nombre'))
+        return Response(CursoDetailFullSerializer(clon).data, status=201)
 
     @action(detail=False, methods=['get'], url_path='por_area/(?P<area_id>[^/.]+)', permission_classes=[AllowAny])
     def por_area(self, request, area_id=None):
+        """GET /cursos/por_area/<id>/?orden=popular|tendencia"""
+        orden = leer_orden(request.query_params)
         cursos = Curso.objects.filter(area_id=area_id)
-        serializer = self.get_serializer(cursos, many=True)
+        if orden:
+            # Los cursos sin compras no tienen fila en el ranking: salen al final
+            cursos = ordenar(cursos, orden)
+        return Response(self.serializar_lista(cursos))
+
+    @action(detail=False, methods=['get'], permission_classes=[AllowAny])
+    def buscar(self, request):
+        """
+        GET /cursos/buscar/?q=<texto>&limite=<n>
+        Busca en curso, área, docente, secciones y lecciones; resultados ordenados por relevancia.
+        """
+        consulta = request.query_params.get('q', '').strip()
+        if not consulta:
+            return Response({"error": "Debe enviar el parámetro 'q'."}, status=400)
+        try:
+            limite = min(max(int(request.query_params.get('limite', 20)), 1), 100)
+        except ValueError:
+            return Response({"error": "El parámetro 'limite' debe ser un número."}, status=400)
+
+        ids = buscar_cursos(consulta, limite)
+        cursos = Curso.objects.filter(id__in=ids).select_related('area', 'docente__user').in_bulk()
+        serializer = self.get_serializer([cursos[i] for i in ids if i in cursos], many=True)
         return Response(serializer.data)
 
+    @action(detail=True, methods=['get'], permission_classes=[AllowAny])
+    def relacionados(self, request, pk=None):
+        """
+        GET /cursos/<id>/relacionados/
+        Cursos que también compraron quienes compraron este, del más al menos parecido.
+        """
+        try:
+            relacionados = CursoRelacionado.objects.filter(curso_id=int(pk)).order_by('posicion')
+        except ValueError:
+            return Response({"error": "Curso no existe."}, status=404)
+        datos = self.serializar_lista(relacionados, plan=self.plan_relacionados)
+        if not datos and not Curso.objects.filter(pk=pk).exists():
+            return Response({"error": "Curso no existe."}, status=404)
+        return Response(datos)
+
     @action(detail=False, methods=['get'], url_path='docente/(?P<numero_registro>[^/.]+)', permission_classes=[AllowAny])
     def cursos_docente(self, request, numero_registro=None):
         try:
@@ -196,7 +380,7 @@ class CursoViewSet(viewsets.ModelViewSet):
             return Response({"error": "No existe un docente con ese número de registro."}, status=404)
         docente_data = DocentePublicSerializer(docente).data
         cursos = Curso.objects.filter(docente=docente)
-        cursos_data = self.get_serializer(cursos, many=True).data
+        cursos_data = self.serializar_lista(cursos)
         return Response({
             "docente": docente_data,
             "cursos": cursos_data
@@ -0,0 +1,107 @@
+"""
+Soporte de ``Idempotency-Key`` para acciones POST.
+
+La primera petición con una clave reserva la clave en la cache compartida
+(``cache.add`` es atómico) y, al terminar, guarda el status y los datos de la
+respuesta por ``TTL`` segundos. Un reintento con la misma clave devuelve esa
+respuesta sin volver a ejecutar la vista. Si llega mientras la primera sigue
+en curso, espera a que termine; si pasa ``ESPERA`` sin respuesta, devuelve 409.
+
+La clave se guarda junto con una huella del cuerpo: la misma clave con otro
+cuerpo es un error del cliente (422). Las respuestas 5xx y 409 no se guardan,
+así un reintento vuelve a ejecutar la vista.
+
+La reserva es atómica entre workers solo si la cache es Redis: en la memoria
+local de cada proceso, un reintento que cae en otro worker vuelve a ejecutar.
+
+    IDEMPOTENCIA = {
+        'TTL': 24 * 60 * 60,   # segundos que se recuerda una respuesta
+        'ESPERA': 10,          # segundos que espera un reintento concurrente
+        'BLOQUEO': 60,         # vida máxima de la reserva si el proceso muere
+    }
+"""
+import functools
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+HEADER = 'HTTP_IDEMPOTENCY_KEY'
+LARGO_MAXIMO = 255
+PREFIJO = 'idempotencia'
+EN_CURSO = 'en_curso'
+
+DEFAULTS = {'TTL': 24 * 60 * 60, 'ESPERA': 10, 'BLOQUEO': 60}
+
+
+def _configuracion():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'IDEMPOTENCIA', {}))
+    return config
+
+
+def _huella(request):
+    cuerpo = json.dumps(request.data, sort_keys=True, default=str).encode()
+    return hashlib.sha256(request.path.encode() + b'\0' + cuerpo).hexdigest()
+
+
+def _repetir(guardado):
+    response = Response(guardado['data'], status=guardado['status'])
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def idempotente(ambito):
+    """
+    Decorador para acciones de un ViewSet. ``ambito`` separa las claves de
+    distintos endpoints; además se separan por usuario autenticado.
+    """
+    def decorador(vista):
+        @functools.wraps(vista)
+        def envoltura(self, request, *args, **kwargs):
+            clave_cliente = request.META.get(HEADER)
+            if not clave_cliente:
+                return vista(self, request, *args, **kwargs)
+            if len(clave_cliente) > LARGO_MAXIMO:
+                return Response({"error": "Idempotency-Key demasiado larga"}, status=status.HTTP_400_BAD_REQUEST)
+
+            config = _configuracion()
+            usuario = request.user.pk if request.user.is_authenticated else 'anonimo'
+            digest = hashlib.sha256(clave_cliente.encode()).hexdigest()
+            clave = f'{PREFIJO}:{ambito}:{usuario}:{digest}'
+            huella = _huella(request)
+
+            limite = time.monotonic() + config['ESPERA']
+            while not cache.add(clave, {'estado': EN_CURSO, 'huella': huella}, timeout=config['BLOQUEO']):
+                guardado = cache.get(clave)
+                if guardado is None:
+                    continue  # expiró entre add y get: volver a intentar la reserva
+                if guardado['huella'] != huella:
+                    return Response({"error": "La Idempotency-Key ya se usó con otros datos"},
+                                    status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+                if guardado['estado'] != EN_CURSO:
+                    return _repetir(guardado)
+                if time.monotonic() >= limite:
+                    return Response({"error": "Hay una solicitud en curso con la misma Idempotency-Key"},
+                                    status=status.HTTP_409_CONFLICT)
+                time.sleep(0.05)
+
+            try:
+                response = vista(self, request, *args, **kwargs)
+            except Exception:
+                cache.delete(clave)
+                raise
+            if response.status_code >= 500 or response.status_code == status.HTTP_409_CONFLICT:
+                cache.delete(clave)
+            else:
+                cache.set(clave, {
+                    'estado': 'hecho', 'huella': huella,
+                    'status': response.status_code, 'data': response.data,
+                }, timeout=config['TTL'])
+            return response
+        return envoltura
+    return decorador
@@ -0,0 +1,91 @@
+"""
+Recursos compuestos con ``?include=`` (al estilo JSON:API).
+
+``?include=secciones,secciones.lecciones,docente,area`` agrega a cada objeto
+las relaciones pedidas, serializadas igual que en sus propios endpoints, así
+el cliente no tiene que pedirlas una por una. Una relación a uno reemplaza
+su id por el objeto (``"area": 3`` → ``"area": {...}``); una a muchos agrega
+la lista. Pedir ``secciones.lecciones`` incluye también ``secciones``.
+
+Las relaciones se cargan con a lo sumo un ``select_related`` (las que son a
+uno desde el objeto principal) y un ``prefetch_related`` con las rutas más
+largas: el número de consultas depende de qué se incluye, no de cuántos
+objetos hay (``benchmarks/bench_include.py``).
+"""
+from rest_framework.exceptions import ValidationError
+
+
+class Relacion:
+    def __init__(self, serializer_class, muchos=False, cargar=()):
+        """``cargar``: rutas bajo la relación que también lee su serializer (p. ej. ``'user'``)."""
+        self.serializer_class = serializer_class
+        self.muchos = muchos
+        self.cargar = cargar
+
+
+def _padre(ruta):
+    return ruta.rpartition('.')[0]
+
+
+def _sin_prefijos(rutas):
+    """Quita las rutas contenidas en otra más larga: Django ya las recorre."""
+    return sorted(r for r in set(rutas) if not any(o.startswith(r + '__') for o in rutas))
+
+
+class Inclusiones:
+    """Relaciones que una vista acepta en ``?include=``, por ruta con puntos."""
+
+    def __init__(self, relaciones):
+        self.relaciones = relaciones
+
+    def leer(self, params):
+        """Valida ``?include=``; devuelve las rutas pedidas con sus intermedias (vacío si no hay)."""
+        pedidas = set()
+        for ruta in params.get('include', '').split(','):
+            ruta = ruta.strip()
+            if not ruta:
+                continue
+            if ruta not in self.relaciones:
+                raise ValidationError({'include': f"Debe ser una lista de: {', '.join(self.relaciones)}."})
+            while ruta:
+                pedidas.add(ruta)
+                ruta = _padre(ruta)
+        return pedidas
+
+    def cargar(self, queryset, pedidas):
+        """Agrega al queryset el select_related / prefetch_related mínimo para ``pedidas``."""
+        unir, precargar = [], []
+        for ruta in pedidas:
+            relacion = self.relaciones[ruta]
+            orm = ruta.replace('.', '__')
+            rutas = [orm, *(f'{orm}__{extra}' for extra in relacion.cargar)]
+            # Lo que cuelga de una relación a muchos no se puede unir con un JOIN
+            partes = ruta.split('.')
+            ancestros = ['.'.join(partes[:i]) for i in range(1, len(partes) + 1)]
+            if any(self.relaciones[a].muchos for a in ancestros):
+                precargar.extend(rutas)
+            else:
+                unir.extend(rutas)
+        if unir:
+            queryset = queryset.select_related(*_sin_prefijos(unir))
+        if precargar:
+            queryset = queryset.prefetch_related(*_sin_prefijos(precargar))
+        return queryset
+
+    def agregar(self, objetos, datos, pedidas, context, base=''):
+        """Agrega a ``datos`` (un dict por objeto, en el mismo orden) las relaciones pedidas bajo ``base``."""
+        hijas = [ruta for ruta in sorted(pedidas) if _padre(ruta) == base]
+        for ruta in hijas:
+            relacion = self.relaciones[ruta]
+            atributo = ruta.rpartition('.')[2]
+            for objeto, fila in zip(objetos, datos):
+                if relacion.muchos:
+                    relacionados = list(getattr(objeto, atributo).all())
+                    valor = relacion.serializer_class(relacionados, many=True, context=context).data
+                else:
+                    relacionado = getattr(objeto, atributo)
+                    relacionados = [relacionado] if relacionado is not None else []
+                    valor = relacion.serializer_class(relacionado, context=context).data if relacionados else None
+                self.agregar(relacionados, valor if relacion.muchos else [valor], pedidas, context, base=ruta)
+                fila[atributo] = valor
+        return datos
@@ -1,6 +1,20 @@
+import json
+
+from django.db import transaction
+from django.db.models import Max
 from rest_framework import serializers, viewsets
 from rest_framework.permissions import IsAuthenticated, DjangoModelPermissions
-from universidad.models import Leccion
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.exceptions import PermissionDenied
+from universidad.apis.reordenar import aplicar_orden
+from universidad.busqueda import programar_reindexado
+from universidad.cache import invalidar_curso
+from universidad.catalogo import tocar_seccion
+from universidad.media import es_pdf, subir_en_paralelo
+from universidad.models import Leccion, Seccion, Docente
+
+MAX_LECCIONES_LOTE = 100
 
 class LeccionSerializer(serializers.ModelSerializer):
     seccion_nombre = serializers.CharField(source='seccion.nombre', read_only=True)
@@ -9,6 +23,7 @@ class LeccionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Leccion
         fields = '__all__'
+        read_only_fields = ['orden']  # Leccion.save la pone al final; se cambia con /reordenar/
 
     def to_representation(self, instance):
         ret = super().to_representation(instance)
@@ -26,3 +41,130 @@ class LeccionViewSet(viewsets.ModelViewSet):
     queryset = Leccion.objects.all()
     serializer_class = LeccionSerializer
     permission_classes = [IsAuthenticated, DjangoModelPermissions]
+
+    # 🔹 Endpoint personalizado: reordenar todas las lecciones de una sección
+    @action(detail=False, methods=['post'])
+    def reordenar(self, request):
+        """
+        POST /lecciones/reordenar/  {"seccion": <id>, "orden": [<id_leccion>, ...]}
+        Recibe el orden completo de las lecciones de la sección.
+        """
+        try:
+            docente = request.user.docente_profile
+        except Docente.DoesNotExist:
+            raise PermissionDenied("El usuario autenticado no es un docente.")
+        try:
+            seccion = Seccion.objects.select_related('curso').get(id=request.data.get('seccion'))
+        except (Seccion.DoesNotExist, ValueError, TypeError):
+            return Response({"error": "La sección no existe."}, status=404)
+        if seccion.curso.docente_id != docente.id:
+            raise PermissionDenied("No puedes reordenar lecciones de cursos que no te pertenecen.")
+
+        error = aplicar_orden(Leccion.objects.filter(seccion=seccion), request.data.get('orden'))
+        if error:
+            return Response({"error": error}, status=400)
+        # bulk_update no dispara señales
+        invalidar_curso(seccion.curso_id)
+        tocar_seccion(seccion.id)
+        return Response(self.get_serializer(Leccion.objects.filter(seccion=seccion), many=True).data)
+
+    # 🔹 Endpoint personalizado: crear muchas lecciones en una sola petición
+    @action(detail=False, methods=['post'], url_path='lote')
+    def lote(self, request):
+        """
+        POST /lecciones/lote/
+        - multipart: seccion=<id>, lecciones='[{"nombre": "...", "archivo": "f0"}, ...]' y los archivos f0, f1...
+        - JSON: {"seccion": <id>, "lecciones": [{"nombre": "...", "material": "<recurso ya subido>"}, ...]}
+        Los archivos se suben en paralelo y las lecciones válidas se insertan con un solo bulk_create.
+        La respuesta trae el resultado de cada ítem.
+        """
+        preparado = self.preparar_lote(request)
+        if isinstance(preparado, Response):
+            return preparado
+        subidas = preparado[-1]
+        return self.guardar_lote(*preparado, subir_en_paralelo([trabajo for _, trabajo in subidas]))
+
+    # El lote se divide en fases para que la vista ASGI (apis/asincrono.py)
+    # pueda esperar las subidas sin ocupar un hilo
+    def preparar_lote(self, request):
+        """Valida la petición. Devuelve una Response de error o (seccion, items, resultados, materiales, subidas)."""
+        try:
+            docente = request.user.docente_profile
+        except Docente.DoesNotExist:
+            raise PermissionDenied("El usuario autenticado no es un docente.")
+        try:
+            seccion = Seccion.objects.select_related('curso').get(id=request.data.get('seccion'))
+        except (Seccion.DoesNotExist, ValueError, TypeError):
+            return Response({"error": "La sección no existe."}, status=404)
+        if seccion.curso.docente_id != docente.id:
+            raise PermissionDenied("No puedes agregar lecciones a cursos que no te pertenecen.")
+
+        items = request.data.get('lecciones')
+        if isinstance(items, str):
+            try:
+                items = json.loads(items)
+            except ValueError:
+                return Response({"error": "'lecciones' no es un JSON válido."}, status=400)
+        if not isinstance(items, list) or not items:
+            return Response({"error": "Debe enviar una lista de lecciones."}, status=400)
+        if len(items) > MAX_LECCIONES_LOTE:
+            return Response({"error": f"Máximo {MAX_LECCIONES_LOTE} lecciones por lote."}, status=400)
+
+        # 1️⃣ Validar todos los ítems antes de subir nada
+        campo = Leccion._meta.get_field('material')
+        resultados = [None] * len(items)
+        materiales = {}
+        subidas = []
+        for i, item in enumerate(items):
+            error = None
+            nombre = item.get('nombre') if isinstance(item, dict) else None
+            if not isinstance(nombre, str) or not nombre or len(nombre) > 150:
+                error = "'nombre' es obligatorio (máximo 150 caracteres)."
+            elif item.get('archivo') and not isinstance(item['archivo'], str):
+                error = "'archivo' debe ser el nombre de un archivo enviado."
+            elif item.get('archivo'):
+                archivo = request.FILES.get(item['archivo'])
+                if archivo is None:
+                    error = f"No se envió el archivo '{item['archivo']}'."
+                else:
+                    extra = {'resource_type': 'raw'} if es_pdf(archivo.name) else {}
+                    subidas.append((i, (campo, archivo, extra)))
+            elif item.get('material'):
+                try:
+                    material = campo.to_python(item['material']) if isinstance(item['material'], str) else None
+                except (TypeError, AttributeError):
+                    material = None
+                if material is None or not str(material.public_id).startswith(campo.options.get('folder', '')):
+                    error = "'material' no es un recurso válido de lecciones."
+                else:
+                    materiales[i] = material
+            if error:
+                resultados[i] = {"indice": i, "estado": "error", "error": error}
+        return seccion, items, resultados, materiales, subidas
+
+    def guardar_lote(self, seccion, items, resultados, materiales, subidas, subidos):
+        # 2️⃣ Resultado de las subidas (en paralelo, alineadas con `subidas`)
+        for (i, _), subido in zip(subidas, subidos):
+            if isinstance(subido, Exception):
+                resultados[i] = {"indice": i, "estado": "error", "error": f"Error al subir el archivo: {subido}"}
+            else:
+                materiales[i] = subido
+
+        # 3️⃣ Insertar todas las lecciones válidas de una vez
+        validos = [i for i in range(len(items)) if resultados[i] is None]
+        if validos:
+            with transaction.atomic():
+                ultimo = Leccion.objects.filter(seccion=seccion).aggregate(m=Max('orden'))['m']
+                inicio = 0 if ultimo is None else ultimo + 1
+                creadas = Leccion.objects.bulk_create([
+                    Leccion(seccion=seccion, nombre=items[i]['nombre'], material=materiales.get(i), orden=inicio + n)
+                    for n, i in enumerate(validos)
+                ])
+                tocar_seccion(seccion.id)
+            # bulk_create no dispara señales
+            invalidar_curso(seccion.curso_id)
+            programar_reindexado([seccion.curso_id])
+            for i, leccion in zip(validos, creadas):
+                resultados[i] = {"indice": i, "estado": "creada", "leccion": self.get_serializer(leccion).data}
+
+        return Response({"resultados": resultados}, status=201 if validos else 400)
@@ -0,0 +1,269 @@
+"""
+Ruta rápida de lectura para listados de solo lectura.
+
+``PlanLectura`` recorre una vez los campos de un ModelSerializer y los traduce
+a columnas de ``.values()`` (con sus joins) más una función de acceso por
+campo. Al serializar se hace una sola consulta ``values()`` y cada fila se
+convierte directamente en dict, sin instanciar modelos ni pasar por
+``Field.get_attribute``. La salida es idéntica a ``Serializer(qs, many=True).data``:
+
+- un FK intermedio nulo se trata igual que DRF (default, None o campo omitido);
+- un ``source`` que no existe en el modelo se omite, como hace DRF;
+- los ``SerializerMethodField`` necesitan un resolvedor por lotes en ``metodos``.
+"""
+from functools import lru_cache
+
+from asgiref.sync import sync_to_async
+from cloudinary import CloudinaryResource
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import models
+from rest_framework import serializers
+from rest_framework.fields import empty
+from rest_framework.settings import api_settings
+
+OMITIR = object()
+TAMANO_LOTE_IN = 900
+
+# Pares (campo del serializer, campo del modelo) cuyo valor de la BD ya es la representación final
+IDENTIDAD = (
+    (serializers.CharField, (models.CharField, models.TextField)),
+    (serializers.IntegerField, (models.IntegerField, models.AutoField)),
+    (serializers.BooleanField, (models.BooleanField,)),
+)
+
+
+class _Fila:
+    """Objeto mínimo para campos que leen el valor con getattr (ModelField)."""
+
+    def __init__(self, attname, valor):
+        setattr(self, attname, valor)
+
+
+def _respaldo(field):
+    """Qué haría DRF si el atributo no se puede resolver (AttributeError)."""
+    if field.default is not empty:
+        return field.get_default()
+    if field.allow_null:
+        return None
+    if not field.required:
+        return OMITIR
+    raise ImproperlyConfigured(f"El campo '{field.field_name}' no se puede resolver en la ruta rápida.")
+
+
+def _es_identidad(field, model_field):
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        return field.pk_field is None
+    return any(
+        type(field) is tipo_serializer and isinstance(model_field, tipos_modelo)
+        for tipo_serializer, tipos_modelo in IDENTIDAD
+    )
+
+
+@lru_cache(maxsize=8192)
+def url_cloudinary(tipo, resource_type, version, public_id, formato):
+    """URL de un recurso de Cloudinary; construirla es lo más caro de serializar una fila."""
+    return CloudinaryResource(
+        public_id, format=formato, version=version, type=tipo, resource_type=resource_type
+    ).url
+
+
+def _representar_archivo(field, context):
+    """Equivalente a FileField.to_representation para valores CloudinaryResource, con URL memoizada."""
+    if not getattr(field, 'use_url', api_settings.UPLOADED_FILES_USE_URL):
+        return field.to_representation
+    request = context.get('request')
+
+    def representar(valor):
+        if not valor:
+            return None
+        if not isinstance(valor, CloudinaryResource):
+            return field.to_representation(valor)
+        url = url_cloudinary(valor.type, valor.resource_type, valor.version, valor.public_id, valor.format)
+        return request.build_absolute_uri(url) if request is not None else url
+    return representar
+
+
+def por_lotes(ids, tamano=TAMANO_LOTE_IN):
+    ids = list(ids)
+    for inicio in range(0, len(ids), tamano):
+        yield ids[inicio:inicio + tamano]
+
+
+class PlanLectura:
+    def __init__(self, serializer_class, metodos=None, prefijo=''):
+        self.serializer_class = serializer_class
+        self.metodos = metodos or {}
+        self.prefijo = prefijo
+        self.modelo = serializer_class.Meta.model
+        self.columna_pk = prefijo + self.modelo._meta.pk.attname
+        self._campos = None
+
+    # --- compilación ---
+    def _resolver_ruta(self, field):
+        """
+        Convierte ``field.source_attrs`` en una ruta de ``values()``.
+        Devuelve (columna, columnas_nulables, campo_final) o None si la ruta no existe en el modelo.
+        """
+        modelo = self.modelo
+        ruta = []
+        nulables = []
+        attrs = field.source_attrs
+        for i, attr in enumerate(attrs):
+            try:
+                model_field = modelo._meta.get_field(attr)
+            except FieldDoesNotExist:
+                if hasattr(modelo, attr):
+                    raise ImproperlyConfigured(
+                        f"'{modelo.__name__}.{attr}' no es un campo de modelo; "
+                        f"no se puede usar en la ruta rápida."
+                    )
+                return None
+            if model_field.is_relation and not (
+                model_field.concrete and (model_field.many_to_one or model_field.one_to_one)
+            ):
+                raise ImproperlyConfigured(f"La relación '{attr}' no está soportada en la ruta rápida.")
+            ruta.append(attr)
+            if i < len(attrs) - 1:
+                if not model_field.is_relation:
+                    return None
+                if model_field.null:
+                    nulables.append(self.prefijo + '__'.join(ruta))
+                modelo = model_field.related_model
+        return self.prefijo + '__'.join(ruta), nulables, model_field
+
+    def _compilar(self):
+        campos = []
+        for field in self.serializer_class()._readable_fields:
+            clave = field.field_name
+            if isinstance(field, serializers.SerializerMethodField):
+                if clave not in self.metodos:
+                    raise ImproperlyConfigured(
+                        f"{self.serializer_class.__name__}.{clave} necesita un resolvedor en 'metodos'."
+                    )
+                campos.append(('metodo', clave, None, (), None))
+                continue
+            if field.source == '*':
+                raise ImproperlyConfigured(f"source='*' no está soportado ({clave}).")
+
+            resuelta = self._resolver_ruta(field)
+            if resuelta is None:
+                campos.append(('fijo', clave, None, (), _respaldo(field)))
+                continue
+            columna, nulables, model_field = resuelta
+
+            if model_field.is_relation and not isinstance(
+                field, (serializers.BaseSerializer, serializers.PrimaryKeyRelatedField)
+            ):
+                raise ImproperlyConfigured(f"El campo relacionado '{clave}' no está soportado en la ruta rápida.")
+
+            if isinstance(field, serializers.BaseSerializer):
+                anidado = PlanLectura(type(field), prefijo=columna + '__')
+                campos.append(('anidado', clave, columna, nulables, anidado))
+            elif isinstance(field, serializers.ModelField):
+                campos.append(('modelo', clave, columna, nulables, field.model_field.attname))
+            else:
+                campos.append(('valor', clave, columna, nulables, _es_identidad(field, model_field)))
+        return campos
+
+    @property
+    def campos(self):
+        if self._campos is None:
+            self._campos = self._compilar()
+        return self._campos
+
+    def columnas(self):
+        columnas = {self.columna_pk}
+        for tipo, _, columna, nulables, extra in self.campos:
+            columnas.update(nulables)
+            if tipo == 'anidado':
+                columnas.add(columna)
+                columnas.update(extra.columnas())
+            elif columna:
+                columnas.add(columna)
+        return columnas
+
+    # --- ejecución ---
+    def accesores(self, context, metodos_resueltos):
+        """Precompila una función (fila → valor u OMITIR) por campo, ligada al contexto actual."""
+        fields = self.serializer_class(context=context).fields
+        accesores = []
+        for tipo, clave, columna, nulables, extra in self.campos:
+            field = fields[clave]
+            if tipo == 'metodo':
+                valores, columna_pk = metodos_resueltos[clave], self.columna_pk
+                accesor = (lambda v, c: lambda fila: v.get(fila[c]))(valores, columna_pk)
+            elif tipo == 'fijo':
+                accesor = (lambda v: lambda fila: v)(extra)
+            elif tipo == 'anidado':
+                construir = extra.constructor(context, {})
+                accesor = (lambda c, f: lambda fila: None if fila[c] is None else f(fila))(columna, construir)
+            elif tipo == 'modelo':
+                accesor = (
+                    lambda c, a, rep: lambda fila: rep(_Fila(a, fila[c]))
+                )(columna, extra, field.to_representation)
+            elif extra:
+                accesor = (lambda c: lambda fila: fila[c])(columna)
+            else:
+                if isinstance(field, serializers.FileField):
+                    representar = _representar_archivo(field, context)
+                else:
+                    if isinstance(field, serializers.DateTimeField) and not hasattr(field, 'timezone'):
+                        # La zona horaria activa no cambia durante la petición: resolverla una sola vez
+                        field.timezone = field.default_timezone()
+                    representar = field.to_representation
+                accesor = (
+                    lambda c, rep: lambda fila: None if fila[c] is None else rep(fila[c])
+                )(columna, representar)
+
+            if nulables:
+                respaldo = _respaldo(field) if tipo != 'anidado' else None
+                accesor = (
+                    lambda ns, r, a: lambda fila: r if any(fila[n] is None for n in ns) else a(fila)
+                )(nulables, respaldo, accesor)
+            accesores.append((clave, accesor))
+        return accesores
+
+    def constructor(self, context, metodos_resueltos):
+        accesores = self.accesores(context, metodos_resueltos)
+
+        def construir(fila):
+            salida = {}
+            for clave, accesor in accesores:
+                valor = accesor(fila)
+                if valor is not OMITIR:
+                    salida[clave] = valor
+            return salida
+        return construir
+
+    def serializar(self, queryset, context=None):
+        filas = list(queryset.values(*self.columnas()))
+        ids = [fila[self.columna_pk] for fila in filas]
+        metodos_resueltos = {clave: resolver(ids) for clave, resolver in self.metodos.items()}
+        construir = self.constructor(context or {}, metodos_resueltos)
+        return [construir(fila) for fila in filas]
+
+    async def aserializar(self, queryset, context=None):
+        """Igual que ``serializar`` para vistas asíncronas (``async for`` sobre el queryset)."""
+        filas = [fila async for fila in queryset.values(*self.columnas())]
+        ids = [fila[self.columna_pk] for fila in filas]
+        metodos_resueltos = {clave: await sync_to_async(resolver)(ids) for clave, resolver in self.metodos.items()}
+        construir = self.constructor(context or {}, metodos_resueltos)
+        return [construir(fila) for fila in filas]
+
+
+class LecturaRapidaMixin:
+    """
+    Mixin para viewsets: ``serializar_lista`` usa el ``PlanLectura`` de la vista
+    en las acciones listadas en ``acciones_lectura_rapida`` y el serializer
+    normal en las demás.
+    """
+    plan_lectura = None
+    acciones_lectura_rapida = ()
+
+    def serializar_lista(self, queryset, serializer_class=None, plan=None):
+        plan = plan or self.plan_lectura
+        contexto = {'request': self.request, 'format': getattr(self, 'format_kwarg', None), 'view': self}
+        if plan is not None and self.action in self.acciones_lectura_rapida:
+            return plan.serializar(queryset, contexto)
+        serializer_class = serializer_class or (plan.serializer_class if plan else self.get_serializer_class())
+        return serializer_class(queryset, many=True, context=contexto).data
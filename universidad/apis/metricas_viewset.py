@@ -0,0 +1,19 @@
+from rest_framework import viewsets
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from universidad.limites import metricas as metricas_limites
+from universidad.media import cliente_http
+
+
+class MetricasViewSet(viewsets.ViewSet):
+    """
+    Métricas del proceso que atiende la petición (solo administradores).
+    """
+    permission_classes = [IsAdminUser]
+
+    def list(self, request):
+        return Response({
+            'media_http': cliente_http().metricas_pool(),
+            'limites': metricas_limites(),
+        })
@@ -0,0 +1,75 @@
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from universidad.progreso import (
+    ProgresoError,
+    registrar_latido,
+    marcar_completada,
+    progreso_curso,
+    progreso_cursos,
+)
+
+
+# Lo que entra en las columnas en cualquier motor: posiciones (PositiveIntegerField) e ids (BigAutoField)
+MAXIMO = 2 ** 31 - 1
+MAXIMO_ID = 2 ** 63 - 1
+
+
+def _entero(valor, minimo=0, maximo=MAXIMO):
+    try:
+        valor = int(valor)
+    except (TypeError, ValueError):
+        return None
+    return valor if minimo <= valor <= maximo else None
+
+
+class ProgresoViewSet(viewsets.ViewSet):
+    """
+    Progreso del alumno autenticado en las lecciones de sus cursos comprados.
+    """
+    permission_classes = [IsAuthenticated]
+
+    # 🔹 Latido del reproductor: se acumula en memoria y se escribe por lotes
+    @action(detail=False, methods=['post'], url_path='latido')
+    def latido(self, request):
+        leccion_id = _entero(request.data.get('leccion'), minimo=1, maximo=MAXIMO_ID)
+        posicion = _entero(request.data.get('posicion', 0))
+        if leccion_id is None or posicion is None:
+            return Response({"error": "Se requiere 'leccion' y una 'posicion' válida"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        try:
+            registrar_latido(request.user, leccion_id, posicion)
+        except ProgresoError as e:
+            return Response({"error": e.mensaje}, status=e.status)
+        return Response(status=status.HTTP_202_ACCEPTED)
+
+    # 🔹 Marcar lección como completada (escritura inmediata)
+    @action(detail=False, methods=['post'], url_path='completar')
+    def completar(self, request):
+        leccion_id = _entero(request.data.get('leccion'), minimo=1, maximo=MAXIMO_ID)
+        posicion = request.data.get('posicion')
+        if posicion is not None:
+            posicion = _entero(posicion)
+        if leccion_id is None or ('posicion' in request.data and posicion is None):
+            return Response({"error": "Se requiere 'leccion' y una 'posicion' válida"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        try:
+            nueva = marcar_completada(request.user, leccion_id, posicion)
+        except ProgresoError as e:
+            return Response({"error": e.mensaje}, status=e.status)
+        return Response({"leccion": leccion_id, "completada": True, "nueva": nueva})
+
+    # 🔹 Progreso detallado de un curso
+    @action(detail=False, methods=['get'], url_path=r'curso/(?P<curso_id>\d+)')
+    def curso(self, request, curso_id=None):
+        try:
+            return Response(progreso_curso(request.user, int(curso_id)))
+        except ProgresoError as e:
+            return Response({"error": e.mensaje}, status=e.status)
+
+    # 🔹 Porcentaje de avance en todos los cursos comprados
+    @action(detail=False, methods=['get'], url_path='mis-cursos')
+    def mis_cursos(self, request):
+        return Response(progreso_cursos(request.user))
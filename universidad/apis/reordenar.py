@@ -0,0 +1,26 @@
+from django.db import transaction
+
+
+def aplicar_orden(queryset, ids):
+    """
+    Reordena los objetos de ``queryset`` (todos los hijos de un mismo padre)
+    según la lista ``ids``, con un único bulk_update dentro de una transacción.
+    Devuelve un mensaje de error si ``ids`` no es exactamente el conjunto de hijos.
+    """
+    # bool es subclase de int: true/false no son ids
+    if not isinstance(ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+        return "'orden' debe ser una lista de ids."
+    if len(set(ids)) != len(ids):
+        return "'orden' tiene ids repetidos."
+
+    with transaction.atomic():
+        objetos = {obj.pk: obj for obj in queryset.select_for_update().only('id', 'orden')}
+        if set(objetos) != set(ids):
+            return "'orden' debe incluir exactamente todos los elementos, sin agregar otros."
+        cambiados = []
+        for posicion, pk in enumerate(ids):
+            if objetos[pk].orden != posicion:
+                objetos[pk].orden = posicion
+                cambiados.append(objetos[pk])
+        queryset.model.objects.bulk_update(cambiados, ['orden'])
+    return None
@@ -3,6 +3,10 @@ from rest_framework.permissions import IsAuthenticated, DjangoModelPermissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
+from universidad.apis.condicional import Validadores
+from universidad.apis.reordenar import aplicar_orden
+from universidad.cache import invalidar_curso
+from universidad.catalogo import tocar_curso
 from universidad.models import Seccion, Curso, Docente
 
 
@@ -15,7 +19,8 @@ class SeccionSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Seccion
-        fields = ['id', 'nombre', 'descripcion', 'curso', 'curso_nombre']
+        fields = ['id', 'nombre', 'descripcion', 'curso', 'curso_nombre', 'orden']
+        read_only_fields = ['orden']
 
 
 # --- VIEWSET ---
@@ -69,12 +74,42 @@ class SeccionViewSet(viewsets.ModelViewSet):
     def por_curso(self, request, curso_id=None):
         """
         Obtiene todas las secciones de un curso específico (visible para cualquier docente o usuario autenticado).
+        Con If-None-Match / If-Modified-Since responde 304 leyendo solo la fecha del curso.
         """
-        try:
-            curso = Curso.objects.get(id=curso_id)
-        except Curso.DoesNotExist:
+        modificado = Curso.objects.filter(id=curso_id).values_list('fecha_actualizacion', flat=True).first()
+        if modificado is None:
             return Response({"error": "El curso no existe."}, status=404)
+        validadores = Validadores(modificado, 'secciones', curso_id, request.accepted_renderer.format, privado=True)
+        no_modificado = validadores.no_modificado(request)
+        if no_modificado is not None:
+            return no_modificado
 
-        secciones = Seccion.objects.filter(curso=curso)
+        secciones = Seccion.objects.filter(curso_id=curso_id)
         serializer = self.get_serializer(secciones, many=True)
-        return Response(serializer.data)
+        return validadores.aplicar(Response(serializer.data))
+
+    # 🔹 Endpoint personalizado: reordenar todas las secciones de un curso
+    @action(detail=False, methods=['post'])
+    def reordenar(self, request):
+        """
+        POST /secciones/reordenar/  {"curso": <id>, "orden": [<id_seccion>, ...]}
+        Recibe el orden completo de las secciones del curso.
+        """
+        try:
+            docente = request.user.docente_profile
+        except Docente.DoesNotExist:
+            raise PermissionDenied("El usuario autenticado no es un docente.")
+        try:
+            curso = Curso.objects.get(id=request.data.get('curso'))
+        except (Curso.DoesNotExist, ValueError, TypeError):
+            return Response({"error": "El curso no existe."}, status=404)
+        if curso.docente != docente:
+            raise PermissionDenied("No puedes reordenar secciones de cursos que no te pertenecen.")
+
+        error = aplicar_orden(Seccion.objects.filter(curso=curso), request.data.get('orden'))
+        if error:
+            return Response({"error": error}, status=400)
+        # bulk_update no dispara señales
+        invalidar_curso(curso.id)
+        tocar_curso(curso.id)
+        return Response(self.get_serializer(Seccion.objects.filter(curso=curso), many=True).data)
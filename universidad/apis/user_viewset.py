@@ -1,11 +1,14 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.db import IntegrityError, transaction
 from rest_framework import serializers, viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied
 
+from universidad.apis.idempotencia import idempotente
+from universidad.apis.lectura_rapida import LecturaRapidaMixin, PlanLectura, por_lotes
 from universidad.models import Docente
 
 User = get_user_model()  # Usa tu modelo personalizado Alumno
@@ -27,9 +30,26 @@ class UserSerializer(serializers.ModelSerializer):
         return None
 
 
+def roles_por_usuario(ids):
+    """Versión por lotes de UserSerializer.get_role: {id_usuario: nombre del primer grupo}."""
+    roles = {}
+    for lote in por_lotes(ids):
+        filas = (
+            User.groups.through.objects
+            .filter(alumno_id__in=lote)
+            .order_by('id')
+            .values_list('alumno_id', 'group__name')
+        )
+        for usuario_id, nombre in filas:
+            roles.setdefault(usuario_id, nombre)
+    return roles
+
+
 # ---------------------- VISTA DE USUARIO ----------------------
-class UserViewSet(viewsets.ViewSet):
+class UserViewSet(LecturaRapidaMixin, viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
+    plan_lectura = PlanLectura(UserSerializer, metodos={'role': roles_por_usuario})
+    acciones_lectura_rapida = ('listar_alumnos', 'listar_docentes', 'listar_administradores')
 
     @action(detail=False, methods=['get'], url_path='me')
     def me(self, request):
@@ -46,8 +66,7 @@ class UserViewSet(viewsets.ViewSet):
         if not request.user.groups.filter(name='Administrador').exists():
             raise PermissionDenied("Solo los administradores pueden ver la lista de alumnos.")
         alumnos = User.objects.filter(groups__name='Alumno')
-        serializer = UserSerializer(alumnos, many=True)
-        return Response(serializer.data)
+        return Response(self.serializar_lista(alumnos))
 
         # -----------------------------------------------------------------------
         # ✅ LISTAR DOCENTES
@@ -58,8 +77,7 @@ class UserViewSet(viewsets.ViewSet):
         if not request.user.groups.filter(name='Administrador').exists():
             raise PermissionDenied("Solo los administradores pueden ver la lista de docentes.")
         docentes = User.objects.filter(groups__name='Docente')
-        serializer = UserSerializer(docentes, many=True)
-        return Response(serializer.data)
+        return Response(self.serializar_lista(docentes))
 
         # -----------------------------------------------------------------------
         # ✅ LISTAR ADMINISTRADORES
@@ -70,8 +88,7 @@ class UserViewSet(viewsets.ViewSet):
         if not request.user.groups.filter(name='Administrador').exists():
             raise PermissionDenied("Solo los administradores pueden ver la lista de administradores.")
         admins = User.objects.filter(groups__name='Administrador')
-        serializer = UserSerializer(admins, many=True)
-        return Response(serializer.data)
+        return Response(self.serializar_lista(admins))
 
     @action(detail=False, methods=['patch'], url_path='actualizar-mi-perfil')
     def actualizar_mi_perfil(self, request):
@@ -103,8 +120,10 @@ class UserViewSet(viewsets.ViewSet):
 # ---------------------- AUTENTICACIÓN Y REGISTRO ----------------------
 class AuthViewSet(viewsets.ViewSet):
     permission_classes = [AllowAny]
+    throttle_scopes = {'register': 'registro'}
 
     @action(methods=['post'], detail=False, url_path='register')
+    @idempotente('register')
     def register(self, request):
         """
         Registro público: solo para alumnos
@@ -120,20 +139,31 @@ class AuthViewSet(viewsets.ViewSet):
         if User.objects.filter(email=email).exists():
             return Response({'error': 'El email ya está registrado'}, status=status.HTTP_400_BAD_REQUEST)
 
-        user = User.objects.create_user(
-            email=email,
-            password=password,
-            nombre_completo=nombre_completo,
-            email_secundario=email_secundario
-        )
-
         try:
             alumno_group = Group.objects.get(name='Alumno')
-            user.groups.add(alumno_group)
         except Group.DoesNotExist:
             return Response({'error': 'El grupo "Alumno" no existe. Ejecuta la migración de roles primero.'},
                             status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    email=email,
+                    password=password,
+                    nombre_completo=nombre_completo,
+                    email_secundario=email_secundario
+                )
+                user.groups.add(alumno_group)
+        except IntegrityError:
+            # Carrera con otro registro entre el exists() y el create_user()
+            if User.objects.filter(email=email).exists():
+                return Response({'error': 'El email ya está registrado'}, status=status.HTTP_400_BAD_REQUEST)
+            if User.objects.filter(email_secundario=email_secundario).exists():
+                return Response({'error': 'El email secundario ya está registrado'},
+                                status=status.HTTP_400_BAD_REQUEST)
+            return Response({'error': 'No se pudo completar el registro, intenta de nuevo'},
+                            status=status.HTTP_409_CONFLICT)
+
         return Response({
             'id': user.id,
             'email': user.email,
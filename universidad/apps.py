@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+
+
+class UniversidadConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'universidad'
+
+    def ready(self):
+        # Registrar los receivers de señales de cada subsistema
+        import universidad.busqueda.signals  # noqa: F401
+        import universidad.cache.signals  # noqa: F401
+        import universidad.catalogo.signals  # noqa: F401
+        import universidad.media.signals  # noqa: F401
+        import universidad.progreso.signals  # noqa: F401
+        import universidad.ranking.signals  # noqa: F401
+        import universidad.token.signals  # noqa: F401
@@ -0,0 +1,7 @@
+from .indice import (
+    normalizar,
+    buscar_cursos,
+    indexar_cursos,
+    programar_reindexado,
+    reconstruir_indice,
+)
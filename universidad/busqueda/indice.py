@@ -0,0 +1,238 @@
+"""
+Índice de búsqueda de texto completo para el catálogo de cursos.
+
+Cada curso se indexa como un documento con el texto del curso, su área,
+el nombre del docente, sus secciones y sus lecciones. El almacenamiento
+depende del motor de base de datos:
+
+- SQLite: tabla virtual FTS5 (``rowid`` = id del curso), ranking bm25.
+- PostgreSQL: columna ``tsvector`` con pesos A-D e índice GIN, ranking ts_rank_cd.
+
+El texto se normaliza en Python (minúsculas y sin tildes) antes de indexar y
+al consultar, así la búsqueda no distingue acentos en ningún motor.
+"""
+import re
+import threading
+import unicodedata
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from universidad.models import Curso
+
+TABLA = 'universidad_curso_fts'
+MAX_TERMINOS = 8
+TAMANO_LOTE = 500
+
+_local = threading.local()
+
+
+def normalizar(texto):
+    """Pasa a minúsculas y elimina tildes/diacríticos ('Programación' → 'programacion')."""
+    if not texto:
+        return ''
+    texto = unicodedata.normalize('NFKD', texto)
+    return ''.join(c for c in texto if not unicodedata.combining(c)).lower()
+
+
+def terminos(consulta):
+    return re.findall(r'\w+', normalizar(consulta))[:MAX_TERMINOS]
+
+
+def _documento(curso):
+    secciones = list(curso.secciones.all())
+    return {
+        'nombre': normalizar(curso.nombre),
+        'descripcion': normalizar(curso.descripcion),
+        'area': normalizar(curso.area.nombre),
+        'docente': normalizar(curso.docente.user.nombre_completo) if curso.docente else '',
+        'secciones': normalizar(' '.join(f"{s.nombre} {s.descripcion or ''}" for s in secciones)),
+        'lecciones': normalizar(' '.join(lec.nombre for s in secciones for lec in s.lecciones.all())),
+    }
+
+
+def _cursos_para_indexar():
+    return Curso.objects.select_related('area', 'docente__user').prefetch_related('secciones__lecciones')
+
+
+# --- BACKENDS ---
+class SQLiteBackend:
+    # Pesos bm25 por columna: nombre, descripcion, area, docente, secciones, lecciones
+    PESOS = (10.0, 2.0, 4.0, 4.0, 2.0, 1.0)
+
+    def guardar(self, documentos):
+        with connection.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {TABLA} WHERE rowid = %s', [(pk,) for pk in documentos])
+            cursor.executemany(
+                f'INSERT INTO {TABLA} (rowid, nombre, descripcion, area, docente, secciones, lecciones) '
+                f'VALUES (%s, %s, %s, %s, %s, %s, %s)',
+                [
+                    (pk, d['nombre'], d['descripcion'], d['area'], d['docente'], d['secciones'], d['lecciones'])
+                    for pk, d in documentos.items()
+                ]
+            )
+
+    def eliminar(self, curso_ids):
+        with connection.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {TABLA} WHERE rowid = %s', [(pk,) for pk in curso_ids])
+
+    def vaciar(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {TABLA}')
+
+    def buscar(self, terms, limite):
+        # "term"* → coincidencia por prefijo; los términos separados por espacio se combinan con AND
+        match = ' '.join(f'"{t}"*' for t in terms)
+        pesos = ', '.join(str(p) for p in self.PESOS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM {TABLA} WHERE {TABLA} MATCH %s '
+                f'ORDER BY bm25({TABLA}, {pesos}) LIMIT %s',
+                [match, limite]
+            )
+            return [fila[0] for fila in cursor.fetchall()]
+
+
+class PostgresBackend:
+    VECTOR = (
+        "setweight(to_tsvector('spanish', %s), 'A') || "
+        "setweight(to_tsvector('spanish', %s), 'B') || "
+        "setweight(to_tsvector('spanish', %s), 'C') || "
+        "setweight(to_tsvector('spanish', %s), 'D')"
+    )
+
+    def guardar(self, documentos):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {TABLA} (curso_id, documento) VALUES (%s, {self.VECTOR}) '
+                f'ON CONFLICT (curso_id) DO UPDATE SET documento = EXCLUDED.documento',
+                [
+                    (
+                        pk,
+                        d['nombre'],
+                        f"{d['area']} {d['docente']}",
+                        f"{d['descripcion']} {d['secciones']}",
+                        d['lecciones'],
+                    )
+                    for pk, d in documentos.items()
+                ]
+            )
+
+    def eliminar(self, curso_ids):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {TABLA} WHERE curso_id = ANY(%s)', [list(curso_ids)])
+
+    def vaciar(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'TRUNCATE {TABLA}')
+
+    def buscar(self, terms, limite):
+        tsquery = ' & '.join(f'{t}:*' for t in terms)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT curso_id FROM {TABLA}, to_tsquery('spanish', %s) q "
+                f"WHERE documento @@ q ORDER BY ts_rank_cd(documento, q) DESC LIMIT %s",
+                [tsquery, limite]
+            )
+            return [fila[0] for fila in cursor.fetchall()]
+
+
+class FallbackBackend:
+    """Motores sin índice: búsqueda por icontains, sin ranking."""
+
+    def guardar(self, documentos):
+        pass
+
+    def eliminar(self, curso_ids):
+        pass
+
+    def vaciar(self):
+        pass
+
+    def buscar(self, terms, limite):
+        filtro = Q()
+        for t in terms:
+            filtro &= (
+                Q(nombre__icontains=t) | Q(descripcion__icontains=t) | Q(area__nombre__icontains=t)
+                | Q(docente__user__nombre_completo__icontains=t) | Q(secciones__nombre__icontains=t)
+                | Q(secciones__lecciones__nombre__icontains=t)
+            )
+        return list(Curso.objects.filter(filtro).values_list('id', flat=True).distinct()[:limite])
+
+
+_BACKENDS = {
+    'sqlite': SQLiteBackend(),
+    'postgresql': PostgresBackend(),
+}
+
+
+def backend():
+    return _BACKENDS.get(connection.vendor, FallbackBackend())
+
+
+# --- API ---
+def buscar_cursos(consulta, limite=20):
+    """Devuelve los ids de los cursos que coinciden con la consulta, ordenados por relevancia."""
+    terms = terminos(consulta)
+    if not terms:
+        return []
+    return backend().buscar(terms, limite)
+
+
+def indexar_cursos(curso_ids):
+    """(Re)indexa los cursos indicados; los que ya no existen se quitan del índice."""
+    curso_ids = set(curso_ids)
+    if not curso_ids:
+        return
+    documentos = {curso.pk: _documento(curso) for curso in _cursos_para_indexar().filter(pk__in=curso_ids)}
+    faltantes = curso_ids - documentos.keys()
+    if documentos:
+        backend().guardar(documentos)
+    if faltantes:
+        backend().eliminar(faltantes)
+
+
+def reconstruir_indice():
+    """Vacía y vuelve a generar el índice completo. Devuelve el número de cursos indexados."""
+    total = 0
+    with transaction.atomic():
+        backend().vaciar()
+        ids = list(Curso.objects.order_by('id').values_list('id', flat=True))
+        for inicio in range(0, len(ids), TAMANO_LOTE):
+            lote = ids[inicio:inicio + TAMANO_LOTE]
+            documentos = {curso.pk: _documento(curso) for curso in _cursos_para_indexar().filter(pk__in=lote)}
+            backend().guardar(documentos)
+            total += len(documentos)
+    return total
+
+
+class _Lote:
+    def __init__(self):
+        self.ids = set()
+
+    def vaciar(self):
+        if getattr(_local, 'lote', None) is self:
+            _local.lote = None
+        indexar_cursos(self.ids)
+
+
+def programar_reindexado(curso_ids):
+    """
+    Reindexa los cursos al confirmar la transacción actual. Dentro de un mismo
+    atomic() los ids se agrupan, así un borrado en cascada (curso → secciones →
+    lecciones) reindexa cada curso una sola vez.
+    """
+    ids = {pk for pk in curso_ids if pk is not None}
+    if not ids:
+        return
+    conexion = transaction.get_connection()
+    if not conexion.in_atomic_block:
+        indexar_cursos(ids)
+        return
+    lote = getattr(_local, 'lote', None)
+    # Si la transacción anterior hizo rollback, su callback ya no está registrado
+    if lote is None or not any(func == lote.vaciar for _, func, _ in conexion.run_on_commit):
+        lote = _Lote()
+        _local.lote = lote
+        transaction.on_commit(lote.vaciar)
+    lote.ids.update(ids)
@@ -0,0 +1,44 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from universidad.models import Alumno, Area, Curso, Docente, Leccion, Seccion
+from .indice import programar_reindexado
+
+
+@receiver([post_save, post_delete], sender=Curso)
+def reindexar_curso(sender, instance, **kwargs):
+    programar_reindexado([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=Seccion)
+def reindexar_por_seccion(sender, instance, **kwargs):
+    programar_reindexado([instance.curso_id])
+
+
+@receiver([post_save, post_delete], sender=Leccion)
+def reindexar_por_leccion(sender, instance, **kwargs):
+    try:
+        curso_id = instance.seccion.curso_id
+    except Seccion.DoesNotExist:
+        return
+    programar_reindexado([curso_id])
+
+
+@receiver(post_save, sender=Area)
+def reindexar_por_area(sender, instance, created, **kwargs):
+    if not created:
+        programar_reindexado(instance.cursos.values_list('id', flat=True))
+
+
+@receiver(post_save, sender=Docente)
+def reindexar_por_docente(sender, instance, created, **kwargs):
+    if not created:
+        programar_reindexado(instance.cursos.values_list('id', flat=True))
+
+
+@receiver(post_save, sender=Alumno)
+def reindexar_por_nombre_docente(sender, instance, created, update_fields=None, **kwargs):
+    # El nombre visible del docente vive en su usuario
+    if created or (update_fields is not None and 'nombre_completo' not in update_fields):
+        return
+    programar_reindexado(Curso.objects.filter(docente__user=instance).values_list('id', flat=True))
@@ -0,0 +1,2 @@
+from .lru import LRU
+from .arbol_curso import arbol_curso, invalidar_curso, version_curso
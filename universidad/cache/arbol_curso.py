@@ -0,0 +1,64 @@
+"""
+Cache por niveles del árbol completo de un curso (curso → secciones → lecciones).
+
+Nivel 1: LRU en memoria del proceso. Nivel 2: cache compartida de Django
+(``CACHES['default']``). La clave incluye una versión de contenido guardada en
+la cache compartida; las señales de Curso/Seccion/Leccion la reemplazan por un
+valor nuevo al confirmar la transacción, así las entradas viejas de todos los
+procesos dejan de usarse sin tener que borrarlas. Mover una sección o una
+lección a otro curso invalida los dos cursos.
+
+Que un cambio se vea en todos los workers depende de que la cache sea la
+misma para todos (Redis); con la de memoria local hay que correr un solo
+proceso.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .lru import LRU
+
+PREFIJO = 'curso-arbol'
+
+_config = getattr(settings, 'ARBOL_CURSO_CACHE', {})
+TIMEOUT = _config.get('TIMEOUT', 60 * 60)
+lru = LRU(_config.get('LRU_SIZE', 256))
+
+
+def _clave_version(curso_id):
+    return f'{PREFIJO}:{curso_id}:version'
+
+
+def version_curso(curso_id):
+    clave = _clave_version(curso_id)
+    version = cache.get(clave)
+    if version is None:
+        # Versión aleatoria: si la cache compartida la pierde, nunca se reutiliza una vieja
+        cache.add(clave, uuid.uuid4().hex, timeout=None)
+        version = cache.get(clave)
+    return version
+
+
+def invalidar_curso(curso_id):
+    """Cambia la versión del curso cuando la transacción actual se confirme."""
+    if curso_id is not None:
+        transaction.on_commit(lambda: cache.set(_clave_version(curso_id), uuid.uuid4().hex, timeout=None))
+
+
+def arbol_curso(curso_id, construir):
+    """
+    Devuelve el árbol serializado del curso. ``construir`` solo se llama si
+    ninguno de los dos niveles tiene la versión actual.
+    """
+    clave = f'{PREFIJO}:{curso_id}:{version_curso(curso_id)}'
+    datos = lru.get(clave)
+    if datos is not None:
+        return datos
+    datos = cache.get(clave)
+    if datos is None:
+        datos = construir()
+        cache.set(clave, datos, timeout=TIMEOUT)
+    lru.set(clave, datos)
+    return datos
@@ -0,0 +1,141 @@
+"""
+Cache de permisos de modelo para ``DjangoModelPermissions``.
+
+``ModelBackend`` arma en cada petición los permisos del usuario y de sus
+grupos con dos consultas sobre ``auth_permission``. Acá se guardan:
+
+- por usuario: los ids de sus grupos y sus permisos directos;
+- por conjunto de grupos: los permisos del rol (todos los Docente comparten
+  la misma entrada), con una LRU del proceso delante de la cache compartida.
+
+Las claves llevan una versión global que se cambia cuando se modifican
+grupos o permisos; la entrada de un usuario se borra cuando cambian sus
+grupos o sus permisos directos. Con la cache caliente, revisar permisos no
+hace consultas. Esas invalidaciones llegan a otros workers solo a través de
+una cache compartida.
+"""
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.db import transaction
+
+from .lru import LRU
+
+PREFIJO = 'permisos'
+CLAVE_VERSION = f'{PREFIJO}:version'
+
+_config = getattr(settings, 'PERMISOS_CACHE', {})
+TIMEOUT = _config.get('TIMEOUT', 60 * 60)
+lru = LRU(_config.get('LRU_SIZE', 64))
+
+
+def version_permisos():
+    version = cache.get(CLAVE_VERSION)
+    if version is None:
+        cache.add(CLAVE_VERSION, uuid.uuid4().hex, timeout=None)
+        version = cache.get(CLAVE_VERSION)
+    return version
+
+
+def _clave_usuario(version, usuario_id):
+    return f'{PREFIJO}:{version}:usuario:{usuario_id}'
+
+
+def invalidar_permisos():
+    """Descarta todas las entradas cuando la transacción actual se confirme."""
+    transaction.on_commit(lambda: cache.set(CLAVE_VERSION, uuid.uuid4().hex, timeout=None))
+
+
+def invalidar_usuario(usuario_id):
+    transaction.on_commit(lambda: cache.delete(_clave_usuario(version_permisos(), usuario_id)))
+
+
+def _a_cadenas(permisos):
+    return frozenset(
+        f'{app_label}.{codename}'
+        for app_label, codename in permisos.values_list('content_type__app_label', 'codename').order_by()
+    )
+
+
+def membresia(usuario, version):
+    """(ids de grupos ordenados, permisos directos) del usuario."""
+    clave = _clave_usuario(version, usuario.pk)
+    datos = cache.get(clave)
+    if datos is None:
+        grupos = tuple(sorted(usuario.groups.values_list('id', flat=True)))
+        datos = (grupos, _a_cadenas(usuario.user_permissions.all()))
+        cache.set(clave, datos, timeout=TIMEOUT)
+    return datos
+
+
+def permisos_de_grupos(grupos, version):
+    clave = f"{PREFIJO}:{version}:grupos:{'-'.join(map(str, grupos)) or 'ninguno'}"
+    permisos = lru.get(clave)
+    if permisos is not None:
+        return permisos
+    permisos = cache.get(clave)
+    if permisos is None:
+        permisos = _a_cadenas(Permission.objects.filter(group__in=grupos)) if grupos else frozenset()
+        cache.set(clave, permisos, timeout=TIMEOUT)
+    lru.set(clave, permisos)
+    return permisos
+
+
+def permisos_superusuario(version):
+    clave = f'{PREFIJO}:{version}:superusuario'
+    permisos = lru.get(clave)
+    if permisos is None:
+        permisos = cache.get(clave)
+        if permisos is None:
+            permisos = _a_cadenas(Permission.objects.all())
+            cache.set(clave, permisos, timeout=TIMEOUT)
+        lru.set(clave, permisos)
+    return permisos
+
+
+def nombres_grupos(version):
+    """{id: nombre} de todos los grupos (son pocos: los roles)."""
+    clave = f'{PREFIJO}:{version}:nombres_grupos'
+    nombres = lru.get(clave)
+    if nombres is None:
+        nombres = cache.get(clave)
+        if nombres is None:
+            nombres = dict(Group.objects.values_list('id', 'name'))
+            cache.set(clave, nombres, timeout=TIMEOUT)
+        lru.set(clave, nombres)
+    return nombres
+
+
+def rol_usuario(usuario):
+    """'Administrador', 'Docente' o 'Alumno' según los grupos del usuario (desde la cache)."""
+    if usuario.is_superuser:
+        return 'Administrador'
+    version = version_permisos()
+    grupos, _ = membresia(usuario, version)
+    nombres = {nombres_grupos(version).get(grupo) for grupo in grupos}
+    for rol in ('Administrador', 'Docente'):
+        if rol in nombres:
+            return rol
+    return 'Alumno'
+
+
+class PermisosCacheadosBackend(ModelBackend):
+    """``ModelBackend`` que lee los permisos de la cache en lugar de la BD."""
+
+    def _get_permissions(self, user_obj, obj, from_name):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+
+        perm_cache_name = f'_{from_name}_perm_cache'
+        if not hasattr(user_obj, perm_cache_name):
+            version = version_permisos()
+            if user_obj.is_superuser:
+                permisos = permisos_superusuario(version)
+            else:
+                grupos, directos = membresia(user_obj, version)
+                permisos = directos if from_name == 'user' else permisos_de_grupos(grupos, version)
+            setattr(user_obj, perm_cache_name, set(permisos))
+        return getattr(user_obj, perm_cache_name)
@@ -0,0 +1,76 @@
+from django.contrib.auth.models import Group, Permission
+from django.db.models.signals import m2m_changed, post_save, post_delete
+from django.dispatch import receiver
+
+from universidad.models import Alumno, Area, Curso, Leccion, Seccion
+from .arbol_curso import invalidar_curso
+from .permisos import invalidar_permisos, invalidar_usuario
+
+
+@receiver([post_save, post_delete], sender=Curso)
+def invalidar_por_curso(sender, instance, **kwargs):
+    invalidar_curso(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Seccion)
+def invalidar_por_seccion(sender, instance, **kwargs):
+    invalidar_curso(instance.curso_id)
+    # Movida a otro curso: el árbol del curso que dejó también cambió. El curso
+    # anterior lo deja en la instancia el pre_save de universidad.catalogo.signals
+    invalidar_curso(getattr(instance, '_curso_anterior', None))
+
+
+@receiver([post_save, post_delete], sender=Leccion)
+def invalidar_por_leccion(sender, instance, **kwargs):
+    invalidar_curso(getattr(instance, '_curso_anterior', None))
+    try:
+        invalidar_curso(instance.seccion.curso_id)
+    except Seccion.DoesNotExist:
+        pass
+
+
+@receiver(post_save, sender=Area)
+def invalidar_por_area(sender, instance, created, **kwargs):
+    # El árbol incluye area_nombre
+    if not created:
+        for curso_id in instance.cursos.values_list('id', flat=True):
+            invalidar_curso(curso_id)
+
+
+@receiver(post_save, sender=Alumno)
+def invalidar_por_nombre_docente(sender, instance, created, update_fields=None, **kwargs):
+    # El árbol incluye docente_nombre, que vive en el usuario del docente
+    if created or (update_fields is not None and 'nombre_completo' not in update_fields):
+        return
+    for curso_id in Curso.objects.filter(docente__user=instance).values_list('id', flat=True):
+        invalidar_curso(curso_id)
+
+
+# --- Permisos ---
+
+@receiver(m2m_changed, sender=Alumno.groups.through)
+@receiver(m2m_changed, sender=Alumno.user_permissions.through)
+def invalidar_permisos_usuario(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        invalidar_usuario(instance.pk)
+    elif pk_set:
+        # grupo.user_set.add(...) / permiso.user_set.remove(...)
+        for usuario_id in pk_set:
+            invalidar_usuario(usuario_id)
+    else:
+        # clear() desde el grupo o el permiso: no se sabe qué usuarios tenía
+        invalidar_permisos()
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidar_permisos_grupo(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidar_permisos()
+
+
+@receiver([post_save, post_delete], sender=Group)
+@receiver([post_save, post_delete], sender=Permission)
+def invalidar_por_grupo_o_permiso(sender, **kwargs):
+    invalidar_permisos()
@@ -0,0 +1,62 @@
+"""
+Calentamiento de un worker recién creado (hook ``post_fork`` de gunicorn.conf.py).
+
+Hace antes de aceptar tráfico lo que si no pagaría la primera petición de
+cada worker: abrir las conexiones a la BD, importar el URLconf y armar las
+tablas del resolver, y compilar los serializers y planes de lectura de los
+viewsets del router. Con preload_app, URLs y serializers se calientan una vez
+en el master y los workers los heredan con el fork.
+"""
+import logging
+import time
+
+from django.db import connections
+from django.urls import get_resolver, resolve
+
+logger = logging.getLogger(__name__)
+
+# Rutas que recorren el resolver hasta el router (llenan la cache de resolve)
+RUTAS = ('/universidad/cursos/', '/universidad/areas/', '/universidad/cursos/1/detalle/')
+
+
+def _conexiones():
+    for conexion in connections.all():
+        conexion.ensure_connection()
+
+
+def _urls():
+    resolver = get_resolver()
+    resolver.reverse_dict  # arma las tablas de reverse()
+    for ruta in RUTAS:
+        resolve(ruta)
+
+
+def _serializers():
+    from universidad.urls import router
+
+    for _, viewset, _ in router.registry:
+        plan = getattr(viewset, 'plan_lectura', None)
+        if plan is not None:
+            plan.campos  # compila el plan una vez por proceso
+        serializer_class = getattr(viewset, 'serializer_class', None)
+        if serializer_class is not None:
+            serializer_class().fields  # importa y resuelve los campos
+
+
+def calentar(conexiones=True):
+    """
+    Devuelve {paso: ms}. Un paso que falla se registra y no impide arrancar el worker.
+    En el master de gunicorn (antes del fork) se llama con ``conexiones=False``.
+    """
+    pasos = [('urls', _urls), ('serializers', _serializers)]
+    if conexiones:
+        pasos.insert(0, ('conexiones', _conexiones))
+    tiempos = {}
+    for nombre, paso in pasos:
+        inicio = time.perf_counter()
+        try:
+            paso()
+        except Exception:
+            logger.exception("Falló el calentamiento de %s", nombre)
+        tiempos[nombre] = round((time.perf_counter() - inicio) * 1000, 1)
+    return tiempos
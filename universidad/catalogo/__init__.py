@@ -0,0 +1,3 @@
+from .facetas import leer_filtros, aplicar_filtros, contar_facetas
+from .clonacion import clonar_curso
+from .actualizacion import tocar_curso, tocar_cursos, tocar_seccion
@@ -0,0 +1,34 @@
+"""
+``fecha_actualizacion`` que sube por el árbol del curso.
+
+Guardar o borrar una lección actualiza la fecha de su sección y la de su
+curso; una sección, la de su curso. Mover una lección o una sección
+actualiza además el padre que dejó. También la cambian lo que los detalles
+del curso muestran de otros modelos: el nombre del área y el del docente.
+Así la fecha del curso alcanza para saber si cambió cualquiera de sus
+respuestas de detalle (ver ``universidad.apis.condicional``).
+
+Se propaga con ``UPDATE``: no vuelve a guardar los modelos ni dispara
+señales. ``bulk_create`` y ``bulk_update`` no disparan señales, así que
+quien los usa sobre secciones o lecciones llama a ``tocar_curso`` o
+``tocar_seccion``, como hace con ``invalidar_curso``.
+"""
+from django.utils import timezone
+
+from universidad.models import Curso, Seccion
+
+
+def tocar_cursos(cursos, fecha=None):
+    """Pone ``fecha`` (por defecto, ahora) a los cursos del queryset."""
+    cursos.update(fecha_actualizacion=fecha or timezone.now())
+
+
+def tocar_curso(curso_id, fecha=None):
+    tocar_cursos(Curso.objects.filter(pk=curso_id), fecha)
+
+
+def tocar_seccion(seccion_id, fecha=None):
+    """Actualiza la sección y su curso."""
+    fecha = fecha or timezone.now()
+    Seccion.objects.filter(pk=seccion_id).update(fecha_actualizacion=fecha)
+    tocar_cursos(Curso.objects.filter(secciones=seccion_id), fecha)
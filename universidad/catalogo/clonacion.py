@@ -0,0 +1,58 @@
+"""
+Copia profunda de un curso (curso → secciones → lecciones).
+
+Se hace en una transacción con un bulk_create por nivel, así el número de
+consultas no depende del tamaño del curso. Los archivos de Cloudinary no se
+vuelven a subir: el clon apunta a los mismos public_id que el original.
+"""
+from django.db import transaction
+
+from universidad.models import Curso, Leccion, Seccion
+
+TAMANO_LOTE = 500
+SUFIJO_COPIA = ' (copia)'
+
+
+def _nombre_copia(nombre):
+    # El sufijo no debe pasarse del max_length de Curso.nombre
+    maximo = Curso._meta.get_field('nombre').max_length
+    return nombre[:maximo - len(SUFIJO_COPIA)] + SUFIJO_COPIA
+
+
+def clonar_curso(curso, docente, nombre=None):
+    with transaction.atomic():
+        clon = Curso.objects.create(
+            nombre=nombre or _nombre_copia(curso.nombre),
+            descripcion=curso.descripcion,
+            certificable=curso.certificable,
+            area_id=curso.area_id,
+            docente=docente,
+            precio=curso.precio,
+            modo_prueba=curso.modo_prueba,
+            photo_profile=curso.photo_profile,
+        )
+
+        secciones = list(Seccion.objects.filter(curso=curso).order_by('orden', 'id'))
+        nuevas = Seccion.objects.bulk_create(
+            [
+                Seccion(curso=clon, nombre=s.nombre, descripcion=s.descripcion, orden=s.orden)
+                for s in secciones
+            ],
+            batch_size=TAMANO_LOTE,
+        )
+        equivalentes = {original.pk: nueva.pk for original, nueva in zip(secciones, nuevas)}
+
+        lecciones = Leccion.objects.filter(seccion__curso=curso).order_by('seccion_id', 'orden', 'id')
+        Leccion.objects.bulk_create(
+            [
+                Leccion(
+                    seccion_id=equivalentes[lec.seccion_id],
+                    nombre=lec.nombre,
+                    material=lec.material,
+                    orden=lec.orden,
+                )
+                for lec in lecciones
+            ],
+            batch_size=TAMANO_LOTE,
+        )
+    return clon
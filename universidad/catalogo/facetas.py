@@ -0,0 +1,128 @@
+"""
+Filtros y conteos por faceta del catálogo de cursos.
+
+Los conteos son "disyuntivos": cada faceta se cuenta aplicando todos los
+filtros activos excepto el suyo, para que el cliente pueda mostrar cuántos
+cursos obtendría al cambiar ese filtro. Cada faceta se resuelve con una
+sola consulta agrupada (GROUP BY), sin importar cuántos valores tenga.
+"""
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import Case, CharField, Count, Q, Value, When
+from rest_framework.exceptions import ValidationError
+
+# (clave, mínimo inclusive, máximo exclusivo); None = sin límite
+RANGOS_PRECIO = [
+    ('gratis', None, Decimal('0.01')),
+    ('0-50', Decimal('0.01'), Decimal('50')),
+    ('50-100', Decimal('50'), Decimal('100')),
+    ('100-200', Decimal('100'), Decimal('200')),
+    ('200+', Decimal('200'), None),
+]
+
+VERDADERO = {'true', '1', 'si', 'sí'}
+FALSO = {'false', '0', 'no'}
+
+
+def _booleano(valor, nombre):
+    valor = valor.strip().lower()
+    if valor in VERDADERO:
+        return True
+    if valor in FALSO:
+        return False
+    raise ValidationError({nombre: "Debe ser true o false."})
+
+
+def _decimal(valor, nombre):
+    try:
+        numero = Decimal(valor)
+    except InvalidOperation:
+        raise ValidationError({nombre: "Debe ser un número."})
+    # Decimal acepta 'NaN' e 'Infinity', que la BD no puede comparar
+    if not numero.is_finite():
+        raise ValidationError({nombre: "Debe ser un número."})
+    return numero
+
+
+def _entero(valor, nombre):
+    try:
+        return int(valor)
+    except ValueError:
+        raise ValidationError({nombre: "Debe ser un número entero."})
+
+
+def leer_filtros(params):
+    """Convierte los query params en un dict {faceta: Q}. Solo incluye los filtros enviados."""
+    filtros = {}
+    if params.get('area'):
+        filtros['area'] = Q(area_id__in=[_entero(v, 'area') for v in params.get('area').split(',')])
+    if params.get('docente'):
+        filtros['docente'] = Q(docente__numero_registro__in=params.get('docente').split(','))
+    if params.get('certificable'):
+        filtros['certificable'] = Q(certificable=_booleano(params.get('certificable'), 'certificable'))
+    if params.get('modo_prueba'):
+        filtros['modo_prueba'] = Q(modo_prueba=_booleano(params.get('modo_prueba'), 'modo_prueba'))
+    precio = Q()
+    if params.get('precio_min'):
+        precio &= Q(precio__gte=_decimal(params.get('precio_min'), 'precio_min'))
+    if params.get('precio_max'):
+        precio &= Q(precio__lte=_decimal(params.get('precio_max'), 'precio_max'))
+    if precio:
+        filtros['precio'] = precio
+    return filtros
+
+
+def aplicar_filtros(queryset, filtros, excepto=None):
+    for faceta, condicion in filtros.items():
+        if faceta != excepto:
+            queryset = queryset.filter(condicion)
+    return queryset
+
+
+def _rango_precio():
+    casos = []
+    for clave, minimo, maximo in RANGOS_PRECIO:
+        condicion = Q()
+        if minimo is not None:
+            condicion &= Q(precio__gte=minimo)
+        if maximo is not None:
+            condicion &= Q(precio__lt=maximo)
+        casos.append(When(condicion, then=Value(clave)))
+    return Case(*casos, output_field=CharField())
+
+
+def contar_facetas(queryset, filtros):
+    """Devuelve los conteos de todas las facetas: una consulta agrupada por faceta."""
+    def base(faceta):
+        return aplicar_filtros(queryset, filtros, excepto=faceta).order_by()
+
+    areas = base('area').values('area_id', 'area__nombre').annotate(total=Count('id'))
+    docentes = (
+        base('docente')
+        .filter(docente__isnull=False)
+        .values('docente__numero_registro', 'docente__user__nombre_completo')
+        .annotate(total=Count('id'))
+    )
+    certificable = base('certificable').values('certificable').annotate(total=Count('id'))
+    modo_prueba = base('modo_prueba').values('modo_prueba').annotate(total=Count('id'))
+    precios = dict(
+        base('precio').annotate(rango=_rango_precio()).values_list('rango').annotate(total=Count('id'))
+    )
+
+    return {
+        'area': [
+            {'id': f['area_id'], 'nombre': f['area__nombre'], 'total': f['total']}
+            for f in sorted(areas, key=lambda f: f['area__nombre'])
+        ],
+        'docente': [
+            {
+                'numero_registro': f['docente__numero_registro'],
+                'nombre': f['docente__user__nombre_completo'],
+                'total': f['total']
+            }
+            for f in sorted(docentes, key=lambda f: f['docente__user__nombre_completo'])
+        ],
+        'certificable': {str(f['certificable']).lower(): f['total'] for f in certificable},
+        'modo_prueba': {str(f['modo_prueba']).lower(): f['total'] for f in modo_prueba},
+        'precio': [{'rango': clave, 'total': precios.get(clave, 0)} for clave, _, _ in RANGOS_PRECIO],
+    }
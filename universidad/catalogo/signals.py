@@ -0,0 +1,85 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from universidad.models import Alumno, Area, Curso, Docente, Leccion, Seccion
+from .actualizacion import tocar_curso, tocar_cursos, tocar_seccion
+
+
+def _en_cascada(instance, origin):
+    # Borrado por el de un padre (sección, curso, área): propaga el padre, no cada hijo
+    modelo = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return modelo is not type(instance)
+
+
+def _padre_anterior(sender, instance, campo, ruta_curso, raw, update_fields):
+    """
+    (padre, curso) guardados en la BD si el save cambia ``campo`` (lección o
+    sección movida), si no (None, None). Es la única consulta previa al save:
+    la leen estos receivers y los de ``universidad.cache.signals``.
+    """
+    if raw or instance._state.adding or instance.pk is None:
+        return None, None
+    if update_fields is not None and campo not in update_fields:
+        return None, None
+    attname = sender._meta.get_field(campo).attname
+    anterior = sender._base_manager.filter(pk=instance.pk).values_list(attname, ruta_curso).first()
+    if anterior is None or anterior[0] == getattr(instance, attname):
+        return None, None
+    return anterior
+
+
+@receiver(pre_save, sender=Leccion)
+def recordar_seccion_anterior(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._seccion_anterior, instance._curso_anterior = _padre_anterior(
+        sender, instance, 'seccion', 'seccion__curso_id', raw, update_fields
+    )
+
+
+@receiver(pre_save, sender=Seccion)
+def recordar_curso_anterior(sender, instance, raw=False, update_fields=None, **kwargs):
+    _, instance._curso_anterior = _padre_anterior(sender, instance, 'curso', 'curso_id', raw, update_fields)
+
+
+@receiver([post_save, post_delete], sender=Leccion)
+def actualizar_por_leccion(sender, instance, signal, origin=None, **kwargs):
+    if signal is post_delete:
+        if not _en_cascada(instance, origin):
+            tocar_seccion(instance.seccion_id)
+    else:
+        tocar_seccion(instance.seccion_id, instance.fecha_actualizacion)
+        # Movida a otra sección: la de origen también perdió una lección
+        if getattr(instance, '_seccion_anterior', None) is not None:
+            tocar_seccion(instance._seccion_anterior, instance.fecha_actualizacion)
+
+
+@receiver([post_save, post_delete], sender=Seccion)
+def actualizar_por_seccion(sender, instance, signal, origin=None, **kwargs):
+    if signal is post_delete:
+        if not _en_cascada(instance, origin):
+            tocar_curso(instance.curso_id)
+    else:
+        tocar_curso(instance.curso_id, instance.fecha_actualizacion)
+        if getattr(instance, '_curso_anterior', None) is not None:
+            tocar_curso(instance._curso_anterior, instance.fecha_actualizacion)
+
+
+@receiver(post_save, sender=Area)
+def actualizar_por_area(sender, instance, created, **kwargs):
+    # Los detalles incluyen area_nombre
+    if not created:
+        tocar_cursos(instance.cursos.all(), instance.fecha_actualizacion)
+
+
+@receiver(post_save, sender=Alumno)
+def actualizar_por_nombre_docente(sender, instance, created, update_fields=None, **kwargs):
+    # docente_nombre vive en el usuario del docente (el login guarda solo last_login)
+    if created or (update_fields is not None and 'nombre_completo' not in update_fields):
+        return
+    tocar_cursos(Curso.objects.filter(docente__user=instance))
+
+
+@receiver(pre_delete, sender=Docente)
+def actualizar_por_docente_borrado(sender, instance, **kwargs):
+    # Sus cursos quedan con docente NULL por un UPDATE que no dispara señales
+    tocar_cursos(Curso.objects.filter(docente=instance))
@@ -0,0 +1,3 @@
+from .manejadores import MANEJADORES, SUSCRIPCIONES, manejador
+from .publicacion import publicar
+from .worker import Worker, reclamar
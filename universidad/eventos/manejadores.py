@@ -0,0 +1,95 @@
+"""
+Manejadores de los eventos de la bandeja de salida.
+
+Cada evento se reparte a los manejadores suscritos en ``SUSCRIPCIONES``. Un
+manejador recibe la fila ``EventoSalida`` y debe tolerar ejecutarse más de
+una vez (entrega al menos una vez): si falla a mitad de camino se reintenta completo.
+"""
+import json
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.utils import timezone
+
+MANEJADORES = {}
+
+# evento → manejadores que lo procesan
+SUSCRIPCIONES = {
+    'compra.creada': ['recibo_alumno', 'aviso_docente', 'analitica', 'ranking'],
+}
+
+# Grupo de concurrencia de cada manejador (ver EVENTOS['LIMITES'])
+GRUPOS = {}
+
+
+def manejador(nombre, grupo=None):
+    def registrar(funcion):
+        MANEJADORES[nombre] = funcion
+        GRUPOS[nombre] = grupo or nombre
+        return funcion
+    return registrar
+
+
+def _compra(datos):
+    from universidad.models import Compra
+    return (
+        Compra.objects.select_related('alumno', 'curso__docente__user')
+        .filter(pk=datos['compra']).first()
+    )
+
+
+@manejador('recibo_alumno', grupo='correo')
+def recibo_alumno(evento):
+    compra = _compra(evento.datos)
+    if compra is None:
+        return  # la compra se borró después: no hay nada que avisar
+    tipo = "acceso de prueba" if compra.es_trial else "compra"
+    send_mail(
+        subject=f"Recibo de tu {tipo}: {compra.curso.nombre}",
+        message=(
+            f"Hola {compra.alumno.nombre_completo},\n\n"
+            f"Registramos tu {tipo} del curso \"{compra.curso.nombre}\" "
+            f"el {timezone.localtime(compra.fecha_compra):%d/%m/%Y %H:%M}.\n"
+            f"Precio: {compra.curso.precio}\n"
+        ),
+        from_email=None,
+        recipient_list=[compra.alumno.email],
+    )
+
+
+@manejador('aviso_docente', grupo='correo')
+def aviso_docente(evento):
+    compra = _compra(evento.datos)
+    if compra is None or compra.curso.docente is None:
+        return
+    send_mail(
+        subject=f"Nuevo alumno en {compra.curso.nombre}",
+        message=f"{compra.alumno.nombre_completo} se inscribió en tu curso \"{compra.curso.nombre}\".\n",
+        from_email=None,
+        recipient_list=[compra.curso.docente.user.email],
+    )
+
+
+_lock_analitica = threading.Lock()
+
+
+@manejador('analitica')
+def analitica(evento):
+    """Agrega el evento como una línea JSON al archivo de analítica (el id permite descartar duplicados)."""
+    ruta = Path(getattr(settings, 'ANALITICA_ARCHIVO', Path(settings.BASE_DIR) / 'analitica.jsonl'))
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    linea = json.dumps(
+        {'id': evento.pk, 'evento': evento.evento, 'fecha': evento.fecha_creacion, **evento.datos},
+        ensure_ascii=False, default=str,
+    )
+    with _lock_analitica, open(ruta, 'a', encoding='utf-8') as archivo:
+        archivo.write(linea + '\n')
+
+
+@manejador('ranking')
+def ranking(evento):
+    """Suma la compra a los puntajes de popularidad y tendencia (no la suma dos veces)."""
+    from universidad.ranking import registrar_compras
+    registrar_compras([evento.datos['compra']])
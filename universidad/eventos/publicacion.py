@@ -0,0 +1,24 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .manejadores import SUSCRIPCIONES
+
+
+def publicar(evento, datos):
+    """
+    Escribe el evento en la bandeja de salida, una fila por manejador suscrito.
+    Debe llamarse dentro de la transacción del cambio que lo origina: si esa
+    transacción se revierte, el evento tampoco existe.
+    """
+    from universidad.models import EventoSalida
+
+    ahora = timezone.now()
+    filas = [
+        EventoSalida(evento=evento, manejador=nombre, datos=datos, disponible_desde=ahora)
+        for nombre in SUSCRIPCIONES.get(evento, [])
+    ]
+    if filas:
+        if not transaction.get_connection().in_atomic_block:
+            raise RuntimeError("publicar() debe llamarse dentro de transaction.atomic()")
+        EventoSalida.objects.bulk_create(filas)
+    return filas
@@ -0,0 +1,140 @@
+"""
+Procesamiento de la bandeja de salida.
+
+``reclamar`` toma un lote de eventos disponibles y los marca como
+``procesando`` a nombre de este worker por ``LEASE`` segundos:
+
+- en bases con ``SKIP LOCKED`` (PostgreSQL) se usa
+  ``select_for_update(skip_locked=True)``, así varios workers reparten
+  filas sin esperarse;
+- en SQLite (un solo escritor a la vez) un ``UPDATE ... WHERE id IN
+  (SELECT ... LIMIT n)`` con un token del reclamo es atómico y cumple lo mismo.
+
+Si un worker muere, sus filas vuelven a estar disponibles al vencer el lease.
+Cada manejador corre en un pool de hilos con límite por grupo
+(``EVENTOS['LIMITES']``, p. ej. pocas conexiones SMTP a la vez). Los fallos
+se reintentan con espera exponencial hasta ``MAX_INTENTOS``.
+"""
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .manejadores import GRUPOS, MANEJADORES
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'LOTE': 50,
+    'CONCURRENCIA': 4,
+    'LIMITES': {'correo': 2},
+    'MAX_INTENTOS': 5,
+    'BACKOFF': 30,      # segundos; se duplica en cada intento
+    'LEASE': 5 * 60,    # segundos que un worker retiene un lote
+}
+
+
+def configuracion():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'EVENTOS', {}))
+    return config
+
+
+def _disponibles(ahora):
+    from universidad.models import EventoSalida
+    return EventoSalida.objects.filter(
+        Q(estado=EventoSalida.PENDIENTE, disponible_desde__lte=ahora)
+        | Q(estado=EventoSalida.PROCESANDO, reclamado_hasta__lt=ahora)
+    ).order_by('id')
+
+
+def reclamar(lote, lease):
+    from universidad.models import EventoSalida
+
+    ahora = timezone.now()
+    token = uuid.uuid4().hex
+    cambios = {
+        'estado': EventoSalida.PROCESANDO,
+        'reclamado_por': token,
+        'reclamado_hasta': ahora + timedelta(seconds=lease),
+    }
+    with transaction.atomic():
+        if connection.features.has_select_for_update_skip_locked:
+            ids = list(
+                _disponibles(ahora).select_for_update(skip_locked=True).values_list('id', flat=True)[:lote]
+            )
+            EventoSalida.objects.filter(id__in=ids).update(**cambios)
+        else:
+            ids = _disponibles(ahora).values('id')[:lote]
+            EventoSalida.objects.filter(id__in=ids).update(**cambios)
+    return list(EventoSalida.objects.filter(reclamado_por=token).order_by('id'))
+
+
+class Worker:
+    def __init__(self, **opciones):
+        config = configuracion()
+        config.update(opciones)
+        self.config = config
+        self.limites = defaultdict(lambda: threading.BoundedSemaphore(config['CONCURRENCIA']))
+        for grupo, limite in config['LIMITES'].items():
+            self.limites[grupo] = threading.BoundedSemaphore(limite)
+
+    def _ejecutar(self, evento):
+        """Corre el manejador del evento en un hilo del pool. Devuelve el error o None."""
+        funcion = MANEJADORES.get(evento.manejador)
+        if funcion is None:
+            return f"Manejador desconocido: {evento.manejador}"
+        try:
+            with self.limites[GRUPOS[evento.manejador]]:
+                funcion(evento)
+        except Exception as exc:
+            logger.exception("Falló %s para el evento %s", evento.manejador, evento.pk)
+            return f"{type(exc).__name__}: {exc}"
+        finally:
+            # Cada hilo del pool abre su propia conexión: cerrarla al terminar
+            connections.close_all()
+        return None
+
+    def _registrar(self, evento, error):
+        from universidad.models import EventoSalida
+
+        ahora = timezone.now()
+        evento.reclamado_por = ''
+        evento.reclamado_hasta = None
+        if error is None:
+            evento.estado = EventoSalida.HECHO
+            evento.fecha_procesado = ahora
+            evento.ultimo_error = ''
+        else:
+            evento.intentos += 1
+            evento.ultimo_error = error[:2000]
+            if evento.intentos >= self.config['MAX_INTENTOS']:
+                evento.estado = EventoSalida.FALLIDO
+            else:
+                evento.estado = EventoSalida.PENDIENTE
+                espera = self.config['BACKOFF'] * 2 ** (evento.intentos - 1)
+                evento.disponible_desde = ahora + timedelta(seconds=espera)
+
+    def procesar_lote(self):
+        """Reclama y procesa un lote. Devuelve {'procesados', 'fallidos'}."""
+        from universidad.models import EventoSalida
+
+        eventos = reclamar(self.config['LOTE'], self.config['LEASE'])
+        if not eventos:
+            return {'procesados': 0, 'fallidos': 0}
+        with ThreadPoolExecutor(max_workers=self.config['CONCURRENCIA']) as pool:
+            errores = list(pool.map(self._ejecutar, eventos))
+        for evento, error in zip(eventos, errores):
+            self._registrar(evento, error)
+        EventoSalida.objects.bulk_update(eventos, [
+            'estado', 'intentos', 'disponible_desde', 'reclamado_por', 'reclamado_hasta',
+            'ultimo_error', 'fecha_procesado',
+        ])
+        return {'procesados': len(eventos), 'fallidos': sum(1 for e in errores if e is not None)}
@@ -0,0 +1,2 @@
+from .cubetas import CubetasCache, CubetasLocales, leer_tasa
+from .throttle import CubetaThrottle, alcance_de, apermitir, identificar, metricas, permitir
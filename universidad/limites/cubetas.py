@@ -0,0 +1,83 @@
+"""
+Cubetas de tokens para limitar peticiones.
+
+Una tasa ``"60/min"`` es una cubeta de 60 tokens que se recarga de forma
+uniforme (uno cada segundo): permite ráfagas de hasta 60 y, sostenido, 60
+por minuto. Se implementa como GCRA: por clave se guarda un solo número, el
+momento teórico (``tat``) en que la cubeta volvería a estar llena, así que
+consumir es leer y escribir un valor.
+
+- ``CubetasLocales``: un dict del proceso, sin locks (leer y asignar una
+  clave de un dict es atómico con el GIL). Dos hilos que consumen a la vez
+  la misma clave pueden dejar pasar una petición de más; para frenar abuso
+  alcanza. El límite es por worker. Guarda a lo sumo ``max_claves``
+  cubetas: al pasarse descarta la usada hace más tiempo (LRU), en O(1).
+- ``CubetasCache``: la cache de Django (Redis en producción), compartida
+  entre workers. Es un get + set, con la misma tolerancia a carreras y un
+  viaje a la cache por petición.
+"""
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache
+
+PERIODOS = {'s': 1, 'sec': 1, 'min': 60, 'm': 60, 'hour': 3600, 'h': 3600, 'day': 86400, 'd': 86400}
+
+
+def leer_tasa(tasa):
+    """``"60/min"`` → (60, 60.0). ``None`` = sin límite."""
+    if tasa is None:
+        return None
+    cantidad, periodo = tasa.split('/')
+    return int(cantidad), float(PERIODOS[periodo])
+
+
+def _consumir(tat, ahora, cantidad, periodo):
+    """(nuevo tat o None si se rechaza, segundos de espera)."""
+    intervalo = periodo / cantidad
+    nuevo = max(tat if tat is not None else ahora, ahora) + intervalo
+    espera = nuevo - ahora - periodo
+    if espera > 0:
+        return None, espera
+    return nuevo, 0.0
+
+
+class CubetasLocales:
+    """Cubetas en memoria del proceso."""
+
+    def __init__(self, max_claves=100_000):
+        self.max_claves = max_claves
+        self._tat = OrderedDict()  # de la usada hace más tiempo a la más reciente
+
+    def consumir(self, clave, cantidad, periodo):
+        """Consume un token; devuelve 0 si se permite o los segundos a esperar."""
+        ahora = time.monotonic()
+        nuevo, espera = _consumir(self._tat.get(clave), ahora, cantidad, periodo)
+        if nuevo is not None:
+            # Sacar y volver a poner la deja al final sin move_to_end, que falla
+            # si otro hilo la descartó en el medio
+            self._tat.pop(clave, None)
+            self._tat[clave] = nuevo
+            if len(self._tat) > self.max_claves:
+                self._tat.popitem(last=False)
+        return espera
+
+    def limpiar(self):
+        self._tat.clear()
+
+
+class CubetasCache:
+    """Cubetas en la cache compartida de Django."""
+    prefijo = 'limites'
+
+    def consumir(self, clave, cantidad, periodo):
+        ahora = time.time()
+        clave = f'{self.prefijo}:{clave}'
+        nuevo, espera = _consumir(cache.get(clave), ahora, cantidad, periodo)
+        if nuevo is not None:
+            # La entrada vence cuando la cubeta ya estaría llena otra vez
+            cache.set(clave, nuevo, timeout=int(nuevo - ahora) + 1)
+        return espera
+
+    def limpiar(self):
+        pass  # las entradas vencen solas
@@ -0,0 +1,141 @@
+"""
+Límite de peticiones por rol y por endpoint (``LIMITES`` en settings).
+
+Cada vista declara su alcance con ``throttle_scope`` (como en DRF) o, en un
+viewset, por acción con ``throttle_scopes = {'detalle': 'catalogo', ...}``;
+sin declarar, es ``general``. La tasa sale de ``LIMITES['TASAS'][alcance][rol]``
+y, si ese alcance no define el rol, de ``general``. Los roles son
+``anonimo`` (por IP), ``Alumno``, ``Docente`` y ``Administrador`` (por usuario).
+
+El rol se lee del claim ``rol`` del JWT (lo agrega el login); los tokens sin
+ese claim lo resuelven con la cache de permisos. Así decidir si una petición
+pasa no hace consultas.
+"""
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework.throttling import BaseThrottle
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .cubetas import CubetasCache, CubetasLocales, leer_tasa
+
+DEFAULTS = {
+    'BACKEND': 'local',
+    'TASAS': {'general': {}},
+}
+
+ANONIMO = 'anonimo'
+
+_config = None
+_backend = None
+_tasas = {}
+
+# (alcance, rol) → [permitidas, rechazadas] en este proceso. Sin lock: con
+# mucha concurrencia puede perderse algún incremento
+contadores = defaultdict(lambda: [0, 0])
+
+
+def configuracion():
+    global _config
+    if _config is None:
+        config = dict(DEFAULTS)
+        config.update(getattr(settings, 'LIMITES', {}))
+        _config = config
+    return _config
+
+
+def backend():
+    global _backend
+    if _backend is None:
+        _backend = CubetasCache() if configuracion()['BACKEND'] == 'cache' else CubetasLocales()
+    return _backend
+
+
+def tasa(alcance, rol):
+    """(cantidad, periodo) o None si ese rol no tiene límite en el alcance."""
+    clave = (alcance, rol)
+    if clave not in _tasas:
+        tasas = configuracion()['TASAS']
+        propias = tasas.get(alcance, {})
+        valor = propias[rol] if rol in propias else tasas.get('general', {}).get(rol)
+        _tasas[clave] = leer_tasa(valor)
+    return _tasas[clave]
+
+
+def permitir(alcance, rol, identidad):
+    """0 si la petición pasa; si no, los segundos que conviene esperar."""
+    limite = tasa(alcance, rol)
+    if limite is None:
+        return 0.0
+    espera = backend().consumir(f'{alcance}:{rol}:{identidad}', *limite)
+    contadores[(alcance, rol)][0 if espera == 0 else 1] += 1
+    return espera
+
+
+async def apermitir(alcance, rol, identidad):
+    """``permitir`` para vistas asíncronas: la cache compartida se consulta fuera del event loop."""
+    if isinstance(backend(), CubetasLocales):
+        return permitir(alcance, rol, identidad)
+    return await sync_to_async(permitir, thread_sensitive=False)(alcance, rol, identidad)
+
+
+def metricas():
+    return {
+        'backend': configuracion()['BACKEND'],
+        'contadores': {
+            f'{alcance}:{rol}': {'permitidas': permitidas, 'rechazadas': rechazadas}
+            for (alcance, rol), (permitidas, rechazadas) in sorted(contadores.copy().items())
+        },
+    }
+
+
+def alcance_de(view, accion=None):
+    """Alcance de una vista (o de la acción ``accion`` de una clase de viewset)."""
+    alcances = getattr(view, 'throttle_scopes', None)
+    accion = accion or getattr(view, 'action', None)
+    if alcances and accion in alcances:
+        return alcances[accion]
+    return getattr(view, 'throttle_scope', None) or 'general'
+
+
+def rol_de(user, token):
+    if not user or not user.is_authenticated:
+        return ANONIMO
+    rol = token.get('rol') if token is not None else None
+    if rol:
+        return rol
+    from universidad.cache.permisos import rol_usuario
+    return rol_usuario(user)
+
+
+def identificar(request):
+    """
+    (rol, identidad) de una petición que no pasa por DRF (vistas asíncronas).
+    El JWT se valida (firma y vencimiento) sin buscar al usuario; un token sin
+    el claim ``rol`` (anterior a este cambio) cuenta como Alumno.
+    """
+    partes = request.META.get(jwt_settings.AUTH_HEADER_NAME, '').split()
+    if len(partes) == 2 and partes[0] in jwt_settings.AUTH_HEADER_TYPES:
+        try:
+            token = AccessToken(partes[1])
+        except TokenError:
+            pass
+        else:
+            return token.get('rol') or 'Alumno', token.get(jwt_settings.USER_ID_CLAIM)
+    return ANONIMO, BaseThrottle().get_ident(request)
+
+
+class CubetaThrottle(BaseThrottle):
+    """Throttle de DRF con cubetas de tokens; la espera va en ``Retry-After``."""
+
+    def allow_request(self, request, view):
+        rol = rol_de(request.user, request.auth)
+        identidad = self.get_ident(request) if rol == ANONIMO else request.user.pk
+        self.espera = permitir(alcance_de(view), rol, identidad)
+        return self.espera == 0
+
+    def wait(self):
+        return self.espera
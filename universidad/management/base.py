@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+
+class ComandoProgramado(BaseCommand):
+    """
+    Base de los comandos que corren desde cron o como workers.
+
+    No corren los system checks: importarían el URLconf, DRF y todos los
+    viewsets solo para validarlos, en cada ejecución. Se validan al desplegar
+    (``check``, ``migrate``).
+    """
+    requires_system_checks = []
@@ -0,0 +1,20 @@
+import time
+
+from universidad.management.base import ComandoProgramado
+from universidad.ranking import actualizar
+
+
+class Command(ComandoProgramado):
+    help = "Suma al ranking del catálogo las compras que no llegaron por eventos (?orden=popular|tendencia)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--completo', action='store_true',
+                            help="Reconstruir el ranking desde cero (tras cambiar vidas medias o EPOCA).")
+
+    def handle(self, *args, **options):
+        inicio = time.perf_counter()
+        resultado = actualizar(completo=options['completo'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Ranking ({resultado['modo']}): {resultado['compras']} compras sumadas "
+            f"en {time.perf_counter() - inicio:.1f} s."
+        ))
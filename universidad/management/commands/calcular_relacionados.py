@@ -0,0 +1,22 @@
+import time
+
+from universidad.management.base import ComandoProgramado
+from universidad.recomendaciones import calcular
+
+
+class Command(ComandoProgramado):
+    help = "Calcula los cursos relacionados por compras en común (GET /cursos/<id>/relacionados/)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--completo', action='store_true',
+                            help="Recalcular todos los cursos (por defecto solo los afectados por compras nuevas).")
+        parser.add_argument('--k', type=int, help="Cursos relacionados que se guardan por curso.")
+        parser.add_argument('--min-comunes', type=int, help="Compradores en común mínimos.")
+
+    def handle(self, *args, **options):
+        inicio = time.perf_counter()
+        resultado = calcular(completo=options['completo'], k=options['k'], min_comunes=options['min_comunes'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Relacionados ({resultado['modo']}): {resultado['compras']} compras, "
+            f"{resultado['cursos']} cursos, {resultado['filas']} filas en {time.perf_counter() - inicio:.1f} s."
+        ))
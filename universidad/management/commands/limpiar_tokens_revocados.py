@@ -0,0 +1,12 @@
+from django.utils import timezone
+
+from universidad.management.base import ComandoProgramado
+from universidad.models import TokenRevocado
+
+
+class Command(ComandoProgramado):
+    help = "Borra las revocaciones de tokens que ya vencieron (el token no valdría de todas formas)."
+
+    def handle(self, *args, **options):
+        borradas, _ = TokenRevocado.objects.filter(expira__lte=timezone.now()).delete()
+        self.stdout.write(self.style.SUCCESS(f"Revocaciones vencidas borradas: {borradas}."))
@@ -0,0 +1,39 @@
+import time
+
+from universidad.eventos import Worker
+from universidad.management.base import ComandoProgramado
+
+
+class Command(ComandoProgramado):
+    help = "Procesa la bandeja de salida de eventos (recibos, avisos a docentes, analítica)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lote', type=int, help="Eventos que se reclaman por vez.")
+        parser.add_argument('--concurrencia', type=int, help="Hilos para ejecutar manejadores.")
+        parser.add_argument('--intervalo', type=float, default=2.0,
+                            help="Segundos de espera cuando no hay eventos pendientes.")
+        parser.add_argument('--una-vez', action='store_true', help="Vaciar lo pendiente y terminar.")
+
+    def handle(self, *args, **options):
+        opciones = {}
+        if options['lote']:
+            opciones['LOTE'] = options['lote']
+        if options['concurrencia']:
+            opciones['CONCURRENCIA'] = options['concurrencia']
+        worker = Worker(**opciones)
+
+        total = fallidos = 0
+        try:
+            while True:
+                resultado = worker.procesar_lote()
+                total += resultado['procesados']
+                fallidos += resultado['fallidos']
+                if resultado['procesados']:
+                    self.stdout.write(f"Lote: {resultado['procesados']} eventos, {resultado['fallidos']} con error.")
+                    continue
+                if options['una_vez']:
+                    break
+                time.sleep(options['intervalo'])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"Procesados: {total}, con error: {fallidos}."))
@@ -0,0 +1,29 @@
+from universidad.management.base import ComandoProgramado
+from universidad.media import recolectar
+
+
+class Command(ComandoProgramado):
+    help = "Borra de Cloudinary los archivos liberados que ya no usa ninguna fila."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lote', type=int, default=100, help="Archivos por llamada a la API (máx. 100).")
+        parser.add_argument('--max-intentos', type=int, default=5,
+                            help="Se ignoran los archivos que ya fallaron esta cantidad de corridas.")
+        parser.add_argument('--reintentos', type=int, default=3, help="Reintentos por lote dentro de la corrida.")
+        parser.add_argument('--espera', type=float, default=1.0, help="Espera inicial entre reintentos (segundos).")
+        parser.add_argument('--dry-run', action='store_true', help="Solo mostrar qué se borraría.")
+
+    def handle(self, *args, **options):
+        resumen = recolectar(
+            lote=options['lote'],
+            max_intentos=options['max_intentos'],
+            reintentos=options['reintentos'],
+            espera=options['espera'],
+            dry_run=options['dry_run'],
+            log=self.stdout.write,
+        )
+        prefijo = "[dry-run] " if options['dry_run'] else ""
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefijo}Revisados: {resumen['revisados']}, en uso: {resumen['en_uso']}, "
+            f"borrados: {resumen['borrados']}, fallidos: {resumen['fallidos']}."
+        ))
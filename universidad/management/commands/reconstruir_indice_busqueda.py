@@ -0,0 +1,10 @@
+from universidad.busqueda import reconstruir_indice
+from universidad.management.base import ComandoProgramado
+
+
+class Command(ComandoProgramado):
+    help = "Reconstruye desde cero el índice de búsqueda de cursos."
+
+    def handle(self, *args, **options):
+        total = reconstruir_indice()
+        self.stdout.write(self.style.SUCCESS(f"Índice reconstruido: {total} cursos indexados."))
@@ -0,0 +1,3 @@
+from .subidas import es_pdf, opciones_subida, subir_archivo, subir_en_paralelo, asubir_en_paralelo
+from .recoleccion import campos_media, en_uso, liberar, recolectar
+from .http import ClienteHTTP, cliente_http, instalar_en_sdk
@@ -0,0 +1,152 @@
+"""
+Backends de almacenamiento de medios.
+
+Todo lo que sube o borra archivos (``CampoMedia``, ``subir_archivo``, la
+recolección de huérfanos) pasa por ``obtener_backend()``. Se elige con
+``MEDIA_BACKEND`` en settings:
+
+- ``'cloudinary'``: el servicio real (por defecto);
+- ``'local'``: guarda en disco con la misma semántica de Cloudinary
+  (public_id, resource_type, type, versión y formato) para trabajar sin red,
+  correr pruebas o hacer benchmarks; admite latencia artificial.
+
+Las URLs se siguen generando con ``CloudinaryResource.url``: en modo local
+``settings.py`` configura el SDK para que apunten a ``/media/local/``.
+"""
+import mimetypes
+import secrets
+import string
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+BACKENDS = {
+    'cloudinary': 'universidad.media.backends.CloudinaryBackend',
+    'local': 'universidad.media.backends.LocalBackend',
+}
+
+_ALFABETO = string.ascii_lowercase + string.digits
+
+
+class CloudinaryBackend:
+    def __init__(self):
+        from .http import instalar_en_sdk
+        # Subidas, borrados y consultas del SDK por el pool HTTP compartido
+        self.http = instalar_en_sdk()
+
+    def subir(self, archivo, **opciones):
+        from cloudinary import uploader
+        if hasattr(archivo, 'seekable') and archivo.seekable():
+            archivo.seek(0)
+        return uploader.upload_resource(archivo, **opciones)
+
+    def borrar(self, resource_type, tipo, public_ids):
+        """Devuelve {public_id: 'deleted' | 'not_found' | otro estado}."""
+        from cloudinary import api
+        respuesta = api.delete_resources(public_ids, resource_type=resource_type, type=tipo)
+        return respuesta.get('deleted', {})
+
+
+class LocalBackend:
+    """
+    Archivos en ``RAIZ/<resource_type>/<type>/<public_id>[.<formato>]``.
+
+    Igual que Cloudinary: el public_id es ``folder`` + 20 caracteres al azar;
+    en ``raw`` la extensión forma parte del public_id y no hay formato;
+    ``resource_type='auto'`` se resuelve por el tipo MIME (los PDF quedan como
+    ``image``, por eso ``Leccion`` los fuerza a ``raw``).
+    """
+
+    def __init__(self, raiz, latencia=0.0, latencia_por_mb=0.0):
+        self.raiz = Path(raiz)
+        self.latencia = latencia
+        self.latencia_por_mb = latencia_por_mb
+
+    def _esperar(self, tamano=0):
+        demora = self.latencia + self.latencia_por_mb * tamano / (1024 * 1024)
+        if demora > 0:
+            time.sleep(demora)
+
+    @staticmethod
+    def _resource_type(nombre, pedido):
+        if pedido != 'auto':
+            return pedido
+        mime = mimetypes.guess_type(nombre)[0] or ''
+        if mime.startswith('image/') or mime == 'application/pdf':
+            return 'image'
+        if mime.startswith(('video/', 'audio/')):
+            return 'video'
+        return 'raw'
+
+    def ruta(self, resource_type, tipo, public_id, formato=None):
+        nombre = f'{public_id}.{formato}' if formato else public_id
+        return self.raiz / resource_type / tipo / nombre
+
+    def subir(self, archivo, type='upload', resource_type='image', folder='', public_id=None, **opciones):
+        from cloudinary import CloudinaryResource
+
+        nombre = getattr(archivo, 'name', '') or ''
+        resource_type = self._resource_type(nombre, resource_type)
+        extension = Path(nombre).suffix.lower().lstrip('.') or None
+        if public_id is None:
+            public_id = ''.join(secrets.choice(_ALFABETO) for _ in range(20))
+            if folder:
+                public_id = f"{folder.strip('/')}/{public_id}"
+        if resource_type == 'raw':
+            if extension:
+                public_id = f'{public_id}.{extension}'
+            formato = None
+        else:
+            formato = extension
+
+        if hasattr(archivo, 'seekable') and archivo.seekable():
+            archivo.seek(0)
+        destino = self.ruta(resource_type, type, public_id, formato)
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        tamano = 0
+        with open(destino, 'wb') as salida:
+            trozos = archivo.chunks() if hasattr(archivo, 'chunks') else iter(lambda: archivo.read(64 * 1024), b'')
+            for trozo in trozos:
+                salida.write(trozo)
+                tamano += len(trozo)
+        self._esperar(tamano)
+
+        version = int(time.time())
+        metadata = {
+            'public_id': public_id, 'version': version, 'format': formato,
+            'resource_type': resource_type, 'type': type, 'bytes': tamano,
+            'original_filename': Path(nombre).stem,
+        }
+        return CloudinaryResource(
+            public_id, format=formato, version=version, type=type,
+            resource_type=resource_type, metadata=metadata,
+        )
+
+    def borrar(self, resource_type, tipo, public_ids):
+        self._esperar()
+        resultado = {}
+        for public_id in public_ids:
+            base = self.ruta(resource_type, tipo, public_id)
+            # En image/video el archivo lleva la extensión del formato
+            candidatos = [base] if base.is_file() else list(base.parent.glob(base.name + '.*'))
+            for candidato in candidatos:
+                candidato.unlink(missing_ok=True)
+            resultado[public_id] = 'deleted' if candidatos else 'not_found'
+        return resultado
+
+
+@lru_cache(maxsize=None)
+def obtener_backend():
+    nombre = getattr(settings, 'MEDIA_BACKEND', 'cloudinary')
+    clase = import_string(BACKENDS.get(nombre, nombre))
+    if clase is LocalBackend:
+        opciones = getattr(settings, 'MEDIA_LOCAL', {})
+        return clase(
+            raiz=opciones.get('RAIZ', Path(settings.BASE_DIR) / 'media_local'),
+            latencia=opciones.get('LATENCIA', 0.0),
+            latencia_por_mb=opciones.get('LATENCIA_POR_MB', 0.0),
+        )
+    return clase()
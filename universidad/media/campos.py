@@ -0,0 +1,30 @@
+from cloudinary.models import CloudinaryField
+from django.core.files.uploadedfile import UploadedFile
+
+from .backends import obtener_backend
+
+
+class CampoMedia(CloudinaryField):
+    """
+    CloudinaryField que sube a través del backend de medios configurado.
+
+    Además respeta ``archivo.resource_type`` si la vista o el modelo lo fijan
+    antes de guardar (``Leccion.save`` lo usa para subir los PDF como ``raw``).
+    """
+
+    def pre_save(self, model_instance, add):
+        value = getattr(model_instance, self.attname)
+        if not isinstance(value, UploadedFile):
+            return value
+        options = {
+            "type": self.type,
+            "resource_type": getattr(value, 'resource_type', None) or self.resource_type,
+        }
+        options.update({key: val(model_instance) if callable(val) else val for key, val in self.options.items()})
+        recurso = obtener_backend().subir(value, **options)
+        setattr(model_instance, self.attname, recurso)
+        if self.width_field:
+            setattr(model_instance, self.width_field, recurso.metadata.get('width'))
+        if self.height_field:
+            setattr(model_instance, self.height_field, recurso.metadata.get('height'))
+        return self.get_prep_value(recurso)
@@ -0,0 +1,178 @@
+"""
+Cliente HTTP compartido para las llamadas al servicio de medios.
+
+El SDK de Cloudinary crea al importarse un ``PoolManager`` por módulo
+(``uploader`` y ``api_client``) con los valores por defecto de urllib3:
+una sola conexión guardada por host, sin timeouts ni reintentos. Con varias
+subidas en paralelo, cada conexión extra se descarta al terminar y la
+siguiente llamada vuelve a pagar el handshake TLS.
+
+``ClienteHTTP`` arma un único pool con keep-alive, ``MAX_POR_HOST`` conexiones
+por host (``block=True``: si están todas ocupadas se espera en lugar de abrir
+otra), timeouts y reintentos con backoff, y lleva métricas de uso.
+``instalar_en_sdk`` lo pone en lugar de los pools del SDK.
+
+Se configura en ``settings.MEDIA_HTTP``:
+
+    MEDIA_HTTP = {
+        'MAX_POR_HOST': 8,
+        'MAX_HOSTS': 10,
+        'TIMEOUT_CONEXION': 5,
+        'TIMEOUT_LECTURA': 120,
+        'REINTENTOS': 3,
+        'BACKOFF': 0.5,
+    }
+"""
+import socket
+import threading
+import time
+
+import urllib3
+from django.conf import settings
+from urllib3.connection import HTTPConnection
+from urllib3.util import Retry, Timeout
+
+DEFAULTS = {
+    'MAX_POR_HOST': 8,
+    'MAX_HOSTS': 10,
+    'TIMEOUT_CONEXION': 5,
+    'TIMEOUT_LECTURA': 120,
+    'REINTENTOS': 3,
+    'BACKOFF': 0.5,
+}
+
+# Estados que Cloudinary devuelve ante sobrecarga; solo se reintentan en métodos idempotentes
+ESTADOS_REINTENTABLES = (429, 500, 502, 503, 504)
+
+
+def _configuracion():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'MEDIA_HTTP', {}))
+    return config
+
+
+class _Metricas:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.peticiones = 0
+        self.errores = 0
+        self.segundos = 0.0
+
+    def registrar(self, segundos, error):
+        with self._lock:
+            self.peticiones += 1
+            self.segundos += segundos
+            if error:
+                self.errores += 1
+
+
+class _MedicionMixin:
+    """Mide cada petición del manager (tiempo total, incluidos los reintentos)."""
+
+    def __init__(self, *args, metricas, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metricas = metricas
+
+    def urlopen(self, method, url, redirect=True, **kw):
+        inicio = time.perf_counter()
+        error = True
+        try:
+            respuesta = super().urlopen(method, url, redirect=redirect, **kw)
+            error = respuesta.status >= 500
+            return respuesta
+        finally:
+            self.metricas.registrar(time.perf_counter() - inicio, error)
+
+
+class _PoolManagerMedido(_MedicionMixin, urllib3.PoolManager):
+    pass
+
+
+class _ProxyManagerMedido(_MedicionMixin, urllib3.ProxyManager):
+    pass
+
+
+class ClienteHTTP:
+    def __init__(self, **opciones):
+        config = _configuracion()
+        config.update(opciones)
+        self.metricas = _Metricas()
+        self.pool = self._crear_pool(config)
+
+    def _crear_pool(self, config):
+        import cloudinary
+
+        kwargs = dict(
+            num_pools=config['MAX_HOSTS'],
+            maxsize=config['MAX_POR_HOST'],
+            block=True,
+            timeout=Timeout(connect=config['TIMEOUT_CONEXION'], read=config['TIMEOUT_LECTURA']),
+            # Los errores de conexión se reintentan siempre (la petición no salió);
+            # los de lectura y los estados 5xx/429 solo en métodos idempotentes
+            retries=Retry(
+                total=config['REINTENTOS'],
+                backoff_factor=config['BACKOFF'],
+                status_forcelist=ESTADOS_REINTENTABLES,
+                raise_on_status=False,
+                respect_retry_after_header=True,
+            ),
+            socket_options=HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+            metricas=self.metricas,
+            **cloudinary.CERT_KWARGS,
+        )
+        proxy = cloudinary.config().api_proxy
+        if proxy:
+            return _ProxyManagerMedido(proxy, **kwargs)
+        return _PoolManagerMedido(**kwargs)
+
+    def request(self, method, url, **kwargs):
+        return self.pool.request(method, url, **kwargs)
+
+    def metricas_pool(self):
+        """
+        Métricas por host: conexiones abiertas en total, peticiones hechas,
+        cuántas reutilizaron una conexión y cuántas conexiones libres hay ahora.
+        """
+        hosts = {}
+        for clave in list(self.pool.pools.keys()):
+            pool = self.pool.pools.get(clave)
+            if pool is None:
+                continue
+            hosts[f'{clave.key_scheme}://{clave.key_host}:{clave.key_port}'] = {
+                'conexiones_abiertas': pool.num_connections,
+                'peticiones': pool.num_requests,
+                'reutilizadas': max(pool.num_requests - pool.num_connections, 0),
+                'libres': pool.pool.qsize() if pool.pool is not None else 0,
+                'max': pool.pool.maxsize if pool.pool is not None else 0,
+            }
+        m = self.metricas
+        return {
+            'peticiones': m.peticiones,
+            'errores': m.errores,
+            'ms_promedio': round(m.segundos * 1000 / m.peticiones, 2) if m.peticiones else 0.0,
+            'hosts': hosts,
+        }
+
+
+_cliente = None
+_lock = threading.Lock()
+
+
+def cliente_http():
+    global _cliente
+    if _cliente is None:
+        with _lock:
+            if _cliente is None:
+                _cliente = ClienteHTTP()
+    return _cliente
+
+
+def instalar_en_sdk(cliente=None):
+    """Hace que las subidas, borrados y consultas del SDK de Cloudinary usen el pool compartido."""
+    from cloudinary import uploader
+    from cloudinary.api_client import call_api
+
+    cliente = cliente or cliente_http()
+    for modulo in (uploader, call_api):
+        modulo._http = cliente.pool
+    return cliente
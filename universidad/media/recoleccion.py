@@ -0,0 +1,166 @@
+"""
+Recolección de archivos huérfanos de Cloudinary.
+
+Las señales anotan en ``MedioLiberado`` cada valor de CloudinaryField que
+deja de usarse (borrado de la fila, también en cascada, o reemplazo del
+archivo). ``recolectar`` los borra por lotes a través del backend de medios:
+
+- antes de borrar se revisa que ningún CloudinaryField siga apuntando al mismo
+  valor (los cursos clonados comparten los archivos del original);
+- ``delete_resources`` acepta hasta 100 public_ids por llamada y por
+  (resource_type, type); los errores se reintentan con espera exponencial y,
+  si siguen fallando, la fila queda para la próxima corrida con ``intentos + 1``.
+"""
+import time
+from collections import defaultdict
+from functools import lru_cache
+
+from cloudinary.models import CloudinaryField
+from django.apps import apps
+from django.core.files.uploadedfile import UploadedFile
+
+from .backends import obtener_backend
+
+TAMANO_LOTE = 100  # máximo de public_ids por llamada a delete_resources
+
+
+@lru_cache(maxsize=None)
+def campos_media():
+    """Pares (modelo, campo) de todos los CloudinaryField de la app."""
+    return tuple(
+        (modelo, campo)
+        for modelo in apps.get_app_config('universidad').get_models()
+        for campo in modelo._meta.concrete_fields
+        if isinstance(campo, CloudinaryField)
+    )
+
+
+def valor_guardado(campo, valor):
+    """Valor tal como está en la BD, o None si no hay archivo de Cloudinary."""
+    if not valor or isinstance(valor, UploadedFile):
+        return None
+    valor = campo.get_prep_value(valor)
+    return valor if isinstance(valor, str) and valor else None
+
+
+def liberar(modelo, campo, valores):
+    """Anota en la bandeja de salida los valores que ``modelo.campo`` dejó de usar."""
+    from universidad.models import MedioLiberado
+
+    filas = []
+    for valor in valores:
+        valor = valor_guardado(campo, valor)
+        if valor is None:
+            continue
+        recurso = campo.parse_cloudinary_resource(valor)
+        public_id = recurso.public_id
+        if recurso.resource_type == 'raw' and recurso.format:
+            # En raw la extensión es parte del public_id, pero el valor guardado la separa como formato
+            public_id = f'{public_id}.{recurso.format}'
+        filas.append(MedioLiberado(
+            valor=valor,
+            public_id=public_id,
+            resource_type=recurso.resource_type,
+            tipo=recurso.type,
+            origen=f'{modelo._meta.model_name}.{campo.name}',
+        ))
+    if filas:
+        MedioLiberado.objects.bulk_create(filas, ignore_conflicts=True)
+
+
+def en_uso(valores):
+    """Subconjunto de ``valores`` que todavía aparece en algún CloudinaryField."""
+    usados = set()
+    for modelo, campo in campos_media():
+        # values_list devuelve CloudinaryResource (from_db_value): volver al valor guardado
+        usados.update(
+            campo.get_prep_value(valor)
+            for valor in modelo._base_manager.filter(**{f'{campo.attname}__in': valores})
+            .values_list(campo.attname, flat=True)
+        )
+    return usados
+
+
+def borrar_en_servicio(resource_type, tipo, public_ids):
+    """
+    Borra ``public_ids`` con el backend de medios.
+    Devuelve {public_id: None si se borró (o ya no existía) | mensaje de error}.
+    """
+    resultado = obtener_backend().borrar(resource_type, tipo, public_ids)
+    return {
+        public_id: None if resultado.get(public_id) in ('deleted', 'not_found') else str(resultado.get(public_id))
+        for public_id in public_ids
+    }
+
+
+def _con_reintentos(funcion, reintentos, espera):
+    for intento in range(reintentos):
+        try:
+            return funcion()
+        except Exception:
+            if intento == reintentos - 1:
+                raise
+            time.sleep(espera * 2 ** intento)
+
+
+def recolectar(lote=TAMANO_LOTE, max_intentos=5, reintentos=3, espera=1.0, dry_run=False, log=None):
+    """
+    Procesa la bandeja de salida completa, ``lote`` filas a la vez.
+    Devuelve un resumen con los contadores de la corrida.
+    """
+    from universidad.models import MedioLiberado
+
+    lote = min(lote, TAMANO_LOTE)
+    resumen = {'revisados': 0, 'en_uso': 0, 'borrados': 0, 'fallidos': 0}
+    ultimo_id = 0
+    while True:
+        filas = list(
+            MedioLiberado.objects.filter(id__gt=ultimo_id, intentos__lt=max_intentos).order_by('id')[:lote]
+        )
+        if not filas:
+            return resumen
+        ultimo_id = filas[-1].id
+        resumen['revisados'] += len(filas)
+
+        usados = en_uso([fila.valor for fila in filas])
+        compartidos = [fila for fila in filas if fila.valor in usados]
+        resumen['en_uso'] += len(compartidos)
+
+        grupos = defaultdict(list)
+        for fila in filas:
+            if fila.valor not in usados:
+                grupos[(fila.resource_type, fila.tipo)].append(fila)
+
+        if dry_run:
+            for (resource_type, tipo), pendientes in grupos.items():
+                resumen['borrados'] += len(pendientes)
+                if log:
+                    for fila in pendientes:
+                        log(f"[dry-run] borraría {resource_type}/{tipo}/{fila.public_id}")
+            continue
+
+        # Siguen referenciados: nada que borrar (si se liberan otra vez vuelven a la bandeja)
+        MedioLiberado.objects.filter(id__in=[fila.id for fila in compartidos]).delete()
+
+        hechos, fallidos = [], []
+        for (resource_type, tipo), pendientes in grupos.items():
+            public_ids = [fila.public_id for fila in pendientes]
+            try:
+                errores = _con_reintentos(
+                    lambda: borrar_en_servicio(resource_type, tipo, public_ids), reintentos, espera
+                )
+            except Exception as exc:
+                errores = {public_id: str(exc) for public_id in public_ids}
+            for fila in pendientes:
+                error = errores.get(fila.public_id)
+                if error is None:
+                    hechos.append(fila.id)
+                else:
+                    fila.intentos += 1
+                    fila.ultimo_error = error[:1000]
+                    fallidos.append(fila)
+
+        MedioLiberado.objects.filter(id__in=hechos).delete()
+        MedioLiberado.objects.bulk_update(fallidos, ['intentos', 'ultimo_error'])
+        resumen['borrados'] += len(hechos)
+        resumen['fallidos'] += len(fallidos)
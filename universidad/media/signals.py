@@ -0,0 +1,41 @@
+from django.db.models.signals import pre_save, pre_delete
+from django.dispatch import receiver
+
+from universidad.models import Alumno, Area, Curso, Docente, Leccion
+from .recoleccion import valor_guardado, campos_media, liberar
+
+
+def _campos(modelo):
+    return [campo for m, campo in campos_media() if m is modelo]
+
+
+@receiver(pre_delete, sender=Alumno)
+@receiver(pre_delete, sender=Docente)
+@receiver(pre_delete, sender=Area)
+@receiver(pre_delete, sender=Curso)
+@receiver(pre_delete, sender=Leccion)
+def liberar_al_borrar(sender, instance, **kwargs):
+    for campo in _campos(sender):
+        liberar(sender, campo, [campo.value_from_object(instance)])
+
+
+@receiver(pre_save, sender=Alumno)
+@receiver(pre_save, sender=Docente)
+@receiver(pre_save, sender=Area)
+@receiver(pre_save, sender=Curso)
+@receiver(pre_save, sender=Leccion)
+def liberar_al_reemplazar(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    campos = [c for c in _campos(sender) if update_fields is None or c.name in update_fields]
+    if not campos:
+        return
+    anteriores = sender._base_manager.filter(pk=instance.pk).values_list(
+        *[c.attname for c in campos]
+    ).first()
+    if anteriores is None:
+        return
+    for campo, anterior in zip(campos, anteriores):
+        anterior = valor_guardado(campo, anterior)
+        if anterior and anterior != valor_guardado(campo, campo.value_from_object(instance)):
+            liberar(sender, campo, [anterior])
@@ -0,0 +1,69 @@
+"""
+Subidas de archivos fuera del ``save()`` del modelo.
+
+Replica las opciones que usa ``CloudinaryField.pre_save`` (type,
+resource_type, folder, ...) para poder subir varios archivos en paralelo
+y guardar después las filas con ``bulk_create``.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .backends import obtener_backend
+
+
+def es_pdf(nombre):
+    return str(nombre).lower().endswith('.pdf')
+
+
+def opciones_subida(campo, **extra):
+    opciones = {"type": campo.type, "resource_type": campo.resource_type}
+    opciones.update({k: v for k, v in campo.options.items() if not callable(v)})
+    opciones.update(extra)
+    return opciones
+
+
+def subir_archivo(campo, archivo, **extra):
+    """Sube ``archivo`` con las opciones del CloudinaryField ``campo`` y devuelve el CloudinaryResource."""
+    return obtener_backend().subir(archivo, **opciones_subida(campo, **extra))
+
+
+def _ejecutar(trabajo):
+    campo, archivo, extra = trabajo
+    try:
+        return subir_archivo(campo, archivo, **extra)
+    except Exception as exc:  # el error se reporta por ítem
+        return exc
+
+
+def subir_en_paralelo(trabajos, max_workers=None):
+    """
+    Ejecuta ``[(campo, archivo, extra), ...]`` con un pool de hilos acotado.
+    Devuelve una lista alineada con ``trabajos``: CloudinaryResource o la excepción.
+    """
+    if not trabajos:
+        return []
+    max_workers = max_workers or getattr(settings, 'MEDIA_SUBIDAS_CONCURRENTES', 4)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(trabajos))) as pool:
+        return list(pool.map(_ejecutar, trabajos))
+
+
+async def asubir_en_paralelo(trabajos, max_workers=None):
+    """
+    Versión asíncrona de ``subir_en_paralelo`` para vistas ASGI. Cada subida
+    corre en un hilo fuera del hilo compartido de las vistas sincrónicas
+    (``thread_sensitive=False``), así el event loop sigue atendiendo otras
+    peticiones mientras se espera al servicio de medios.
+    """
+    if not trabajos:
+        return []
+    semaforo = asyncio.Semaphore(max_workers or getattr(settings, 'MEDIA_SUBIDAS_CONCURRENTES', 4))
+    ejecutar = sync_to_async(_ejecutar, thread_sensitive=False)
+
+    async def subir(trabajo):
+        async with semaforo:
+            return await ejecutar(trabajo)
+
+    return list(await asyncio.gather(*(subir(trabajo) for trabajo in trabajos)))
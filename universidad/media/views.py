@@ -0,0 +1,8 @@
+from django.views.static import serve
+
+from .backends import obtener_backend
+
+
+def servir_local(request, resource_type, tipo, ruta):
+    """Sirve los archivos del backend local con las mismas rutas que arma CloudinaryResource.url."""
+    return serve(request, ruta, document_root=obtener_backend().raiz / resource_type / tipo)
@@ -0,0 +1,118 @@
+"""
+Compresión de respuestas (brotli si está instalado, si no gzip).
+
+Se configura en ``REST_FRAMEWORK['COMPRESSION']``:
+
+    'COMPRESSION': {
+        'MIN_SIZE': 1024,                 # bytes; respuestas más chicas van sin comprimir
+        'ALGORITHMS': ['br', 'gzip'],     # orden de preferencia del servidor
+        'GZIP_LEVEL': 6,
+        'BROTLI_QUALITY': 5,
+    }
+"""
+import gzip
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - depende del entorno
+    brotli = None
+
+DEFAULTS = {
+    'MIN_SIZE': 1024,
+    'ALGORITHMS': ['br', 'gzip'],
+    'GZIP_LEVEL': 6,
+    'BROTLI_QUALITY': 5,
+}
+
+TIPOS_COMPRIMIBLES = ('application/json', 'text/', 'application/javascript')
+
+
+def _configuracion():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'REST_FRAMEWORK', {}).get('COMPRESSION', {}))
+    return config
+
+
+def _aceptadas(accept_encoding):
+    """Codificaciones aceptadas por el cliente (las que tienen q=0 se descartan)."""
+    aceptadas = set()
+    for parte in accept_encoding.split(','):
+        nombre, *params = [p.strip() for p in parte.split(';')]
+        q = 1.0
+        for param in params:
+            if param.lower().startswith('q='):
+                try:
+                    q = float(param[2:])
+                except ValueError:
+                    q = 0.0
+        if nombre and q > 0:
+            aceptadas.add(nombre.lower())
+    return aceptadas
+
+
+class CompresionMiddleware:
+    # Con ASGI, un middleware solo sincrónico obligaría a pasar cada petición
+    # por el hilo compartido de Django aunque la vista sea asíncrona
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        config = _configuracion()
+        self.min_size = config['MIN_SIZE']
+        self.gzip_level = config['GZIP_LEVEL']
+        self.brotli_quality = config['BROTLI_QUALITY']
+        self.algoritmos = [a for a in config['ALGORITHMS'] if a == 'gzip' or (a == 'br' and brotli)]
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        response = self.get_response(request)
+        return self.comprimir(request, response)
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        return self.comprimir(request, response)
+
+    def _elegir(self, request):
+        aceptadas = _aceptadas(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        for algoritmo in self.algoritmos:
+            if algoritmo in aceptadas:
+                return algoritmo
+        return None
+
+    def comprimir(self, request, response):
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        if not response.get('Content-Type', '').startswith(TIPOS_COMPRIMIBLES):
+            return response
+        if len(response.content) < self.min_size:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        algoritmo = self._elegir(request)
+        if algoritmo is None:
+            return response
+
+        if algoritmo == 'br':
+            contenido = brotli.compress(response.content, quality=self.brotli_quality)
+        else:
+            contenido = gzip.compress(response.content, compresslevel=self.gzip_level, mtime=0)
+        if len(contenido) >= len(response.content):
+            return response
+
+        response.content = contenido
+        response['Content-Length'] = str(len(contenido))
+        response['Content-Encoding'] = algoritmo
+        # El ETag fuerte ya no corresponde a los bytes enviados
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
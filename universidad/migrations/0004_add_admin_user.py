@@ -1,4 +1,5 @@
 # Generated by Django 5.1.7 on 2025-10-05
+from django.conf import settings
 from django.contrib.auth.hashers import make_password
 from django.db import migrations
 
@@ -10,6 +11,13 @@ class Migration(migrations.Migration):
     ]
 
     def create_admin_user(self, schema_editor):
+        # En una base nueva auth.User ya está reemplazado por universidad.Alumno
+        # y no existe la tabla auth_user: el administrador se crea con
+        # createsuperuser. Las bases existentes aplicaron esta migración antes
+        # del cambio de AUTH_USER_MODEL y no vuelven a ejecutarla.
+        if settings.AUTH_USER_MODEL != 'auth.User':
+            return
+
         User = self.get_model('auth', 'User')
         Group = self.get_model('auth', 'Group')
 
@@ -1,6 +1,8 @@
 
 from django.db import migrations
 
+from universidad.migrations._permisos import crear_permisos
+
 
 class Migration(migrations.Migration):
 
@@ -12,6 +14,8 @@ class Migration(migrations.Migration):
         Group = apps.get_model('auth', 'Group')
         Permission = apps.get_model('auth', 'Permission')
 
+        crear_permisos(apps)
+
         # Grupos
         admin_group = Group.objects.get(name='Administrador')
         docente_group = Group.objects.get(name='Docente')
@@ -1,9 +1,13 @@
 from django.db import migrations
 
+from universidad.migrations._permisos import crear_permisos
+
 def update_docente_permissions(apps, schema_editor):
     Group = apps.get_model('auth', 'Group')
     Permission = apps.get_model('auth', 'Permission')
 
+    crear_permisos(apps)
+
     # Asegurarse de que el grupo Docente exista
     docente_group, created = Group.objects.get_or_create(name='Docente')
 
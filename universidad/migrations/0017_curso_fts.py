@@ -0,0 +1,94 @@
+import unicodedata
+
+from django.db import migrations
+
+
+def crear_indice(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS universidad_curso_fts USING fts5("
+            "nombre, descripcion, area, docente, secciones, lecciones, "
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+    elif vendor == 'postgresql':
+        schema_editor.execute(
+            "CREATE TABLE IF NOT EXISTS universidad_curso_fts ("
+            "curso_id bigint PRIMARY KEY REFERENCES universidad_curso (id) ON DELETE CASCADE, "
+            "documento tsvector NOT NULL)"
+        )
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS universidad_curso_fts_documento "
+            "ON universidad_curso_fts USING GIN (documento)"
+        )
+
+
+def _normalizar(texto):
+    # Copia de universidad.busqueda.indice.normalizar: la migración no depende del código actual
+    if not texto:
+        return ''
+    texto = unicodedata.normalize('NFKD', texto)
+    return ''.join(c for c in texto if not unicodedata.combining(c)).lower()
+
+
+def llenar_indice(apps, schema_editor):
+    """Indexa los cursos que ya existen; desde acá las señales mantienen el índice."""
+    vendor = schema_editor.connection.vendor
+    if vendor not in ('sqlite', 'postgresql'):
+        return
+    Curso = apps.get_model('universidad', 'Curso')
+    filas = []
+    for curso in Curso.objects.select_related('area', 'docente__user').prefetch_related('secciones__lecciones'):
+        secciones = list(curso.secciones.all())
+        filas.append((
+            curso.pk,
+            _normalizar(curso.nombre),
+            _normalizar(curso.descripcion),
+            _normalizar(curso.area.nombre),
+            _normalizar(curso.docente.user.nombre_completo) if curso.docente else '',
+            _normalizar(' '.join(f"{s.nombre} {s.descripcion or ''}" for s in secciones)),
+            _normalizar(' '.join(lec.nombre for s in secciones for lec in s.lecciones.all())),
+        ))
+    if not filas:
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DELETE FROM universidad_curso_fts")
+        if vendor == 'sqlite':
+            cursor.executemany(
+                "INSERT INTO universidad_curso_fts "
+                "(rowid, nombre, descripcion, area, docente, secciones, lecciones) "
+                "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+                filas
+            )
+        else:
+            # Mismos pesos que PostgresBackend: A nombre, B área y docente,
+            # C descripción y secciones, D lecciones
+            cursor.executemany(
+                "INSERT INTO universidad_curso_fts (curso_id, documento) VALUES (%s, "
+                "setweight(to_tsvector('spanish', %s), 'A') || "
+                "setweight(to_tsvector('spanish', %s), 'B') || "
+                "setweight(to_tsvector('spanish', %s), 'C') || "
+                "setweight(to_tsvector('spanish', %s), 'D'))",
+                [
+                    (pk, nombre, f'{area} {docente}', f'{descripcion} {secciones}', lecciones)
+                    for pk, nombre, descripcion, area, docente, secciones, lecciones in filas
+                ]
+            )
+
+
+def eliminar_indice(apps, schema_editor):
+    if schema_editor.connection.vendor in ('sqlite', 'postgresql'):
+        schema_editor.execute("DROP TABLE IF EXISTS universidad_curso_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('universidad', '0016_area_descripcion_area_photo_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(crear_indice, eliminar_indice),
+        migrations.RunPython(llenar_indice, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+from django.db import migrations, models
+
+
+def numerar(apps, schema_editor):
+    """Asigna el orden inicial según el id, que era el orden implícito hasta ahora."""
+    Seccion = apps.get_model('universidad', 'Seccion')
+    Leccion = apps.get_model('universidad', 'Leccion')
+
+    for Modelo, padre in ((Seccion, 'curso_id'), (Leccion, 'seccion_id')):
+        actualizados = []
+        posiciones = {}
+        for obj in Modelo.objects.order_by(padre, 'id'):
+            obj.orden = posiciones.get(getattr(obj, padre), 0)
+            posiciones[getattr(obj, padre)] = obj.orden + 1
+            actualizados.append(obj)
+        Modelo.objects.bulk_update(actualizados, ['orden'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('universidad', '0017_curso_fts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seccion',
+            name='orden',
+            field=models.PositiveIntegerField(blank=True, default=0),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='leccion',
+            name='orden',
+            field=models.PositiveIntegerField(blank=True, default=0),
+            preserve_default=False,
+        ),
+        migrations.AlterModelOptions(
+            name='seccion',
+            options={'ordering': ['orden', 'id']},
+        ),
+        migrations.AlterModelOptions(
+            name='leccion',
+            options={'ordering': ['orden', 'id']},
+        ),
+        migrations.AddIndex(
+            model_name='seccion',
+            index=models.Index(fields=['curso', 'orden'], name='seccion_curso_orden_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leccion',
+            index=models.Index(fields=['seccion', 'orden'], name='leccion_seccion_orden_idx'),
+        ),
+        migrations.RunPython(numerar, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('universidad', '0018_seccion_leccion_orden'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgresoCurso',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('lecciones_completadas', models.PositiveIntegerField(default=0)),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True)),
+                ('alumno', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progreso_cursos', to=settings.AUTH_USER_MODEL)),
+                ('curso', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progresos', to='universidad.curso')),
+            ],
+            options={
+                'unique_together': {('alumno', 'curso')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ProgresoLeccion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('completada', models.BooleanField(default=False)),
+                ('posicion_segundos', models.PositiveIntegerField(default=0)),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True)),
+                ('alumno', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progreso_lecciones', to=settings.AUTH_USER_MODEL)),
+                ('curso', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='universidad.curso')),
+                ('leccion', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='progresos', to='universidad.leccion')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['alumno', 'curso'], name='progreso_alumno_curso_idx')],
+                'constraints': [models.UniqueConstraint(fields=('alumno', 'leccion'), name='progreso_alumno_leccion_unico')],
+            },
+        ),
+    ]
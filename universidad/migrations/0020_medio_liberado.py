@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('universidad', '0019_progreso'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MedioLiberado',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('valor', models.CharField(max_length=255, unique=True)),
+                ('public_id', models.CharField(max_length=255)),
+                ('resource_type', models.CharField(max_length=20)),
+                ('tipo', models.CharField(default='upload', max_length=20)),
+                ('origen', models.CharField(max_length=100)),
+                ('fecha_liberado', models.DateTimeField(auto_now_add=True)),
+                ('intentos', models.PositiveIntegerField(default=0)),
+                ('ultimo_error', models.TextField(blank=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['intentos', 'id'], name='medio_liberado_pendiente_idx')],
+            },
+        ),
+    ]
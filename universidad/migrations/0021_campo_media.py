@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:08
+
+import universidad.media.campos
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('universidad', '0020_medio_liberado'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='alumno',
+            name='photo_profile',
+            field=universidad.media.campos.CampoMedia(blank=True, max_length=255, null=True, verbose_name='image'),
+        ),
+        migrations.AlterField(
+            model_name='area',
+            name='photo',
+            field=universidad.media.campos.CampoMedia(blank=True, max_length=255, null=True, verbose_name='image'),
+        ),
+        migrations.AlterField(
+            model_name='curso',
+            name='photo_profile',
+            field=universidad.media.campos.CampoMedia(blank=True, max_length=255, null=True, verbose_name='image'),
+        ),
+        migrations.AlterField(
+            model_name='docente',
+            name='photo_profile',
+            field=universidad.media.campos.CampoMedia(blank=True, max_length=255, null=True, verbose_name='image'),
+        ),
+        migrations.AlterField(
+            model_name='leccion',
+            name='material',
+            field=universidad.media.campos.CampoMedia(blank=True, max_length=255, null=True, verbose_name='file'),
+        ),
+    ]
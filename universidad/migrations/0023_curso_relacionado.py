@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('universidad', '0022_evento_salida'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CursoRelacionado',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('posicion', models.PositiveSmallIntegerField()),
+                ('puntaje', models.FloatField()),
+                ('compradores_comunes', models.PositiveIntegerField()),
+                ('fecha_calculo', models.DateTimeField()),
+                ('curso', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='relacionados', to='universidad.curso')),
+                ('relacionado', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='universidad.curso')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('curso', 'posicion'), name='curso_relacionado_posicion_unica')],
+            },
+        ),
+    ]
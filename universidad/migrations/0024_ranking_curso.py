@@ -0,0 +1,65 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def crear_filas(apps, schema_editor):
+    """Una fila en cero por curso; ``manage.py actualizar_ranking`` suma las compras existentes."""
+    Curso = apps.get_model('universidad', 'Curso')
+    RankingCurso = apps.get_model('universidad', 'RankingCurso')
+    RankingCurso.objects.bulk_create(
+        [RankingCurso(curso_id=pk, area_id=area_id) for pk, area_id in Curso.objects.values_list('pk', 'area_id')],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('universidad', '0023_curso_relacionado'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RankingCurso',
+            fields=[
+                ('curso', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ranking', serialize=False, to='universidad.curso')),
+                ('popularidad', models.FloatField(default=0)),
+                ('tendencia', models.FloatField(default=0)),
+                ('compras', models.PositiveIntegerField(default=0)),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='compra',
+            name='en_ranking',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='compra',
+            index=models.Index(condition=models.Q(('en_ranking', False)), fields=['id'], name='compra_pendiente_ranking'),
+        ),
+        migrations.AddField(
+            model_name='rankingcurso',
+            name='area',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='universidad.area'),
+        ),
+        migrations.AddIndex(
+            model_name='rankingcurso',
+            index=models.Index(fields=['-popularidad'], name='ranking_popularidad'),
+        ),
+        migrations.AddIndex(
+            model_name='rankingcurso',
+            index=models.Index(fields=['-tendencia'], name='ranking_tendencia'),
+        ),
+        migrations.AddIndex(
+            model_name='rankingcurso',
+            index=models.Index(fields=['area', '-popularidad'], name='ranking_area_popularidad'),
+        ),
+        migrations.AddIndex(
+            model_name='rankingcurso',
+            index=models.Index(fields=['area', '-tendencia'], name='ranking_area_tendencia'),
+        ),
+        migrations.RunPython(crear_filas, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('universidad', '0024_ranking_curso'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TokenRevocado',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('jti', models.CharField(blank=True, max_length=64, null=True, unique=True)),
+                ('usuario_id', models.BigIntegerField(blank=True, db_index=True, null=True)),
+                ('desde', models.DateTimeField(blank=True, null=True)),
+                ('expira', models.DateTimeField(db_index=True)),
+                ('fecha', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+    ]
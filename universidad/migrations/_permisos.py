@@ -0,0 +1,18 @@
+from django.contrib.auth.management import create_permissions
+
+
+def crear_permisos(apps):
+    """
+    Crea los permisos de los modelos que existen en este punto de la historia.
+
+    Django los crea recién en post_migrate, al terminar el migrate completo:
+    en una base nueva las migraciones que asignan permisos a los grupos no
+    encontrarían ninguno. En una base ya migrada los permisos existen y esto
+    no hace nada.
+    """
+    for app_config in apps.get_app_configs():
+        # create_permissions ignora las apps sin módulo de modelos, y las
+        # apps históricas nunca lo tienen
+        app_config.models_module = True
+        create_permissions(app_config, apps=apps, verbosity=0)
+        app_config.models_module = None
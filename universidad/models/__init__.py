@@ -5,3 +5,9 @@ from .curso import Curso
 from .seccion import Seccion
 from .leccion import Leccion
 from .compra import Compra
+from .progreso import ProgresoLeccion, ProgresoCurso
+from .medio import MedioLiberado
+from .evento import EventoSalida
+from .recomendacion import CursoRelacionado
+from .ranking import RankingCurso
+from .token import TokenRevocado
@@ -1,4 +1,4 @@
-from cloudinary.models import CloudinaryField
+from universidad.media.campos import CampoMedia
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 import random
@@ -47,7 +47,7 @@ class Alumno(AbstractBaseUser, PermissionsMixin):
     numero_registro = models.CharField(max_length=6, unique=True, default=generar_registro, editable=False)
 
     # 📸 Imagen de perfil
-    photo_profile = CloudinaryField(
+    photo_profile = CampoMedia(
         'image',
         folder="usuarios/alumnos/",
         null=True,
@@ -1,10 +1,10 @@
-from cloudinary.models import CloudinaryField
+from universidad.media.campos import CampoMedia
 from django.db import models
 
 class Area(models.Model):
     nombre = models.CharField(max_length=120, unique=True)
     descripcion = models.TextField(blank=True, null=True)  # nueva descripción
-    photo = CloudinaryField(
+    photo = CampoMedia(
         'image',
         folder="areas/",
         null=True,
@@ -12,6 +12,7 @@ class Area(models.Model):
     )
 
     # nueva foto
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.nombre
@@ -7,9 +7,14 @@ class Compra(models.Model):
     curso = models.ForeignKey(Curso, on_delete=models.CASCADE, related_name="compras")
     fecha_compra = models.DateTimeField(auto_now_add=True)
     es_trial = models.BooleanField(default=False)
+    en_ranking = models.BooleanField(default=False)  # ya sumada a RankingCurso (universidad.ranking)
 
     class Meta:
         unique_together = ('alumno', 'curso')  # evita que el mismo alumno compre dos veces el mismo curso
+        indexes = [
+            # Solo las compras que faltan sumar al ranking
+            models.Index(fields=['id'], condition=models.Q(en_ranking=False), name='compra_pendiente_ranking'),
+        ]
 
     def __str__(self):
         return f"{self.alumno.nombre_completo} compró {self.curso.nombre}"
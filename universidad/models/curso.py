@@ -1,4 +1,4 @@
-from cloudinary.models import CloudinaryField
+from universidad.media.campos import CampoMedia
 from django.db import models
 from .area import Area
 from .docente import Docente
@@ -11,7 +11,7 @@ class Curso(models.Model):
     docente = models.ForeignKey(Docente, on_delete=models.SET_NULL, null=True, related_name="cursos")
     precio = models.DecimalField(max_digits=8, decimal_places=2, default=0.00)
     modo_prueba = models.BooleanField(default=True)  # si tiene sección/lectura libre
-    photo_profile = CloudinaryField(
+    photo_profile = CampoMedia(
         'image',
         folder="cursos/",
         null=True,
@@ -19,6 +19,8 @@ class Curso(models.Model):
     )
 
     fecha_creacion = models.DateTimeField(auto_now_add=True)
+    # También cambia con sus secciones, lecciones, área y docente (universidad.catalogo.actualizacion)
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.nombre} - {self.area.nombre}"
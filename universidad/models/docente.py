@@ -1,4 +1,4 @@
-from cloudinary.models import CloudinaryField
+from universidad.media.campos import CampoMedia
 from django.db import models
 from django.contrib.auth import get_user_model
 import random
@@ -12,7 +12,7 @@ class Docente(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="docente_profile", null=False)
     descripcion = models.TextField(blank=True, null=True)
     numero_registro = models.CharField(max_length=6, unique=True, editable=False)
-    photo_profile = CloudinaryField(
+    photo_profile = CampoMedia(
         'image',
         folder="usuarios/docentes/",
         blank=True,
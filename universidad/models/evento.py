@@ -0,0 +1,40 @@
+from django.db import models
+
+
+class EventoSalida(models.Model):
+    """
+    Bandeja de salida transaccional: se escribe en la misma transacción que
+    el cambio que la origina y la procesa el comando ``procesar_eventos``.
+    Hay una fila por (evento, manejador) para reintentar cada efecto por separado.
+    """
+    PENDIENTE = 'pendiente'
+    PROCESANDO = 'procesando'
+    HECHO = 'hecho'
+    FALLIDO = 'fallido'
+    ESTADOS = [
+        (PENDIENTE, 'Pendiente'),
+        (PROCESANDO, 'Procesando'),
+        (HECHO, 'Hecho'),
+        (FALLIDO, 'Fallido'),
+    ]
+
+    evento = models.CharField(max_length=50)       # p. ej. 'compra.creada'
+    manejador = models.CharField(max_length=50)    # p. ej. 'recibo_alumno'
+    datos = models.JSONField(default=dict)
+    estado = models.CharField(max_length=12, choices=ESTADOS, default=PENDIENTE)
+    intentos = models.PositiveIntegerField(default=0)
+    disponible_desde = models.DateTimeField()      # reintentos con espera
+    reclamado_por = models.CharField(max_length=32, blank=True)
+    reclamado_hasta = models.DateTimeField(null=True, blank=True)  # si el worker muere, se vuelve a tomar
+    ultimo_error = models.TextField(blank=True)
+    fecha_creacion = models.DateTimeField(auto_now_add=True)
+    fecha_procesado = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['estado', 'disponible_desde'], name='evento_salida_pendiente_idx'),
+            models.Index(fields=['reclamado_por'], name='evento_salida_reclamo_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.evento} → {self.manejador} ({self.estado})"
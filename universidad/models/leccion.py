@@ -1,5 +1,6 @@
-from cloudinary.models import CloudinaryField
+from universidad.media.campos import CampoMedia
 from django.db import models
+from django.db.models import Max
 from .seccion import Seccion
 
 
@@ -7,7 +8,7 @@ class Leccion(models.Model):
     nombre = models.CharField(max_length=150)
     seccion = models.ForeignKey(Seccion, on_delete=models.CASCADE, related_name="lecciones")
 
-    material = CloudinaryField(
+    material = CampoMedia(
         'file',
         folder="lecciones/materiales/",
         null=True,
@@ -15,8 +16,18 @@ class Leccion(models.Model):
         resource_type='auto',  # auto detecta imágenes/videos
         type='upload'
     )
+    orden = models.PositiveIntegerField(blank=True)  # posición dentro de la sección
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['orden', 'id']
+        indexes = [models.Index(fields=['seccion', 'orden'], name='leccion_seccion_orden_idx')]
 
     def save(self, *args, **kwargs):
+        # Las lecciones nuevas van al final de la sección
+        if self.orden is None:
+            ultimo = Leccion.objects.filter(seccion_id=self.seccion_id).aggregate(m=Max('orden'))['m']
+            self.orden = 0 if ultimo is None else ultimo + 1
         # Si el archivo es PDF, subir como raw
         if self.material and str(self.material).lower().endswith('.pdf'):
             self.material.resource_type = 'raw'
@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class MedioLiberado(models.Model):
+    """
+    Bandeja de salida de archivos de Cloudinary que dejaron de usarse
+    (fila borrada o archivo reemplazado). El comando ``recolectar_medios``
+    los borra por lotes.
+    """
+    valor = models.CharField(max_length=255, unique=True)  # valor guardado en la columna del CloudinaryField
+    public_id = models.CharField(max_length=255)
+    resource_type = models.CharField(max_length=20)
+    tipo = models.CharField(max_length=20, default='upload')
+    origen = models.CharField(max_length=100)  # modelo.campo que lo liberó
+    fecha_liberado = models.DateTimeField(auto_now_add=True)
+    intentos = models.PositiveIntegerField(default=0)
+    ultimo_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=['intentos', 'id'], name='medio_liberado_pendiente_idx')]
+
+    def __str__(self):
+        return f"{self.resource_type}/{self.public_id} ({self.origen})"
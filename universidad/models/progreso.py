@@ -0,0 +1,37 @@
+from django.db import models
+from .alumno import Alumno
+from .curso import Curso
+from .leccion import Leccion
+
+
+class ProgresoLeccion(models.Model):
+    alumno = models.ForeignKey(Alumno, on_delete=models.CASCADE, related_name="progreso_lecciones")
+    leccion = models.ForeignKey(Leccion, on_delete=models.CASCADE, related_name="progresos")
+    # Copia de leccion.seccion.curso para leer el progreso de un curso con una sola consulta
+    curso = models.ForeignKey(Curso, on_delete=models.CASCADE, related_name="+")
+    completada = models.BooleanField(default=False)
+    posicion_segundos = models.PositiveIntegerField(default=0)  # última posición del video
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['alumno', 'leccion'], name='progreso_alumno_leccion_unico'),
+        ]
+        indexes = [models.Index(fields=['alumno', 'curso'], name='progreso_alumno_curso_idx')]
+
+    def __str__(self):
+        return f"{self.alumno_id} - lección {self.leccion_id}"
+
+
+class ProgresoCurso(models.Model):
+    """Contador incremental de lecciones completadas por alumno y curso."""
+    alumno = models.ForeignKey(Alumno, on_delete=models.CASCADE, related_name="progreso_cursos")
+    curso = models.ForeignKey(Curso, on_delete=models.CASCADE, related_name="progresos")
+    lecciones_completadas = models.PositiveIntegerField(default=0)
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('alumno', 'curso')
+
+    def __str__(self):
+        return f"{self.alumno_id} - curso {self.curso_id}: {self.lecciones_completadas}"
@@ -0,0 +1,25 @@
+from django.db import models
+from .area import Area
+from .curso import Curso
+
+
+class RankingCurso(models.Model):
+    """Puntajes de popularidad con decaimiento temporal; los mantiene ``universidad.ranking``."""
+    curso = models.OneToOneField(Curso, on_delete=models.CASCADE, primary_key=True, related_name="ranking")
+    area = models.ForeignKey(Area, on_delete=models.CASCADE, related_name="+")  # copia de curso.area para el índice por área
+    popularidad = models.FloatField(default=0)
+    tendencia = models.FloatField(default=0)
+    compras = models.PositiveIntegerField(default=0)
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Cada ?orden= del catálogo se lee recorriendo uno de estos índices
+        indexes = [
+            models.Index(fields=['-popularidad'], name='ranking_popularidad'),
+            models.Index(fields=['-tendencia'], name='ranking_tendencia'),
+            models.Index(fields=['area', '-popularidad'], name='ranking_area_popularidad'),
+            models.Index(fields=['area', '-tendencia'], name='ranking_area_tendencia'),
+        ]
+
+    def __str__(self):
+        return f"{self.curso_id}: popularidad {self.popularidad:.3g}, tendencia {self.tendencia:.3g}"
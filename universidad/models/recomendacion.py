@@ -0,0 +1,21 @@
+from django.db import models
+from .curso import Curso
+
+
+class CursoRelacionado(models.Model):
+    """Vecinos de un curso por compras en común; los calcula ``manage.py calcular_relacionados``."""
+    curso = models.ForeignKey(Curso, on_delete=models.CASCADE, related_name="relacionados")
+    relacionado = models.ForeignKey(Curso, on_delete=models.CASCADE, related_name="+")
+    posicion = models.PositiveSmallIntegerField()  # 0 = el más parecido
+    puntaje = models.FloatField()  # similitud coseno entre los conjuntos de compradores
+    compradores_comunes = models.PositiveIntegerField()
+    fecha_calculo = models.DateTimeField()
+
+    class Meta:
+        # La restricción crea el índice (curso, posicion) con el que se lee el endpoint
+        constraints = [
+            models.UniqueConstraint(fields=['curso', 'posicion'], name='curso_relacionado_posicion_unica'),
+        ]
+
+    def __str__(self):
+        return f"{self.curso_id} → {self.relacionado_id} ({self.puntaje:.3f})"
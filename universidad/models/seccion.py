@@ -1,10 +1,24 @@
 from django.db import models
+from django.db.models import Max
 from .curso import Curso
 
 class Seccion(models.Model):
     nombre = models.CharField(max_length=150)
     curso = models.ForeignKey(Curso, on_delete=models.CASCADE, related_name="secciones")
     descripcion = models.TextField(blank=True, null=True)  # 🔹 agregar este campo
+    orden = models.PositiveIntegerField(blank=True)  # posición dentro del curso
+    fecha_actualizacion = models.DateTimeField(auto_now=True)  # también cambia con sus lecciones
+
+    class Meta:
+        ordering = ['orden', 'id']
+        indexes = [models.Index(fields=['curso', 'orden'], name='seccion_curso_orden_idx')]
+
+    def save(self, *args, **kwargs):
+        # Las secciones nuevas van al final del curso
+        if self.orden is None:
+            ultimo = Seccion.objects.filter(curso_id=self.curso_id).aggregate(m=Max('orden'))['m']
+            self.orden = 0 if ultimo is None else ultimo + 1
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.nombre} ({self.curso.nombre})"
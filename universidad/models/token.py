@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class TokenRevocado(models.Model):
+    """
+    Revocación de JWT: un token puntual (``jti``) o todos los de un usuario
+    emitidos antes de ``desde``. ``universidad.token.revocacion`` las carga en memoria.
+    """
+    jti = models.CharField(max_length=64, unique=True, null=True, blank=True)
+    # Sin FK: la revocación tiene que sobrevivir al borrado del usuario
+    usuario_id = models.BigIntegerField(null=True, blank=True, db_index=True)
+    desde = models.DateTimeField(null=True, blank=True)
+    expira = models.DateTimeField(db_index=True)  # después ya no hay tokens vigentes que revocar
+    fecha = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        if self.jti:
+            return f"jti {self.jti}"
+        return f"usuario {self.usuario_id} desde {self.desde:%Y-%m-%d %H:%M:%S}"
@@ -0,0 +1,8 @@
+from .buffer import BufferProgreso, buffer
+from .servicios import (
+    ProgresoError,
+    registrar_latido,
+    marcar_completada,
+    progreso_curso,
+    progreso_cursos,
+)
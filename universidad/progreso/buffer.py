@@ -0,0 +1,161 @@
+"""
+Buffer en memoria para los latidos (heartbeats) del reproductor.
+
+Cada latido solo actualiza la posición del video, así que se guarda el
+último valor por (alumno, lección) y se escriben todos juntos con un
+``bulk_create(update_conflicts=True)``: cuando pasan ``INTERVALO`` segundos,
+cuando hay ``MAX_PENDIENTES`` entradas o al terminar el proceso.
+
+Un latido cuya lección, curso o alumno se borró antes de escribirse, o con
+un valor que la BD no acepta, se descarta: no vuelve al buffer, donde haría
+fallar cada escritura siguiente.
+Solo se devuelven al buffer los latidos de una escritura que falló porque la
+BD no estaba disponible.
+"""
+import atexit
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import DatabaseError, DataError, IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Errores de una fila en particular (FK borrada, valor fuera de rango; SQLite
+# lanza OverflowError al pasar el parámetro), no de la BD
+ERRORES_DE_FILA = (IntegrityError, DataError, OverflowError)
+
+_config = getattr(settings, 'PROGRESO_BUFFER', {})
+INTERVALO = _config.get('INTERVALO', 10)
+MAX_PENDIENTES = _config.get('MAX_PENDIENTES', 500)
+
+
+class BufferProgreso:
+    def __init__(self, intervalo=INTERVALO, max_pendientes=MAX_PENDIENTES):
+        self.intervalo = intervalo
+        self.max_pendientes = max_pendientes
+        self._pendientes = {}
+        self._lock = threading.Lock()
+        self._hilo = None
+        self.latidos = 0
+        self.escrituras = 0
+
+    def registrar(self, alumno_id, leccion_id, curso_id, posicion):
+        with self._lock:
+            self._pendientes[(alumno_id, leccion_id)] = (curso_id, posicion)
+            self.latidos += 1
+            lleno = len(self._pendientes) >= self.max_pendientes
+        self._iniciar_hilo()
+        if lleno:
+            self.vaciar()
+
+    def posiciones(self, alumno_id, curso_id=None):
+        """Posiciones aún no escritas de un alumno: {leccion_id: posicion}."""
+        with self._lock:
+            return {
+                leccion_id: posicion
+                for (a_id, leccion_id), (c_id, posicion) in self._pendientes.items()
+                if a_id == alumno_id and (curso_id is None or c_id == curso_id)
+            }
+
+    def vaciar(self):
+        """Escribe todas las posiciones pendientes. Devuelve cuántas filas se escribieron."""
+        from universidad.models import ProgresoLeccion
+
+        with self._lock:
+            pendientes, self._pendientes = self._pendientes, {}
+        if not pendientes:
+            return 0
+
+        try:
+            ahora = timezone.now()
+            filas = [
+                ProgresoLeccion(
+                    alumno_id=alumno_id, leccion_id=leccion_id, curso_id=curso_id,
+                    posicion_segundos=posicion, fecha_actualizacion=ahora,
+                )
+                for (alumno_id, leccion_id), (curso_id, posicion) in self._existentes(pendientes).items()
+            ]
+            try:
+                self._escribir(filas)
+            except ERRORES_DE_FILA:
+                # Algo se borró entre la verificación y la escritura, o un valor no entra en
+                # la columna: fila por fila, sin las que fallan
+                filas = [fila for fila in filas if self._escribir_fila(fila)]
+        except DatabaseError:
+            # BD no disponible: devolver al buffer, sin pisar latidos más nuevos
+            with self._lock:
+                for clave, valor in pendientes.items():
+                    self._pendientes.setdefault(clave, valor)
+            raise
+        self.escrituras += len(filas)
+        return len(filas)
+
+    @staticmethod
+    def _existentes(pendientes):
+        """Los pendientes cuyo alumno, lección y curso todavía existen."""
+        from universidad.models import Alumno, Curso, Leccion
+
+        alumnos = set(Alumno.objects.filter(pk__in={a for a, _ in pendientes}).values_list('pk', flat=True))
+        lecciones = set(Leccion.objects.filter(pk__in={l for _, l in pendientes}).values_list('pk', flat=True))
+        cursos = set(Curso.objects.filter(pk__in={c for c, _ in pendientes.values()}).values_list('pk', flat=True))
+        existentes = {
+            (alumno_id, leccion_id): (curso_id, posicion)
+            for (alumno_id, leccion_id), (curso_id, posicion) in pendientes.items()
+            if alumno_id in alumnos and leccion_id in lecciones and curso_id in cursos
+        }
+        if len(existentes) < len(pendientes):
+            logger.info("Se descartan %d latidos de lecciones o cursos borrados", len(pendientes) - len(existentes))
+        return existentes
+
+    @staticmethod
+    def _escribir(filas):
+        from universidad.models import ProgresoLeccion
+
+        with transaction.atomic():
+            ProgresoLeccion.objects.bulk_create(
+                filas,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=['alumno', 'leccion'],
+                update_fields=['posicion_segundos', 'fecha_actualizacion'],
+            )
+
+    def _escribir_fila(self, fila):
+        try:
+            self._escribir([fila])
+        except ERRORES_DE_FILA:
+            logger.info("Se descarta el latido de %s en la lección %s", fila.alumno_id, fila.leccion_id)
+            return False
+        return True
+
+    def _iniciar_hilo(self):
+        if self._hilo is not None and self._hilo.is_alive():
+            return
+        with self._lock:
+            if self._hilo is not None and self._hilo.is_alive():
+                return
+            self._hilo = threading.Thread(target=self._bucle, name='progreso-buffer', daemon=True)
+            self._hilo.start()
+
+    def _bucle(self):
+        while True:
+            time.sleep(self.intervalo)
+            close_old_connections()
+            try:
+                self.vaciar()
+            except Exception:
+                logger.exception("No se pudo escribir el progreso pendiente")
+
+
+buffer = BufferProgreso()
+
+
+@atexit.register
+def _vaciar_al_salir():
+    try:
+        buffer.vaciar()
+    except Exception:
+        logger.exception("No se pudo escribir el progreso pendiente al salir")
@@ -0,0 +1,142 @@
+"""
+Operaciones de progreso de lecciones.
+
+- ``registrar_latido``: guarda la posición en el buffer; solo consulta la BD la
+  primera vez que ve la lección o la compra (después salen de las LRU).
+- ``marcar_completada``: escritura síncrona; la transición a completada suma 1
+  en ``ProgresoCurso`` con ``F()``, así el porcentaje se lee sin contar filas.
+- ``progreso_curso`` / ``progreso_cursos``: lecturas que superponen las
+  posiciones aún pendientes del buffer.
+"""
+from django.db import transaction
+from django.db.models import Count, F, FilteredRelation, Q
+
+from universidad.cache import LRU
+from universidad.models import Compra, Curso, Leccion, ProgresoCurso, ProgresoLeccion
+
+from .buffer import buffer
+
+# leccion_id → curso_id (una lección casi nunca cambia de curso; las señales la invalidan)
+cursos_de_leccion = LRU(4096)
+# (alumno_id, curso_id) con compra confirmada; solo se guardan los positivos
+inscripciones = LRU(8192)
+
+
+class ProgresoError(Exception):
+    def __init__(self, mensaje, status):
+        super().__init__(mensaje)
+        self.mensaje = mensaje
+        self.status = status
+
+
+def curso_de_leccion(leccion_id):
+    curso_id = cursos_de_leccion.get(leccion_id)
+    if curso_id is None:
+        curso_id = Leccion.objects.filter(pk=leccion_id).values_list('seccion__curso_id', flat=True).first()
+        if curso_id is None:
+            raise ProgresoError("Lección no encontrada", 404)
+        cursos_de_leccion.set(leccion_id, curso_id)
+    return curso_id
+
+
+def verificar_inscripcion(alumno, curso_id):
+    clave = (alumno.pk, curso_id)
+    if inscripciones.get(clave):
+        return
+    if not Compra.objects.filter(alumno=alumno, curso_id=curso_id).exists():
+        raise ProgresoError("No compraste este curso", 403)
+    inscripciones.set(clave, True)
+
+
+def registrar_latido(alumno, leccion_id, posicion):
+    curso_id = curso_de_leccion(leccion_id)
+    verificar_inscripcion(alumno, curso_id)
+    buffer.registrar(alumno.pk, leccion_id, curso_id, posicion)
+    return curso_id
+
+
+def marcar_completada(alumno, leccion_id, posicion=None):
+    """Marca la lección como completada. Devuelve True si recién se completó."""
+    curso_id = curso_de_leccion(leccion_id)
+    verificar_inscripcion(alumno, curso_id)
+    if posicion is None:
+        posicion = buffer.posiciones(alumno.pk, curso_id).get(leccion_id)
+
+    with transaction.atomic():
+        progreso, _ = ProgresoLeccion.objects.select_for_update().get_or_create(
+            alumno=alumno, leccion_id=leccion_id, defaults={'curso_id': curso_id}
+        )
+        nueva = not progreso.completada
+        campos = ['fecha_actualizacion']
+        if nueva:
+            progreso.completada = True
+            campos.append('completada')
+        if posicion is not None:
+            progreso.posicion_segundos = posicion
+            campos.append('posicion_segundos')
+        progreso.save(update_fields=campos)
+
+        if nueva:
+            actualizadas = ProgresoCurso.objects.filter(alumno=alumno, curso_id=curso_id).update(
+                lecciones_completadas=F('lecciones_completadas') + 1
+            )
+            if not actualizadas:
+                ProgresoCurso.objects.create(alumno=alumno, curso_id=curso_id, lecciones_completadas=1)
+    return nueva
+
+
+def _porcentaje(completadas, total):
+    return round(100 * min(completadas, total) / total, 1) if total else 0.0
+
+
+def progreso_curso(alumno, curso_id):
+    """Progreso de un alumno en todas las lecciones de un curso, con una sola consulta."""
+    verificar_inscripcion(alumno, curso_id)
+    filas = (
+        Leccion.objects.filter(seccion__curso_id=curso_id)
+        .annotate(progreso=FilteredRelation('progresos', condition=Q(progresos__alumno=alumno)))
+        .order_by('seccion__orden', 'seccion_id', 'orden', 'id')
+        .values('id', 'seccion_id', 'progreso__completada', 'progreso__posicion_segundos')
+    )
+    pendientes = buffer.posiciones(alumno.pk, curso_id)
+    lecciones = [
+        {
+            'leccion': fila['id'],
+            'seccion': fila['seccion_id'],
+            'completada': bool(fila['progreso__completada']),
+            # Las posiciones que todavía están en el buffer son más nuevas que las de la BD
+            'posicion_segundos': pendientes.get(fila['id'], fila['progreso__posicion_segundos'] or 0),
+        }
+        for fila in filas
+    ]
+    completadas = sum(1 for leccion in lecciones if leccion['completada'])
+    return {
+        'curso': curso_id,
+        'total_lecciones': len(lecciones),
+        'lecciones_completadas': completadas,
+        'porcentaje': _porcentaje(completadas, len(lecciones)),
+        'lecciones': lecciones,
+    }
+
+
+def progreso_cursos(alumno):
+    """Porcentaje por curso comprado, leído de los contadores (sin recorrer lecciones)."""
+    cursos = (
+        Curso.objects.filter(compras__alumno=alumno)
+        .annotate(total_lecciones=Count('secciones__lecciones', distinct=True))
+        .values('id', 'nombre', 'total_lecciones')
+        .order_by('id')
+    )
+    completadas = dict(
+        ProgresoCurso.objects.filter(alumno=alumno).values_list('curso_id', 'lecciones_completadas')
+    )
+    return [
+        {
+            'curso': curso['id'],
+            'nombre': curso['nombre'],
+            'total_lecciones': curso['total_lecciones'],
+            'lecciones_completadas': completadas.get(curso['id'], 0),
+            'porcentaje': _porcentaje(completadas.get(curso['id'], 0), curso['total_lecciones']),
+        }
+        for curso in cursos
+    ]
@@ -0,0 +1,32 @@
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from universidad.models import Compra, Leccion, ProgresoCurso, ProgresoLeccion, Seccion
+from .servicios import cursos_de_leccion, inscripciones
+
+
+@receiver(post_delete, sender=ProgresoLeccion)
+def descontar_completada(sender, instance, **kwargs):
+    # Mantener el contador del curso al borrar (o al borrarse en cascada) una lección completada
+    if instance.completada:
+        ProgresoCurso.objects.filter(
+            alumno_id=instance.alumno_id, curso_id=instance.curso_id, lecciones_completadas__gt=0
+        ).update(lecciones_completadas=F('lecciones_completadas') - 1)
+
+
+@receiver([post_save, post_delete], sender=Leccion)
+def olvidar_leccion(sender, instance, **kwargs):
+    cursos_de_leccion.delete(instance.pk)
+
+
+@receiver(post_save, sender=Seccion)
+def olvidar_lecciones_de_seccion(sender, instance, created, **kwargs):
+    # Si la sección cambió de curso, sus lecciones también
+    if not created:
+        cursos_de_leccion.clear()
+
+
+@receiver(post_delete, sender=Compra)
+def olvidar_inscripcion(sender, instance, **kwargs):
+    inscripciones.delete((instance.alumno_id, instance.curso_id))
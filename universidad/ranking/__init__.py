@@ -0,0 +1 @@
+from .puntajes import ORDENES, actualizar, leer_orden, ordenar, registrar_compras
@@ -0,0 +1,174 @@
+"""
+Ranking del catálogo por popularidad y tendencia.
+
+Cada compra suma a su curso un peso que decae con el tiempo, con una vida
+media larga para ``popularidad`` y corta para ``tendencia``. En vez de
+rebajar todos los puntajes periódicamente, el peso se guarda relativo a una
+fecha fija (``EPOCA``):
+
+    peso(compra) = 2 ** ((fecha_compra - EPOCA) / vida_media)
+
+Decaer todos los puntajes hasta hoy es multiplicarlos por el mismo factor,
+así que el orden no cambia y sumar una compra es un ``UPDATE`` con ``F()``.
+Con la vida media de la tendencia (7 días) los valores entran en un float
+durante unos 19 años desde ``EPOCA``; al mover ``EPOCA`` hay que correr
+``manage.py actualizar_ranking --completo``.
+
+Las compras se suman una sola vez: ``Compra.en_ranking`` se marca en la misma
+transacción que el ``UPDATE``. Lo hace el manejador del evento
+``compra.creada`` y, para lo que no pasó por eventos (admin, compras previas),
+``manage.py actualizar_ranking``.
+"""
+from collections import defaultdict
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+DEFAULTS = {
+    'VIDA_MEDIA_POPULAR': 90,    # días
+    'VIDA_MEDIA_TENDENCIA': 7,   # días
+    'PESO_TRIAL': 0.5,           # una compra de prueba cuenta la mitad
+    'EPOCA': '2025-01-01',
+    'LOTE': 1000,                # compras por transacción en actualizar()
+}
+
+# ?orden= → columna de RankingCurso
+ORDENES = {'popular': 'popularidad', 'tendencia': 'tendencia'}
+
+
+def configuracion():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'RANKING', {}))
+    return config
+
+
+def _pesos(config):
+    """Función (fecha, es_trial) → (peso popularidad, peso tendencia)."""
+    epoca = datetime.fromisoformat(config['EPOCA']).replace(tzinfo=dt_timezone.utc)
+    popular = config['VIDA_MEDIA_POPULAR'] * 86400
+    tendencia = config['VIDA_MEDIA_TENDENCIA'] * 86400
+    trial = config['PESO_TRIAL']
+
+    def pesos(fecha, es_trial):
+        segundos = (fecha - epoca).total_seconds()
+        factor = trial if es_trial else 1.0
+        return factor * 2 ** (segundos / popular), factor * 2 ** (segundos / tendencia)
+    return pesos
+
+
+def leer_orden(params):
+    """Valida ``?orden=``; devuelve la columna de RankingCurso o None."""
+    orden = params.get('orden', '').strip().lower()
+    if not orden:
+        return None
+    if orden not in ORDENES:
+        raise ValidationError({'orden': f"Debe ser uno de: {', '.join(ORDENES)}."})
+    return ORDENES[orden]
+
+
+def ordenar(cursos, columna):
+    """Ordena un queryset de Curso por ``columna`` de mayor a menor (los cursos sin fila, al final)."""
+    return cursos.order_by(F(f'ranking__{columna}').desc(nulls_last=True), 'id')
+
+
+def _sumar(compras, pesos):
+    """Suma el peso de ``compras`` [(curso, area, fecha, es_trial)] a sus cursos."""
+    from universidad.models import RankingCurso
+
+    por_curso = defaultdict(lambda: [None, 0.0, 0.0, 0])
+    for curso, area, fecha, es_trial in compras:
+        popular, tendencia = pesos(fecha, es_trial)
+        acumulado = por_curso[curso]
+        acumulado[0] = area
+        acumulado[1] += popular
+        acumulado[2] += tendencia
+        acumulado[3] += 1
+
+    RankingCurso.objects.bulk_create(
+        [RankingCurso(curso_id=curso, area_id=area) for curso, (area, *_) in por_curso.items()],
+        ignore_conflicts=True,
+    )
+    ahora = timezone.now()
+    for curso, (area, popular, tendencia, cantidad) in por_curso.items():
+        RankingCurso.objects.filter(curso_id=curso).update(
+            area_id=area,
+            popularidad=F('popularidad') + popular,
+            tendencia=F('tendencia') + tendencia,
+            compras=F('compras') + cantidad,
+            fecha_actualizacion=ahora,
+        )
+    return len(por_curso)
+
+
+def registrar_compras(ids, config=None):
+    """Suma al ranking las compras ``ids`` que todavía no estén sumadas. Devuelve cuántas sumó."""
+    from universidad.models import Compra
+
+    pesos = _pesos(config or configuracion())
+    with transaction.atomic():
+        pendientes = list(
+            Compra.objects.select_for_update()
+            .filter(pk__in=ids, en_ranking=False)
+            .values_list('pk', 'curso_id', 'curso__area_id', 'fecha_compra', 'es_trial')
+        )
+        if not pendientes:
+            return 0
+        Compra.objects.filter(pk__in=[fila[0] for fila in pendientes]).update(en_ranking=True)
+        _sumar([fila[1:] for fila in pendientes], pesos)
+    return len(pendientes)
+
+
+def descontar_compra(compra):
+    """Resta una compra que se va a borrar, si ya estaba sumada (el flag se lee de la BD)."""
+    from universidad.models import Compra, RankingCurso
+
+    if Compra.objects.filter(pk=compra.pk, en_ranking=True).exists():
+        popular, tendencia = _pesos(configuracion())(compra.fecha_compra, compra.es_trial)
+        RankingCurso.objects.filter(curso_id=compra.curso_id).update(
+            popularidad=F('popularidad') - popular,
+            tendencia=F('tendencia') - tendencia,
+            compras=F('compras') - 1,
+            fecha_actualizacion=timezone.now(),
+        )
+
+
+def _sumar_pendientes(config):
+    from universidad.models import Compra
+
+    sumadas = 0
+    ultimo = 0
+    while True:
+        ids = list(
+            Compra.objects.filter(en_ranking=False, pk__gt=ultimo)
+            .order_by('pk').values_list('pk', flat=True)[:config['LOTE']]
+        )
+        if not ids:
+            return sumadas
+        sumadas += registrar_compras(ids, config)
+        ultimo = ids[-1]
+
+
+def actualizar(completo=False):
+    """
+    Suma las compras pendientes en lotes de ``LOTE``. Con ``completo`` primero
+    pone todo en cero (p. ej. después de cambiar vidas medias o ``EPOCA``).
+    """
+    from universidad.models import Compra, Curso, RankingCurso
+
+    config = configuracion()
+    if not completo:
+        return {'modo': 'incremental', 'compras': _sumar_pendientes(config)}
+
+    # Todo en una transacción: el catálogo no ve los puntajes a medio reconstruir
+    with transaction.atomic():
+        RankingCurso.objects.all().delete()
+        RankingCurso.objects.bulk_create(
+            [RankingCurso(curso_id=pk, area_id=area) for pk, area in Curso.objects.values_list('pk', 'area_id')],
+            batch_size=500,
+        )
+        Compra.objects.filter(en_ranking=True).update(en_ranking=False)
+        return {'modo': 'completo', 'compras': _sumar_pendientes(config)}
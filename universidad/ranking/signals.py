@@ -0,0 +1,22 @@
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from universidad.models import Compra, Curso, RankingCurso
+from .puntajes import descontar_compra
+
+
+@receiver(post_save, sender=Curso)
+def sincronizar_curso(sender, instance, created, **kwargs):
+    # Los cursos nuevos entran al ranking en cero; si cambia el área, se mueve de índice
+    if created:
+        RankingCurso.objects.get_or_create(curso_id=instance.pk, defaults={'area_id': instance.area_id})
+    else:
+        RankingCurso.objects.filter(curso_id=instance.pk).exclude(area_id=instance.area_id).update(
+            area_id=instance.area_id
+        )
+
+
+@receiver(pre_delete, sender=Compra)
+def descontar(sender, instance, **kwargs):
+    # Antes de borrar: después ya no se puede saber si la compra estaba sumada
+    descontar_compra(instance)
@@ -0,0 +1 @@
+from .relacionados import calcular, similitudes
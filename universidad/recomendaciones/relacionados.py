@@ -0,0 +1,205 @@
+"""
+Cursos relacionados por compras en común ("quienes compraron este curso
+también compraron...").
+
+La similitud entre dos cursos es el coseno entre sus conjuntos de compradores:
+
+    puntaje(i, j) = comunes(i, j) / sqrt(compradores(i) · compradores(j))
+
+Con NumPy y SciPy se arma la matriz dispersa binaria X (alumno × curso) y los
+compradores en común de un bloque de cursos salen de un solo producto
+``X[:, bloque]ᵀ · X``; el puntaje y el top-K se calculan sobre los arreglos
+del resultado. Sin esas librerías se cuentan con conjuntos en Python: mismo
+resultado, pensado para volúmenes chicos.
+
+El cálculo incremental (``calcular()`` sin ``completo``) solo recalcula los
+cursos con compras nuevas desde el último cálculo y los demás cursos de esos
+alumnos, que son los únicos cuyos compradores en común cambiaron. Los
+vecinos de otros cursos quedan con el puntaje anterior hasta la próxima
+corrida completa (que también limpia compras borradas).
+"""
+import heapq
+import itertools
+import math
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # pragma: no cover - depende del entorno
+    np = sparse = None
+
+DEFAULTS = {
+    'K': 10,
+    'MIN_COMUNES': 2,        # compradores en común mínimos para sugerir un curso
+    'INCLUIR_TRIAL': False,  # las compras de prueba no cuentan como señal
+    'LOTE_CURSOS': 1000,     # cursos por producto de matrices (acota la memoria)
+}
+
+
+def configuracion():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'RECOMENDACIONES', {}))
+    return config
+
+
+def _orden(vecino):
+    """Mayor puntaje primero; a igual puntaje, más compradores en común y menor id."""
+    return (-vecino[1], -vecino[2], vecino[0])
+
+
+def _similitudes_python(alumnos, cursos, objetivos, k, min_comunes):
+    compradores = defaultdict(set)
+    canastas = defaultdict(list)
+    for alumno, curso in zip(alumnos, cursos):
+        compradores[curso].add(alumno)
+        canastas[alumno].append(curso)
+
+    resultado = {}
+    for curso in (compradores if objetivos is None else objetivos):
+        propios = compradores.get(curso, ())
+        comunes = Counter(otro for alumno in propios for otro in canastas[alumno] if otro != curso)
+        candidatos = [
+            (otro, n / math.sqrt(len(propios) * len(compradores[otro])), n)
+            for otro, n in comunes.items() if n >= min_comunes
+        ]
+        resultado[curso] = heapq.nsmallest(k, candidatos, key=_orden)
+    return resultado
+
+
+def _similitudes_numpy(alumnos, cursos, objetivos, k, min_comunes, lote):
+    alumnos = np.asarray(alumnos, dtype=np.int64)
+    cursos = np.asarray(cursos, dtype=np.int64)
+    if not len(cursos):
+        return {curso: [] for curso in objetivos or ()}
+
+    ids_cursos, columnas = np.unique(cursos, return_inverse=True)
+    _, filas = np.unique(alumnos, return_inverse=True)
+    X = sparse.csr_matrix(
+        (np.ones(len(filas), dtype=np.int32), (filas, columnas)),
+        shape=(filas.max() + 1, len(ids_cursos)),
+    )
+    X.data[:] = 1  # una compra por (alumno, curso), aunque vengan repetidas
+    compradores = np.asarray(X.sum(axis=0)).ravel().astype(np.float64)
+    XT = X.T.tocsr()  # curso × alumno: tomar filas de XT es barato
+
+    if objetivos is None:
+        indices = np.arange(len(ids_cursos))
+        resultado = {}
+    else:
+        objetivos = np.fromiter(objetivos, dtype=np.int64)
+        presentes = np.isin(objetivos, ids_cursos)
+        resultado = {int(curso): [] for curso in objetivos[~presentes]}
+        indices = np.searchsorted(ids_cursos, objetivos[presentes])
+
+    for inicio in range(0, len(indices), lote):
+        bloque = indices[inicio:inicio + lote]
+        C = (XT[bloque] @ X).tocsr()  # compradores en común: bloque × cursos
+        fila_de = np.repeat(np.arange(len(bloque)), np.diff(C.indptr))
+        vecinos, comunes = C.indices, C.data
+        validos = (vecinos != bloque[fila_de]) & (comunes >= min_comunes)
+        puntajes = np.zeros(len(comunes))
+        puntajes[validos] = comunes[validos] / np.sqrt(
+            compradores[bloque[fila_de[validos]]] * compradores[vecinos[validos]]
+        )
+        for posicion, indice in enumerate(bloque):
+            tramo = slice(C.indptr[posicion], C.indptr[posicion + 1])
+            propios = np.flatnonzero(validos[tramo]) + tramo.start
+            if len(propios) > k:
+                # Se descarta todo lo que quede por debajo del k-ésimo puntaje (los empates se ordenan abajo)
+                umbral = np.partition(puntajes[propios], len(propios) - k)[len(propios) - k]
+                propios = propios[puntajes[propios] >= umbral]
+            candidatos = [
+                (int(ids_cursos[vecinos[i]]), float(puntajes[i]), int(comunes[i]))
+                for i in propios
+            ]
+            resultado[int(ids_cursos[indice])] = sorted(candidatos, key=_orden)[:k]
+    return resultado
+
+
+def similitudes(alumnos, cursos, objetivos=None, k=10, min_comunes=1, lote=1000):
+    """
+    ``alumnos`` y ``cursos`` son las compras como dos secuencias paralelas de ids.
+    Devuelve {curso: [(relacionado, puntaje, compradores_comunes), ...]} con a lo
+    sumo ``k`` vecinos ordenados, para cada curso de ``objetivos`` (o todos).
+    """
+    if np is None:
+        return _similitudes_python(alumnos, cursos, objetivos, k, min_comunes)
+    return _similitudes_numpy(alumnos, cursos, objetivos, k, min_comunes, lote)
+
+
+def _cargar_compras(compras):
+    pares = compras.order_by().values_list('alumno_id', 'curso_id').iterator(chunk_size=10000)
+    if np is None:
+        filas = list(pares)
+        return [a for a, _ in filas], [c for _, c in filas]
+    plano = np.fromiter(itertools.chain.from_iterable(pares), dtype=np.int64).reshape(-1, 2)
+    return plano[:, 0], plano[:, 1]
+
+
+def _objetivos_incrementales(compras, alumnos, cursos, desde):
+    nuevas = list(compras.filter(fecha_compra__gte=desde).values_list('alumno_id', 'curso_id'))
+    if not nuevas:
+        return set()
+    alumnos_nuevos = {alumno for alumno, _ in nuevas}
+    objetivos = {curso for _, curso in nuevas}
+    if np is None:
+        objetivos.update(c for a, c in zip(alumnos, cursos) if a in alumnos_nuevos)
+    else:
+        afectados = np.isin(alumnos, np.fromiter(alumnos_nuevos, dtype=np.int64))
+        objetivos.update(np.unique(cursos[afectados]).tolist())
+    return objetivos
+
+
+def calcular(completo=False, k=None, min_comunes=None):
+    """
+    Recalcula ``CursoRelacionado`` y devuelve estadísticas de la corrida.
+    Sin cálculos previos, el incremental equivale a uno completo.
+    """
+    from universidad.apis.lectura_rapida import por_lotes
+    from universidad.models import Compra, CursoRelacionado
+
+    config = configuracion()
+    k = k or config['K']
+    min_comunes = config['MIN_COMUNES'] if min_comunes is None else min_comunes
+    inicio = timezone.now()
+
+    compras = Compra.objects.all()
+    if not config['INCLUIR_TRIAL']:
+        compras = compras.filter(es_trial=False)
+
+    anterior = None if completo else CursoRelacionado.objects.aggregate(m=Max('fecha_calculo'))['m']
+    alumnos, cursos = _cargar_compras(compras)
+    objetivos = None
+    if anterior is not None:
+        objetivos = _objetivos_incrementales(compras, alumnos, cursos, anterior)
+        if not objetivos:
+            return {'modo': 'incremental', 'compras': len(cursos), 'cursos': 0, 'filas': 0}
+
+    vecinos = similitudes(alumnos, cursos, objetivos, k=k, min_comunes=min_comunes,
+                          lote=config['LOTE_CURSOS'])
+    filas = [
+        CursoRelacionado(
+            curso_id=curso, relacionado_id=relacionado, posicion=posicion,
+            puntaje=puntaje, compradores_comunes=comunes, fecha_calculo=inicio,
+        )
+        for curso, lista in vecinos.items()
+        for posicion, (relacionado, puntaje, comunes) in enumerate(lista)
+    ]
+    with transaction.atomic():
+        if objetivos is None:
+            CursoRelacionado.objects.all().delete()
+        else:
+            for lote in por_lotes(objetivos):
+                CursoRelacionado.objects.filter(curso_id__in=lote).delete()
+        CursoRelacionado.objects.bulk_create(filas, batch_size=1000)
+
+    return {
+        'modo': 'completo' if objetivos is None else 'incremental',
+        'compras': len(cursos), 'cursos': len(vecinos), 'filas': len(filas),
+    }
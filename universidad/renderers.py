@@ -0,0 +1,40 @@
+"""
+Renderer JSON con codificador rápido.
+
+Usa ``orjson`` cuando está instalado y cae al ``JSONRenderer`` de DRF
+(stdlib ``json``) si no lo está o si se pide salida indentada.
+"""
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    # Fechas y dataclasses pasan por el encoder de DRF para que la
+    # salida sea idéntica a la del renderer estándar
+    OPCIONES = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    ) if orjson else 0
+
+    def __init__(self):
+        self._encoder = self.encoder_class()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self._encoder.default, option=self.OPCIONES)
+        # Igual que DRF: escapar U+2028/U+2029 para que el JSON sea JavaScript válido
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
@@ -0,0 +1,548 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory
+
+from universidad.models import (
+    Alumno, Area, Compra, Curso, Docente, Leccion, ProgresoLeccion, RankingCurso, Seccion, TokenRevocado,
+)
+from universidad.apis.compra_viewset import CompraSerializer
+from universidad.apis.curso_viewset import CursoSerializer
+from universidad.cache.arbol_curso import lru as lru_arbol, version_curso
+from universidad.cache.permisos import lru as lru_permisos
+from universidad.limites import CubetasLocales, identificar, throttle
+from universidad.media.backends import CloudinaryBackend
+from universidad.progreso import BufferProgreso
+from universidad.progreso.buffer import buffer
+from universidad.progreso.servicios import cursos_de_leccion, inscripciones
+from universidad.token.revocacion import _Revocaciones
+
+
+def crear_usuario(sufijo, **extra):
+    return Alumno.objects.create_user(
+        email=f'{sufijo}@test.local', password='clave', nombre_completo=f'Usuario {sufijo}',
+        email_secundario=f'{sufijo}.2@test.local', **extra
+    )
+
+
+def crear_curso(nombre='Redes', docente=None, area=None, secciones=2, lecciones=2):
+    """Curso con ``secciones`` secciones de ``lecciones`` lecciones cada una."""
+    if docente is None:
+        docente = Docente.objects.create(user=crear_usuario(f'docente-{nombre.lower()}'))
+    area = area or Area.objects.get_or_create(nombre='Tecnología')[0]
+    curso = Curso.objects.create(nombre=nombre, area=area, docente=docente, precio=10)
+    for i in range(secciones):
+        seccion = Seccion.objects.create(nombre=f'Sección {i}', curso=curso)
+        for j in range(lecciones):
+            Leccion.objects.create(nombre=f'Lección {i}.{j}', seccion=seccion,
+                                   material=f'image/upload/v1/lecciones/l{i}{j}.jpg')
+    return curso
+
+
+class APITestCase(TestCase):
+    """
+    Cada test empieza con las caches y las cubetas de límites vacías: los ids
+    se repiten entre tests y las invalidaciones corren en on_commit, que un
+    TestCase no llega a ejecutar.
+    """
+
+    def setUp(self):
+        cache.clear()
+        lru_arbol.clear()
+        lru_permisos.clear()
+        throttle.backend().limpiar()
+        self.client = APIClient()
+
+
+# --- Progreso (universidad.progreso.buffer) ---
+
+# Las FK de SQLite se verifican al confirmar: sin la transacción de TestCase,
+# el bulk_create falla como en producción
+class BufferProgresoTests(TransactionTestCase):
+    def setUp(self):
+        self.alumno = crear_usuario('alumno')
+        self.curso = crear_curso()
+        self.lecciones = list(Leccion.objects.filter(seccion__curso=self.curso))
+        self.buffer = BufferProgreso(intervalo=3600)
+
+    def registrar(self, leccion, posicion):
+        self.buffer.registrar(self.alumno.pk, leccion.pk, self.curso.pk, posicion)
+
+    def test_leccion_borrada_antes_de_vaciar_se_descarta(self):
+        borrada, viva = self.lecciones[:2]
+        self.registrar(borrada, 10)
+        self.registrar(viva, 20)
+        borrada.delete()
+
+        self.assertEqual(self.buffer.vaciar(), 1)
+        self.assertEqual(self.buffer.posiciones(self.alumno.pk), {})
+        self.assertEqual(
+            list(ProgresoLeccion.objects.values_list('leccion_id', 'posicion_segundos')), [(viva.pk, 20)]
+        )
+
+        # Las escrituras siguientes no quedan bloqueadas
+        self.registrar(viva, 30)
+        self.assertEqual(self.buffer.vaciar(), 1)
+        self.assertEqual(ProgresoLeccion.objects.get(leccion=viva).posicion_segundos, 30)
+
+    def test_fila_invalida_al_escribir_se_descarta_sin_bloquear_el_resto(self):
+        # Borrado entre la verificación y el bulk_create: se reintenta fila por fila
+        borrada, viva = self.lecciones[:2]
+        self.registrar(borrada, 10)
+        self.registrar(viva, 20)
+        existentes = self.buffer._existentes
+
+        def existentes_y_borrar(pendientes):
+            resultado = existentes(pendientes)
+            borrada.delete()
+            return resultado
+
+        self.buffer._existentes = existentes_y_borrar
+        self.assertEqual(self.buffer.vaciar(), 1)
+        self.assertEqual(self.buffer.posiciones(self.alumno.pk), {})
+        self.assertEqual(list(ProgresoLeccion.objects.values_list('leccion_id', flat=True)), [viva.pk])
+
+    def test_posicion_fuera_de_rango_se_descarta_sin_perder_el_resto(self):
+        fuera, viva = self.lecciones[:2]
+        self.registrar(fuera, 10 ** 20)
+        self.registrar(viva, 20)
+
+        self.assertEqual(self.buffer.vaciar(), 1)
+        self.assertEqual(self.buffer.posiciones(self.alumno.pk), {})
+        self.assertEqual(
+            list(ProgresoLeccion.objects.values_list('leccion_id', 'posicion_segundos')), [(viva.pk, 20)]
+        )
+
+
+# --- fecha_actualizacion (universidad.catalogo.actualizacion) ---
+
+class FechaActualizacionTests(TestCase):
+    def setUp(self):
+        self.origen = crear_curso('Redes')
+        self.destino = crear_curso('Bases de datos', docente=self.origen.docente)
+        self.antes = timezone.now() - timedelta(days=1)
+        Curso.objects.update(fecha_actualizacion=self.antes)
+        Seccion.objects.update(fecha_actualizacion=self.antes)
+
+    def fecha(self, objeto):
+        return type(objeto).objects.get(pk=objeto.pk).fecha_actualizacion
+
+    def test_mover_leccion_actualiza_la_seccion_y_el_curso_de_origen(self):
+        leccion = Leccion.objects.filter(seccion__curso=self.origen).first()
+        seccion_origen = leccion.seccion
+        leccion.seccion = self.destino.secciones.first()
+        leccion.save()
+
+        self.assertGreater(self.fecha(seccion_origen), self.antes)
+        self.assertGreater(self.fecha(self.origen), self.antes)
+        self.assertGreater(self.fecha(self.destino), self.antes)
+
+    def test_mover_seccion_actualiza_el_curso_de_origen(self):
+        seccion = self.origen.secciones.first()
+        seccion.curso = self.destino
+        seccion.save()
+
+        self.assertGreater(self.fecha(self.origen), self.antes)
+        self.assertGreater(self.fecha(self.destino), self.antes)
+
+    def test_guardar_sin_mover_no_toca_otros_cursos(self):
+        leccion = Leccion.objects.filter(seccion__curso=self.origen).first()
+        leccion.nombre = 'Otra'
+        leccion.save()
+
+        self.assertGreater(self.fecha(self.origen), self.antes)
+        self.assertEqual(self.fecha(self.destino), self.antes)
+
+
+# --- Límites (universidad.limites) ---
+
+class LimitesTests(TestCase):
+    def test_anonimo_se_identifica_por_remote_addr(self):
+        # Sin proxies de confianza (NUM_PROXIES = 0) X-Forwarded-For no cuenta
+        request = APIRequestFactory().post('/', REMOTE_ADDR='10.0.0.1', HTTP_X_FORWARDED_FOR='1.2.3.4')
+        self.assertEqual(identificar(request), ('anonimo', '10.0.0.1'))
+
+    def test_cubetas_locales_descartan_la_usada_hace_mas_tiempo(self):
+        cubetas = CubetasLocales(max_claves=2)
+        for clave in ['a', 'b', 'a', 'c']:
+            self.assertEqual(cubetas.consumir(clave, 2, 60), 0)
+
+        self.assertEqual(list(cubetas._tat), ['a', 'c'])
+        self.assertGreater(cubetas.consumir('a', 2, 60), 0)
+        # 'b' se descartó: vuelve con la cubeta llena
+        self.assertEqual(cubetas.consumir('b', 2, 60), 0)
+        self.assertEqual(cubetas.consumir('b', 2, 60), 0)
+
+
+# --- Árbol de cursos (universidad.cache.arbol_curso) ---
+
+class ArbolCursoTests(TestCase):
+    def setUp(self):
+        self.origen = crear_curso('Redes')
+        self.destino = crear_curso('Bases de datos', docente=self.origen.docente)
+        self.versiones = {curso.pk: version_curso(curso.pk) for curso in (self.origen, self.destino)}
+
+    def assertInvalidado(self, curso):
+        self.assertNotEqual(version_curso(curso.pk), self.versiones[curso.pk])
+
+    def test_mover_leccion_invalida_los_dos_cursos(self):
+        leccion = Leccion.objects.filter(seccion__curso=self.origen).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            leccion.seccion = self.destino.secciones.first()
+            leccion.save()
+
+        self.assertInvalidado(self.origen)
+        self.assertInvalidado(self.destino)
+
+    def test_mover_leccion_consulta_el_padre_anterior_una_vez(self):
+        leccion = Leccion.objects.filter(seccion__curso=self.origen).first()
+        leccion.seccion = self.destino.secciones.first()
+        with CaptureQueriesContext(connection) as consultas:
+            leccion.save()
+
+        previas = [c['sql'] for c in consultas.captured_queries
+                   if c['sql'].startswith('SELECT "universidad_leccion"."seccion_id"')]
+        self.assertEqual(len(previas), 1, previas)
+
+    def test_mover_seccion_invalida_los_dos_cursos(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            seccion = self.origen.secciones.first()
+            seccion.curso = self.destino
+            seccion.save()
+
+        self.assertInvalidado(self.origen)
+        self.assertInvalidado(self.destino)
+
+
+# --- Filtros del catálogo (universidad.catalogo.facetas) ---
+
+class FiltrosCatalogoTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        crear_curso()
+
+    def test_precio_no_finito_es_400(self):
+        for valor in ('NaN', 'Infinity', '-inf', 'sNaN'):
+            with self.subTest(valor=valor):
+                response = self.client.get('/universidad/cursos/', {'precio_min': valor})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('precio_min', response.json())
+
+    def test_precio_finito_filtra(self):
+        response = self.client.get('/universidad/cursos/', {'precio_min': '5', 'precio_max': '1e2'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+
+
+# --- Ruta rápida de lectura (universidad.apis.lectura_rapida) ---
+
+class LecturaRapidaTests(APITestCase):
+    """``serializar_lista`` devuelve lo mismo que el ModelSerializer de cada endpoint."""
+
+    def setUp(self):
+        super().setUp()
+        self.area = Area.objects.create(nombre='Ciencias')
+        self.docente = Docente.objects.create(user=crear_usuario('docente'))
+        self.alumno = crear_usuario('alumno')
+        self.cursos = [
+            Curso.objects.create(
+                nombre=f'Curso {i}', descripcion='Descripción' if i % 2 else None, area=self.area,
+                docente=self.docente if i % 3 else None, precio=i * 25, certificable=bool(i % 2),
+                modo_prueba=not i % 2, photo_profile=f'image/upload/v1/cursos/demo{i}.jpg' if i % 4 else None,
+            )
+            for i in range(6)
+        ]
+        Compra.objects.bulk_create([
+            Compra(alumno=self.alumno, curso=curso, es_trial=bool(curso.pk % 2)) for curso in self.cursos[:4]
+        ])
+
+    def assertParidad(self, url, serializer_class, queryset, usuario=None, clave=None):
+        self.client.force_authenticate(usuario)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        datos = response.json()
+        if clave:
+            datos = datos[clave]
+        esperado = serializer_class(queryset, many=True, context={'request': response.wsgi_request}).data
+        self.assertTrue(datos)
+        # Mismos datos y mismo orden de claves
+        esperado = json.loads(JSONRenderer().render(esperado))
+        self.assertEqual([list(fila.items()) for fila in datos], [list(fila.items()) for fila in esperado])
+
+    def test_list(self):
+        self.assertParidad('/universidad/cursos/', CursoSerializer, Curso.objects.order_by('id'))
+
+    def test_mis_cursos(self):
+        self.assertParidad('/universidad/cursos/mis_cursos/', CursoSerializer,
+                           Curso.objects.filter(docente=self.docente), usuario=self.docente.user)
+
+    def test_por_area(self):
+        self.assertParidad(f'/universidad/cursos/por_area/{self.area.pk}/', CursoSerializer,
+                           Curso.objects.filter(area=self.area))
+
+    def test_por_area_ordenado_incluye_cursos_sin_ranking(self):
+        # Solo un curso tiene fila en el ranking; el resto sale al final, por id
+        RankingCurso.objects.exclude(curso=self.cursos[3]).delete()
+        RankingCurso.objects.update_or_create(curso=self.cursos[3], defaults={'area': self.area, 'popularidad': 5})
+        orden = [self.cursos[3].pk, *(curso.pk for curso in self.cursos if curso != self.cursos[3])]
+        cursos = Curso.objects.in_bulk(orden)
+        self.assertParidad(f'/universidad/cursos/por_area/{self.area.pk}/?orden=popular', CursoSerializer,
+                           [cursos[pk] for pk in orden])
+
+    def test_cursos_docente(self):
+        self.assertParidad(f'/universidad/cursos/docente/{self.docente.numero_registro}/', CursoSerializer,
+                           Curso.objects.filter(docente=self.docente), clave='cursos')
+
+    def test_compras(self):
+        self.assertParidad('/universidad/compras/', CompraSerializer,
+                           Compra.objects.filter(alumno=self.alumno).order_by('id'), usuario=self.alumno)
+
+
+# --- Compras (universidad.apis.compra_viewset) ---
+
+class ComprasTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.alumno = crear_usuario('alumno')
+        self.curso = crear_curso()
+
+    def test_en_ranking_no_se_expone_ni_se_escribe(self):
+        admin = Alumno.objects.create_superuser(email='admin@test.local', password='clave', nombre_completo='Admin',
+                                                email_secundario='admin.2@test.local')
+        self.client.force_authenticate(admin)
+        response = self.client.post('/universidad/compras/', {
+            'alumno': self.alumno.pk, 'curso': self.curso.pk, 'es_trial': False, 'en_ranking': True,
+        }, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertNotIn('en_ranking', response.json())
+        self.assertFalse(Compra.objects.get(pk=response.json()['id']).en_ranking)
+
+        self.client.force_authenticate(self.alumno)
+        self.assertNotIn('en_ranking', self.client.get('/universidad/compras/').json()[0])
+
+
+# --- ?include= (universidad.apis.inclusion) ---
+
+# include → consultas de list (con 1 o con N cursos) y de retrieve. Sin
+# include, retrieve es el de DRF: el curso, su área, su docente y el usuario
+CONSULTAS_INCLUDE = {
+    '': (1, 4),
+    'area': (1, 1),
+    'docente': (1, 1),
+    'area,docente': (1, 1),
+    'secciones': (2, 2),
+    'secciones.lecciones': (3, 3),
+    'area,docente,secciones': (2, 2),
+    'area,docente,secciones.lecciones': (3, 3),
+}
+
+
+class IncludeTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        # Un curso solo en su área y cuatro más en otra: list con 1 y con 5 cursos
+        self.area, otra = Area.objects.create(nombre='Include'), Area.objects.create(nombre='Include N')
+        self.curso = crear_curso('Curso 0', area=self.area, secciones=3, lecciones=3)
+        self.docente = self.curso.docente
+        for i in range(1, 5):
+            crear_curso(f'Curso {i}', docente=self.docente, area=otra, secciones=2, lecciones=2)
+        self.areas = f'{self.area.pk},{otra.pk}'
+        self.client.force_authenticate(self.docente.user)
+        # El rol del usuario para los límites queda en cache: no cuenta en las consultas
+        self.pedir('/universidad/cursos/', area=self.area.pk)
+
+    def pedir(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_consultas_no_dependen_de_cuantos_cursos_hay(self):
+        for include, (lista, detalle) in CONSULTAS_INCLUDE.items():
+            with self.subTest(include=include):
+                with self.assertNumQueries(lista):
+                    uno = self.pedir('/universidad/cursos/', area=self.area.pk, include=include)
+                with self.assertNumQueries(lista):
+                    todos = self.pedir('/universidad/cursos/', area=self.areas, include=include)
+                with self.assertNumQueries(detalle):
+                    self.pedir(f'/universidad/cursos/{self.curso.pk}/', include=include)
+                self.assertEqual((len(uno), len(todos)), (1, 5))
+
+    def test_secciones_y_lecciones_iguales_a_sus_endpoints(self):
+        datos = self.pedir(f'/universidad/cursos/{self.curso.pk}/', include='secciones.lecciones')
+        secciones = self.pedir(f'/universidad/secciones/por_curso/{self.curso.pk}/')
+        esperado = [
+            dict(seccion, lecciones=[
+                self.pedir(f'/universidad/lecciones/{leccion["id"]}/') for leccion in incluida['lecciones']
+            ])
+            for seccion, incluida in zip(secciones, datos['secciones'])
+        ]
+        self.assertEqual(len(esperado), 3)
+        self.assertEqual(datos['secciones'], esperado)
+        self.assertEqual(
+            [leccion['id'] for seccion in datos['secciones'] for leccion in seccion['lecciones']],
+            list(Leccion.objects.filter(seccion__curso=self.curso).values_list('id', flat=True)
+                 .order_by('seccion__orden', 'orden')),
+        )
+
+    def test_material_oculto_salvo_para_su_docente_y_los_administradores(self):
+        # create_docente marca a todos los docentes como staff: no alcanza para ver el material
+        otro = Docente.objects.create(user=crear_usuario('otro-docente', is_staff=True))
+        admin = Alumno.objects.create_superuser(email='admin@test.local', password='clave', nombre_completo='Admin',
+                                                email_secundario='admin.2@test.local')
+        for usuario, completo in ((self.docente.user, True), (admin, True), (otro.user, False), (None, False)):
+            with self.subTest(usuario=usuario):
+                self.client.force_authenticate(usuario)
+                datos = self.pedir('/universidad/cursos/', area=self.area.pk, include='secciones.lecciones')[0]
+                materiales = [[bool(leccion['material']) for leccion in s['lecciones']] for s in datos['secciones']]
+                self.assertEqual(materiales, [[True] * 3] + [[completo] * 3] * 2)
+
+
+# --- Clonación (universidad.catalogo.clonacion) ---
+
+class ClonarTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.curso = crear_curso(nombre='R' * 150, secciones=1, lecciones=1)
+        usuario = self.curso.docente.user
+        usuario.groups.add(Group.objects.get(name='Docente'))
+        self.client.force_authenticate(usuario)
+        self.url = f'/universidad/cursos/{self.curso.pk}/clonar/'
+
+    def test_nombre_invalido_es_400(self):
+        for nombre in ('x' * 151, ['Redes'], {'es': 'Redes'}):
+            with self.subTest(nombre=nombre):
+                response = self.client.post(self.url, {'nombre': nombre}, format='json')
+                self.assertEqual(response.status_code, 400)
+        self.assertEqual(Curso.objects.count(), 1)
+
+    def test_nombre_opcional(self):
+        response = self.client.post(self.url, {'nombre': 'Redes II'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['nombre'], 'Redes II')
+
+        # Sin nombre, el sufijo de copia no pasa del max_length
+        response = self.client.post(self.url, {}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['nombre'], 'R' * 142 + ' (copia)')
+
+
+# --- Lecciones (universidad.apis.leccion_viewset) ---
+
+class LeccionesTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.curso = crear_curso(secciones=1, lecciones=2)
+        self.seccion = self.curso.secciones.get()
+        usuario = self.curso.docente.user
+        usuario.groups.add(Group.objects.get(name='Docente'))
+        self.client.force_authenticate(usuario)
+
+    def test_lote_con_tipos_invalidos_responde_por_item(self):
+        response = self.client.post('/universidad/lecciones/lote/', {'seccion': self.seccion.pk, 'lecciones': [
+            {'nombre': 5},
+            {'nombre': 'Con archivo', 'archivo': ['f0']},
+            {'nombre': 'Con material', 'material': {'public_id': 'x'}},
+            {'nombre': 'Válida'},
+        ]}, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        resultados = response.json()['resultados']
+        self.assertEqual([r['estado'] for r in resultados], ['error', 'error', 'error', 'creada'])
+        self.assertEqual(self.seccion.lecciones.last().nombre, 'Válida')
+
+    def test_orden_no_se_escribe_por_el_serializer(self):
+        response = self.client.post('/universidad/lecciones/',
+                                    {'nombre': 'Nueva', 'seccion': self.seccion.pk, 'orden': 0})
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(response.json()['orden'], 2)
+
+        leccion = self.seccion.lecciones.first()
+        response = self.client.patch(f'/universidad/lecciones/{leccion.pk}/', {'orden': 7})
+        self.assertEqual(response.status_code, 200)
+        leccion.refresh_from_db()
+        self.assertEqual(leccion.orden, 0)
+
+    def test_reordenar_rechaza_ids_booleanos(self):
+        ids = list(self.seccion.lecciones.values_list('id', flat=True))
+        response = self.client.post('/universidad/lecciones/reordenar/',
+                                    {'seccion': self.seccion.pk, 'orden': [True, *ids[1:]]}, format='json')
+        self.assertEqual(response.json(), {'error': "'orden' debe ser una lista de ids."})
+
+        response = self.client.post('/universidad/lecciones/reordenar/',
+                                    {'seccion': self.seccion.pk, 'orden': ids[::-1]}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([leccion['id'] for leccion in response.json()], ids[::-1])
+
+
+# --- Progreso (universidad.apis.progreso_viewset) ---
+
+class LatidoTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.alumno = crear_usuario('alumno')
+        self.curso = crear_curso()
+        Compra.objects.create(alumno=self.alumno, curso=self.curso)
+        self.leccion = Leccion.objects.filter(seccion__curso=self.curso).first()
+        self.client.force_authenticate(self.alumno)
+        # El buffer y sus LRU son del proceso: no dejar latidos para el hilo que escribe
+        cursos_de_leccion.clear()
+        inscripciones.clear()
+        self.addCleanup(buffer.vaciar)
+
+    def test_posicion_o_leccion_fuera_de_rango_es_400(self):
+        for datos in ({'leccion': self.leccion.pk, 'posicion': 10 ** 20},
+                      {'leccion': self.leccion.pk, 'posicion': -1},
+                      {'leccion': 10 ** 20, 'posicion': 5}):
+            with self.subTest(datos=datos):
+                response = self.client.post('/universidad/progreso/latido/', datos, format='json')
+                self.assertEqual(response.status_code, 400)
+
+        response = self.client.post('/universidad/progreso/latido/',
+                                    {'leccion': self.leccion.pk, 'posicion': 2 ** 31 - 1}, format='json')
+        self.assertEqual(response.status_code, 202)
+
+
+# --- Revocación de tokens (universidad.token.revocacion) ---
+
+class RevocacionTests(TestCase):
+    def setUp(self):
+        self.revocaciones = _Revocaciones()
+        self.revocaciones.sincronizar(forzar=True)
+        self.payload = {'user_id': '1', 'jti': 'jti-falso-positivo', 'iat': int(timezone.now().timestamp())}
+
+    def test_falso_positivo_revocado_despues_por_otro_proceso(self):
+        # El filtro da un falso positivo: la BD lo descarta y queda en la LRU
+        self.revocaciones.filtro.add(self.payload['jti'])
+        self.assertFalse(self.revocaciones.revocado(self.payload))
+
+        # Otro worker lo revoca: solo existe la fila, sin agregar() en este proceso
+        TokenRevocado.objects.create(jti=self.payload['jti'], expira=timezone.now() + timedelta(hours=1))
+        self.revocaciones.proxima = 0.0
+        self.assertTrue(self.revocaciones.revocado(self.payload))
+
+
+# --- Medios (universidad.media) ---
+
+class MediaTests(TestCase):
+    def test_cloudinary_sube_el_archivo_desde_el_principio(self):
+        # La validación de la vista ya leyó el archivo hasta el final
+        archivo = SimpleUploadedFile('apunte.pdf', b'%PDF-1.4 contenido')
+        archivo.read()
+        posiciones = []
+
+        def upload_resource(valor, **opciones):
+            posiciones.append(valor.tell())
+
+        with mock.patch('cloudinary.uploader.upload_resource', upload_resource):
+            CloudinaryBackend().subir(archivo, resource_type='raw')
+
+        self.assertEqual(posiciones, [0])
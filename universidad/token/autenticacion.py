@@ -0,0 +1,14 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from universidad.token.revocacion import revocado
+
+
+class JWTRevocableAuthentication(JWTAuthentication):
+    """``JWTAuthentication`` que además rechaza los tokens revocados (ver ``universidad.token.revocacion``)."""
+
+    def get_validated_token(self, raw_token):
+        token = super().get_validated_token(raw_token)
+        if revocado(token.payload):
+            raise InvalidToken({"detail": "El token fue revocado.", "code": "token_revocado"})
+        return token
@@ -0,0 +1,155 @@
+"""
+Revocación de JWT sin consultar la BD en cada petición.
+
+Las revocaciones se guardan en ``TokenRevocado``:
+
+- por ``jti``: un token puntual (refresh ya rotado, cierre de sesión);
+- por usuario: todos sus tokens emitidos antes de ``desde`` (cambio de
+  contraseña, usuario desactivado o eliminado).
+
+Cada proceso las tiene en memoria: los jti en un ``FiltroBloom`` y los
+usuarios en un dict usuario → desde. Cada ``INTERVALO`` segundos se traen
+solo las filas nuevas (por ``fecha``, con un margen para transacciones que
+confirman tarde) y cada ``RECONSTRUIR`` segundos se rearma todo con las
+vigentes. Lo que revoca este mismo proceso se aplica al confirmar la
+transacción, sin esperar la sincronización.
+
+Un token no revocado — el caso común — se resuelve en memoria. Si el filtro
+dice que un jti está revocado, se confirma en la BD (puede ser un falso
+positivo, ``ERROR`` por defecto 0.1%) y el resultado queda en una LRU. Un
+falso positivo que después revoca otro proceso se corrige en la LRU al
+traerlo en la sincronización.
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from universidad.cache.bloom import FiltroBloom
+from universidad.cache.lru import LRU
+
+DEFAULTS = {
+    'INTERVALO': 10,          # segundos entre sincronizaciones con la BD
+    'RECONSTRUIR': 60 * 60,   # segundos entre recargas completas
+    'CAPACIDAD': 10000,       # jti revocados vigentes previstos (el filtro crece si se supera)
+    'ERROR': 0.001,           # falsos positivos del filtro
+    'MARGEN': 60,             # segundos que se vuelven a leer en cada sincronización
+}
+
+
+def configuracion():
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, 'REVOCACION_TOKENS', {}))
+    return config
+
+
+class _Revocaciones:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.config = None
+        self.filtro = None
+        self.usuarios = {}
+        self.confirmados = LRU(1024)  # jti → revocado (True) o falso positivo (False)
+        self.marca = None
+        self.proxima = 0.0
+        self.reconstruir_en = 0.0
+
+    def _cargar(self, filas):
+        for jti, usuario_id, desde in filas:
+            if jti:
+                self.filtro.add(jti)
+                # Pudo quedar confirmado como falso positivo antes de que otro proceso lo revocara
+                self.confirmados.set(jti, True)
+            elif usuario_id is not None and desde is not None:
+                segundo = int(desde.timestamp())
+                clave = str(usuario_id)  # simplejwt pone el user_id del payload como texto
+                self.usuarios[clave] = max(self.usuarios.get(clave, 0), segundo)
+
+    def sincronizar(self, forzar=False):
+        ahora = time.monotonic()
+        if not forzar and ahora < self.proxima:
+            return
+        from universidad.models import TokenRevocado
+
+        with self._lock:
+            if not forzar and ahora < self.proxima:
+                return
+            config = self.config = self.config or configuracion()
+            inicio = timezone.now()
+            columnas = ('jti', 'usuario_id', 'desde')
+            completa = forzar or self.filtro is None or ahora >= self.reconstruir_en or self.filtro.lleno
+            if completa:
+                vigentes = list(TokenRevocado.objects.filter(expira__gt=inicio).values_list(*columnas))
+                jtis = sum(1 for jti, _, _ in vigentes if jti)
+                self.filtro = FiltroBloom(max(config['CAPACIDAD'], jtis * 2), config['ERROR'])
+                self.usuarios = {}
+                self.confirmados.clear()
+                self._cargar(vigentes)
+                self.reconstruir_en = ahora + config['RECONSTRUIR']
+            else:
+                desde = self.marca - timedelta(seconds=config['MARGEN'])
+                self._cargar(TokenRevocado.objects.filter(fecha__gte=desde).values_list(*columnas))
+            self.marca = inicio
+            self.proxima = ahora + config['INTERVALO']
+
+    def agregar(self, jti=None, usuario_id=None, desde=None):
+        if self.filtro is None:
+            return  # se cargará completo en la primera sincronización
+        with self._lock:
+            self._cargar([(jti, usuario_id, desde)])
+
+    def revocado(self, payload):
+        self.sincronizar()
+        desde = self.usuarios.get(str(payload.get(api_settings.USER_ID_CLAIM)))
+        # iat tiene resolución de segundos: vale lo emitido en el mismo segundo de la revocación
+        if desde is not None and payload.get('iat', 0) < desde:
+            return True
+        jti = payload.get(api_settings.JTI_CLAIM)
+        if not jti or jti not in self.filtro:
+            return False
+        confirmado = self.confirmados.get(jti)
+        if confirmado is None:
+            from universidad.models import TokenRevocado
+            confirmado = TokenRevocado.objects.filter(jti=jti).exists()
+            self.confirmados.set(jti, confirmado)
+        return confirmado
+
+
+revocaciones = _Revocaciones()
+
+
+def revocado(payload):
+    """True si el token (su payload ya validado) está revocado."""
+    return revocaciones.revocado(payload)
+
+
+def revocar_token(token):
+    """
+    Revoca un token de simplejwt por su jti. Devuelve False si ya estaba
+    revocado (p. ej. otro refresh concurrente con el mismo token).
+    """
+    from universidad.models import TokenRevocado
+
+    jti = token[api_settings.JTI_CLAIM]
+    usuario_id = token.get(api_settings.USER_ID_CLAIM)
+    _, creado = TokenRevocado.objects.get_or_create(jti=jti, defaults={
+        'usuario_id': int(usuario_id) if usuario_id is not None else None,
+        'expira': datetime.fromtimestamp(token['exp'], tz=dt_timezone.utc),
+    })
+    if creado:
+        transaction.on_commit(lambda: revocaciones.agregar(jti=jti))
+    return creado
+
+
+def revocar_usuario(usuario_id):
+    """Revoca todos los tokens del usuario emitidos hasta ahora."""
+    from universidad.models import TokenRevocado
+
+    ahora = timezone.now()
+    vida = max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME)
+    TokenRevocado.objects.create(usuario_id=usuario_id, desde=ahora, expira=ahora + vida)
+    transaction.on_commit(lambda: revocaciones.agregar(usuario_id=usuario_id, desde=ahora))
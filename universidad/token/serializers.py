@@ -1,8 +1,14 @@
 # universidad/serializers.py
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import check_password
+from django.db import transaction
+
+from universidad.cache.permisos import rol_usuario
+from universidad.token.revocacion import revocado, revocar_token
 
 User = get_user_model()
 
@@ -24,9 +30,27 @@ class EmailTokenObtainPairSerializer(serializers.Serializer):
         if not check_password(password, user.password):
             raise serializers.ValidationError("Contraseña incorrecta.")
 
-        # Generar tokens
+        # Generar tokens; el rol viaja en el token para el límite de peticiones
         refresh = RefreshToken.for_user(user)
+        refresh['rol'] = rol_usuario(user)
         return {
             'refresh': str(refresh),
             'access': str(refresh.access_token),
         }
+
+
+class RotarRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh con rotación: cada refresh se usa una sola vez. El token recibido
+    queda revocado y la respuesta trae un refresh nuevo junto al access.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        if revocado(refresh.payload):
+            raise InvalidToken("El token fue revocado.")
+        with transaction.atomic():
+            # La restricción única del jti decide entre dos refresh concurrentes con el mismo token
+            if not revocar_token(refresh):
+                raise InvalidToken("El token fue revocado.")
+            return super().validate(attrs)
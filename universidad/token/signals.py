@@ -0,0 +1,25 @@
+from django.db.models.signals import post_delete, pre_save
+from django.dispatch import receiver
+
+from universidad.models import Alumno
+from .revocacion import revocar_usuario
+
+
+@receiver(pre_save, sender=Alumno)
+def revocar_por_cambio(sender, instance, raw=False, update_fields=None, **kwargs):
+    # Cambio de contraseña o usuario desactivado: sus tokens emitidos hasta ahora dejan de valer
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not {'password', 'is_active'} & set(update_fields):
+        return
+    anterior = Alumno.objects.filter(pk=instance.pk).values_list('password', 'is_active').first()
+    if anterior is None:
+        return
+    password, activo = anterior
+    if password != instance.password or (activo and not instance.is_active):
+        revocar_usuario(instance.pk)
+
+
+@receiver(post_delete, sender=Alumno)
+def revocar_por_borrado(sender, instance, **kwargs):
+    revocar_usuario(instance.pk)
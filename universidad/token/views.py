@@ -2,10 +2,31 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
+from universidad.token.revocacion import revocar_token
 from universidad.token.serializers import EmailTokenObtainPairSerializer
 
 class EmailTokenObtainPairView(APIView):
+    throttle_scope = 'login'
+
     def post(self, request):
         serializer = EmailTokenObtainPairSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         return Response(serializer.validated_data, status=status.HTTP_200_OK)
+
+
+class RevocarTokenView(APIView):
+    """
+    POST /api/token/revocar/  {"refresh": "<token>"}
+    Cierra la sesión: revoca el refresh y, si viene autenticada, también el access usado.
+    """
+    def post(self, request):
+        try:
+            refresh = RefreshToken(request.data.get('refresh', ''))
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
+        revocar_token(refresh)
+        if request.auth is not None:
+            revocar_token(request.auth)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -5,10 +5,13 @@ from django.urls import path, include
 
 from universidad.apis.alumno_viewset import AlumnoViewSet
 from universidad.apis.area_viewset import AreaViewSet
+from universidad.apis.batch_viewset import BatchViewSet
 from universidad.apis.compra_viewset import CompraViewSet
 from universidad.apis.curso_viewset import CursoViewSet
 from universidad.apis.docente_viewset import DocenteViewSet
 from universidad.apis.leccion_viewset import LeccionViewSet
+from universidad.apis.metricas_viewset import MetricasViewSet
+from universidad.apis.progreso_viewset import ProgresoViewSet
 from universidad.apis.seccion_viewset import SeccionViewSet
 from universidad.apis.user_viewset import UserViewSet, AuthViewSet
 
@@ -22,7 +25,16 @@ router.register(r'lecciones', LeccionViewSet)
 router.register(r'compras', CompraViewSet)
 router.register(r'users', UserViewSet, basename='user')
 router.register(r'auth', AuthViewSet, basename='auth')
+router.register(r'progreso', ProgresoViewSet, basename='progreso')
+router.register(r'metricas', MetricasViewSet, basename='metricas')
+router.register(r'batch', BatchViewSet, basename='batch')
 
 urlpatterns = [
     path('', include(router.urls)),
 ]+static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+
+# Con ASGI: versiones asíncronas del catálogo y de las subidas, antes que las del router
+if settings.VISTAS_ASYNC:
+    from universidad.apis.asincrono import rutas
+
+    urlpatterns = rutas({ruta.name: ruta.callback for ruta in router.urls}) + urlpatterns